@@ -0,0 +1,158 @@
+"""Benchmark dos adaptadores das calculadoras sobre o kernel de amortização.
+
+Para cada ponto de entrada público (``FinancialCalculators.loan_calculator``
+em ``src/calculators.py``, ``calcular_financiamento_*`` e
+``FinancingCalculator.calculate_*``), compara o laço original com o
+adaptador atual, verificando antes que as saídas coincidem.
+
+Uso:
+    python -m benchmarks.bench_adapters [--months 360] [--number 500]
+"""
+
+import argparse
+import importlib.util
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from benchmarks.bench_amortization import _best, legacy_price, legacy_sac
+from src.calculators import FinancialCalculators
+from src.calculators.amortization import price_payment
+from src.calculators.financial_calculators import FinancingCalculator
+
+
+def _load_legacy_module():
+    """Carrega ``src/calculators.py``, encoberto pelo pacote de mesmo nome."""
+    path = Path(__file__).resolve().parents[1] / 'src' / 'calculators.py'
+    spec = importlib.util.spec_from_file_location('legacy_calculators', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def legacy_financiamento(valor: float, prazo: int, taxa: float, sistema: str) -> Dict:
+    """Laço original de ``calcular_financiamento_*`` (referência)."""
+    taxa_mensal = taxa / 100 / 12
+    amortizacao = valor / prazo
+    if sistema == 'PRICE':
+        parcela_fixa = price_payment(valor, taxa_mensal, prazo)
+    parcelas, juros_parcela, amortizacoes, saldo_devedor = [], [], [], []
+    saldo_atual = valor
+    for _ in range(prazo):
+        juros = saldo_atual * taxa_mensal
+        if sistema == 'PRICE':
+            amortizacao = parcela_fixa - juros
+        parcelas.append(amortizacao + juros)
+        juros_parcela.append(juros)
+        amortizacoes.append(amortizacao)
+        saldo_atual -= amortizacao
+        saldo_devedor.append(max(0, saldo_atual))
+    return {
+        'payment': parcelas,
+        'principal': amortizacoes,
+        'interest': juros_parcela,
+        'balance': saldo_devedor,
+        'total': sum(parcelas),
+    }
+
+
+def legacy_financing(principal: float, annual_rate: float, months: int,
+                     system: str) -> List[Dict]:
+    """Laço original de ``FinancingCalculator.calculate_*`` (referência)."""
+    monthly_rate = annual_rate / 100 / 12
+    amortization = principal / months
+    if system == 'PRICE':
+        installment = price_payment(principal, monthly_rate, months)
+    installments = []
+    balance = principal
+    for month in range(1, months + 1):
+        interest = balance * monthly_rate
+        if system == 'PRICE':
+            amortization = installment - interest
+        else:
+            installment = amortization + interest
+        balance -= amortization
+        installments.append({
+            'month': month,
+            'installment': installment,
+            'amortization': amortization,
+            'interest': interest,
+            'balance': max(0, balance)
+        })
+    return installments
+
+
+def _max_diff(got, expected) -> float:
+    """Maior diferença absoluta; falha se as formas divergirem."""
+    got, expected = np.asarray(got, dtype=float), np.asarray(expected, dtype=float)
+    if got.shape != expected.shape:
+        raise AssertionError(f"Formas diferentes: {got.shape} != {expected.shape}")
+    return float(np.abs(got - expected).max())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--months', type=int, default=360)
+    parser.add_argument('--number', type=int, default=500)
+    args = parser.parse_args()
+
+    legacy_module = _load_legacy_module()
+    loan, rate, months = 250000.0, 9.5, args.months
+    keys = ('payment', 'principal', 'interest', 'balance')
+    financing_keys = ('installment', 'amortization', 'interest', 'balance')
+
+    # loan_calculator é memoizado; mede-se o adaptador chamado por ele
+    calculators = legacy_module.FinancialCalculators
+    cases = []
+    for system, loop, method in (('PRICE', legacy_price, calculators._calculate_price),
+                                 ('SAC', legacy_sac, calculators._calculate_sac)):
+        cases.append((
+            f"loan_calculator {system}",
+            lambda loop=loop: loop(loan, rate / 100 / 12, months),
+            lambda method=method: method(loan, rate / 100 / 12, months).installments.to_list(),
+            lambda rows: [[row[key] for row in rows] for key in keys],
+            lambda rows: [[row[key] for row in rows] for key in keys],
+        ))
+    methods = {
+        'PRICE': FinancialCalculators.calcular_financiamento_price,
+        'SAC': FinancialCalculators.calcular_financiamento_sac,
+    }
+    for system, method in methods.items():
+        cases.append((
+            f"calcular_financiamento_{system.lower()}",
+            lambda system=system: legacy_financiamento(loan, months, rate, system),
+            lambda method=method: method(loan + 1, 1, months, rate),
+            lambda result: [result[key] for key in keys] + [[result['total']]],
+            lambda result: [result.parcelas, result.amortizacoes, result.juros_parcela,
+                            result.saldo_devedor, [result.total_pago]],
+        ))
+    methods = {
+        'PRICE': FinancingCalculator.calculate_price,
+        'SAC': FinancingCalculator.calculate_sac,
+    }
+    for system, method in methods.items():
+        cases.append((
+            f"calculate_{system.lower()}",
+            lambda system=system: legacy_financing(loan, rate, months, system),
+            lambda method=method: method(loan, rate, months)['installments'].to_list(),
+            lambda rows: [[row[key] for row in rows] for key in financing_keys],
+            lambda rows: [[row[key] for row in rows] for key in financing_keys],
+        ))
+
+    print(f"Cronograma de {months} meses ({args.number} execuções)")
+    for name, legacy, adapter, legacy_view, adapter_view in cases:
+        diff = max(
+            _max_diff(got, expected)
+            for got, expected in zip(adapter_view(adapter()), legacy_view(legacy()))
+        )
+        if diff > 1e-6:
+            raise AssertionError(f"{name}: saída difere do laço em {diff:.2e}")
+        before = _best(legacy, args.number)
+        after = _best(adapter, args.number)
+        print(f"{name:<28} laço: {before:8.1f} µs  kernel: {after:7.1f} µs  "
+              f"speedup: {before / after:5.1f}x  Δmáx: {diff:.1e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark da matriz de capacidade de financiamento (prazo × taxa).
+
+Compara a grade em forma fechada com chamadas a ``max_loan_amount`` célula
+a célula e com a busca por bisseção sobre a primeira parcela do
+cronograma, que seria o caminho a partir de ``loan_calculator``.
+
+Uso:
+    python -m benchmarks.bench_affordability [--terms 30] [--rates 72]
+"""
+
+import argparse
+
+import numpy as np
+
+from benchmarks.bench_amortization import _best
+from src.calculators.amortization import amortization_schedule
+from src.calculators.goal_seek import affordability_matrix, max_loan_amount
+
+
+def bisection_max_loan(payment, annual_rate, months, system, tolerance=0.01):
+    """Maior valor cuja primeira parcela cabe em ``payment``, por bisseção."""
+    low, high = 0.0, payment * months
+    while high - low > tolerance:
+        middle = (low + high) / 2
+        schedule = amortization_schedule(middle, annual_rate / 100 / 12, months, system)
+        if schedule['payment'][0] <= payment:
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--terms', type=int, default=30)
+    parser.add_argument('--rates', type=int, default=72)
+    parser.add_argument('--number', type=int, default=5)
+    args = parser.parse_args()
+
+    terms = np.linspace(12, 420, args.terms).astype(int)
+    rates = np.linspace(0.5, 36, args.rates)
+    cells = terms.size * rates.size
+
+    for system in ('PRICE', 'SAC'):
+        matrix = _best(lambda: affordability_matrix(15000, terms, rates, system), args.number)
+        scalar = _best(lambda: [
+            max_loan_amount(4500, rate, months, system) for months in terms for rate in rates
+        ], args.number)
+        print(f"{system:5} {cells} células  matriz: {matrix / 1000:6.3f} ms  "
+              f"max_loan_amount: {scalar / 1000:6.2f} ms ({scalar / matrix:4.0f}x)")
+
+    sample = [(int(months), float(rate)) for months in terms[::6] for rate in rates[::12]]
+    bisection = _best(lambda: [
+        bisection_max_loan(4500, rate, months, 'SAC') for months, rate in sample
+    ], 1) / len(sample) * cells
+    matrix = _best(lambda: affordability_matrix(15000, terms, rates, 'SAC'), args.number)
+    print(f"SAC   bisseção sobre o cronograma (estimado para {cells} células): "
+          f"{bisection / 1e6:6.2f} s ({bisection / matrix:,.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
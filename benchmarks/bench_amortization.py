@@ -0,0 +1,123 @@
+"""Benchmark do motor vetorizado de amortização.
+
+Compara o laço mês a mês original (um dicionário por parcela) com os
+kernels NumPy de ``src.calculators.amortization``, tanto gerando a mesma
+lista de dicionários (``ScheduleRows.to_list``) quanto só as colunas, e
+mede o modo em centavos inteiros (``src.calculators.cents``) contra o
+motor ``float64``.
+
+Uso:
+    python -m benchmarks.bench_amortization [--months 360] [--number 2000]
+"""
+
+import argparse
+import timeit
+from typing import Dict, List
+
+import numpy as np
+
+from src.calculators.amortization import (
+    batch_schedule,
+    price_payment,
+    price_schedule,
+    sac_schedule,
+)
+from src.calculators.cents import price_schedule_cents, sac_schedule_cents
+from src.calculators.results import ScheduleRows
+
+
+def legacy_price(loan_amount: float, monthly_rate: float, months: int) -> List[Dict]:
+    """Laço original do sistema PRICE (referência)."""
+    monthly_payment = price_payment(loan_amount, monthly_rate, months)
+    installments = []
+    balance = loan_amount
+    for month in range(1, months + 1):
+        interest = balance * monthly_rate
+        principal = monthly_payment - interest
+        balance -= principal
+        installments.append({
+            'installment': month,
+            'payment': monthly_payment,
+            'principal': principal,
+            'interest': interest,
+            'balance': max(0, balance)
+        })
+    return installments
+
+
+def legacy_sac(loan_amount: float, monthly_rate: float, months: int) -> List[Dict]:
+    """Laço original do sistema SAC (referência)."""
+    amortization = loan_amount / months
+    installments = []
+    balance = loan_amount
+    for month in range(1, months + 1):
+        interest = balance * monthly_rate
+        payment = amortization + interest
+        balance -= amortization
+        installments.append({
+            'installment': month,
+            'payment': payment,
+            'principal': amortization,
+            'interest': interest,
+            'balance': max(0, balance)
+        })
+    return installments
+
+
+def _best(func, number: int) -> float:
+    """Melhor tempo médio por chamada, em microssegundos."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--months', type=int, default=360)
+    parser.add_argument('--number', type=int, default=2000)
+    args = parser.parse_args()
+
+    loan_amount, monthly_rate = 250000.0, 9.5 / 100 / 12
+    cases = [
+        ('PRICE', legacy_price, price_schedule),
+        ('SAC', legacy_sac, sac_schedule),
+    ]
+
+    print(f"Cronograma de {args.months} meses ({args.number} execuções)")
+    for name, legacy, kernel in cases:
+        before = _best(lambda: legacy(loan_amount, monthly_rate, args.months), args.number)
+        # Mesma saída do laço: uma lista de dicionários, gerada por inteiro
+        rows = _best(
+            lambda: ScheduleRows(kernel(loan_amount, monthly_rate, args.months)).to_list(),
+            args.number
+        )
+        columns = _best(lambda: kernel(loan_amount, monthly_rate, args.months), args.number)
+        print(f"{name:<6} laço: {before:8.1f} µs  "
+              f"linhas: {rows:6.1f} µs ({before / rows:4.1f}x)  "
+              f"colunas: {columns:6.1f} µs ({before / columns:5.1f}x)")
+
+    # Centavos inteiros: meta de no máximo 2x o tempo do motor float64
+    cents_cases = [
+        ('PRICE', price_schedule, price_schedule_cents),
+        ('SAC', sac_schedule, sac_schedule_cents),
+    ]
+    for name, kernel, exact in cents_cases:
+        floats = _best(lambda: kernel(loan_amount, monthly_rate, args.months), args.number)
+        cents = _best(lambda: exact(loan_amount, monthly_rate, args.months), args.number)
+        print(f"{name:<6} float64: {floats:6.1f} µs  centavos: {cents:6.1f} µs  "
+              f"razão: {cents / floats:4.2f}x")
+
+    # Grade "taxa × prazo" com 500 células
+    rates = np.linspace(6, 30, 25)
+    terms = np.array([6, 12, 18, 24, 36, 48, 60, 72, 84, 96,
+                      120, 150, 180, 210, 240, 270, 300, 330, 360, 420])
+    before = _best(
+        lambda: [legacy_price(100000, rate / 100 / 12, int(term))
+                 for rate in rates for term in terms],
+        5
+    )
+    after = _best(lambda: batch_schedule(100000, rates[:, None], terms[None, :]), 20)
+    print(f"Grade {rates.size}x{terms.size} laço: {before / 1000:8.1f} ms  "
+          f"lote: {after / 1000:6.1f} ms  speedup: {before / after:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark da contagem de dias úteis.
+
+Compara a contagem dia a dia, por par de datas, com a contagem vetorizada
+por busca binária no array de feriados.
+
+Uso:
+    python -m benchmarks.bench_business_days [--pairs 100000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.calculators.business_days import HOLIDAYS, business_days_between
+
+
+def legacy_count(start, end, holidays):
+    """Percorre os dias do intervalo (referência)."""
+    count = 0
+    day = start
+    while day < end:
+        if day.weekday() < 5 and day not in holidays:
+            count += 1
+        day = day.fromordinal(day.toordinal() + 1)
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pairs', type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    start = rng.integers(10957, 46000, args.pairs).astype('datetime64[D]')
+    end = start + rng.integers(0, 1100, args.pairs)
+
+    sample = min(args.pairs, 2000)
+    holidays = set(HOLIDAYS.tolist())
+    pairs = list(zip(start[:sample].tolist(), end[:sample].tolist()))
+    begin = time.perf_counter()
+    for first, last in pairs:
+        legacy_count(first, last, holidays)
+    before = (time.perf_counter() - begin) / sample
+
+    begin = time.perf_counter()
+    business_days_between(start, end)
+    after = (time.perf_counter() - begin) / args.pairs
+
+    print(f"{args.pairs} pares de datas (laço medido em {sample})")
+    print(f"Laço dia a dia: {before * 1e6:8.2f} µs/par")
+    print(f"Busca binária:  {after * 1e6:8.3f} µs/par  speedup: {before / after:,.0f}x")
+
+
+if __name__ == '__main__':
+    main()
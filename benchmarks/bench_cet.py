@@ -0,0 +1,47 @@
+"""Benchmark do cálculo de CET em lote.
+
+Compara a TIR genérica (``cashflow.irr``, com busca de intervalo em grade)
+aplicada oferta a oferta com o Newton vetorizado de ``cet_batch``, que
+parte da taxa nominal e resolve todas as ofertas de uma vez.
+
+Uso:
+    python -m benchmarks.bench_cet [--offers 48]
+"""
+
+import argparse
+
+import numpy as np
+
+from benchmarks.bench_amortization import _best
+from src.calculators.cashflow import irr
+from src.calculators.cet import cet_batch
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--offers', type=int, default=48)
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    amounts = rng.uniform(5000, 50000, args.offers)
+    rates = rng.uniform(12, 80, args.offers)
+    terms = rng.choice([12, 24, 36, 48, 60], args.offers)
+
+    def run():
+        return cet_batch(amounts, rates, terms, 'PRICE', fees=500, monthly_insurance=15)
+
+    result = run()
+    flows = [np.r_[-result.released_amount[k], result.installments[k][result.mask[k]]]
+             for k in range(args.offers)]
+
+    per_offer = _best(lambda: [irr(series) for series in flows], max(args.number // 10, 1))
+    batch = _best(run, args.number)
+    print(f"{args.offers} ofertas ({result.iterations} iterações de Newton)")
+    print(f"TIR por oferta:   {per_offer / 1000:7.2f} ms")
+    print(f"CET em lote:      {batch / 1000:7.2f} ms  speedup: {per_offer / batch:5.1f}x "
+          "(inclui cronogramas, IOF e seguro)")
+
+
+if __name__ == '__main__':
+    main()
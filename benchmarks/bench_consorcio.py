@@ -0,0 +1,68 @@
+"""Benchmark do simulador de consórcio contra assembleias sorteadas uma a uma.
+
+Uso:
+    python -m benchmarks.bench_consorcio [--paths 20000] [--months 100]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.calculators.consorcio import simulate_consorcio
+
+
+def legacy_group_simulation(months, group_size, lance, bid_until, participation, low, high,
+                            paths, seed):
+    """Sorteia cada assembleia e os lances de cada concorrente, mês a mês."""
+    rng = np.random.default_rng(seed)
+    month = np.full(paths, months)
+    waiting = np.ones(paths, dtype=bool)
+    for t in range(months - 1):
+        active = group_size - 2 * t
+        if active <= 1:
+            break
+        drawn = waiting & (rng.random(paths) < 1 / active)
+        competitors = active - 2
+        offers = np.where(
+            rng.random((paths, competitors)) < participation,
+            rng.uniform(low, high, (paths, competitors)), 0.0
+        )
+        won = waiting & ~drawn & (t < bid_until) & ((offers > lance).sum(axis=1) < 1)
+        month[drawn | won] = t + 1
+        waiting &= ~(drawn | won)
+    return month
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--paths', type=int, default=20_000)
+    parser.add_argument('--months', type=int, default=100)
+    args = parser.parse_args()
+
+    # Lance de 25% aceito enquanto o saldo devedor for maior que ele
+    installment = 100_000 * 1.17 / args.months
+    bid_until = args.months - int(25_000 // installment) - 1
+
+    start = time.perf_counter()
+    reference = legacy_group_simulation(
+        args.months, 2 * args.months, 25.0, bid_until, 0.1, 10.0, 50.0, args.paths, seed=1
+    )
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = simulate_consorcio(
+        100_000, args.months, bid=25, n_paths=args.paths, seed=1
+    )
+    current = time.perf_counter() - start
+
+    print(f"{args.paths} cenários x {args.months} meses  "
+          f"assembleias: {legacy * 1000:8.1f} ms  "
+          f"simulador: {current * 1000:6.2f} ms  "
+          f"speedup: {legacy / current:6.0f}x")
+    print(f"Mês médio de contemplação: {reference.mean():.1f} (assembleias) "
+          f"/ {result.contemplation_month.mean():.1f} (simulador)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark da dívida de cartão: lote de políticas contra um laço por política.
+
+Cada cliente da carteira tem saldo e taxa próprios e é avaliado com
+vários percentuais de pagamento.
+
+Uso:
+    python -m benchmarks.bench_credit_card [--clients 1000] [--percents 10]
+"""
+
+import argparse
+
+import numpy as np
+
+from benchmarks.bench_amortization import _best
+from src.calculators.credit_card import MONTHLY_IOF_RATE, simulate_card_debt
+
+
+def legacy_card_debt(balance, monthly_rate, percent, minimum, months=360):
+    """Uma política por vez, mês a mês, com o teto de juros."""
+    paid_total = charged = 0.0
+    cap = balance
+    for _ in range(months):
+        paid = min(balance, max(balance * percent / 100, minimum))
+        rolled = balance - paid
+        if rolled <= 1e-6:
+            break
+        charge = min(rolled * monthly_rate / 100, cap - charged)
+        charged += charge
+        balance = rolled + charge + rolled * MONTHLY_IOF_RATE
+        paid_total += paid
+    return paid_total, charged
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--clients', type=int, default=1000)
+    parser.add_argument('--percents', type=int, default=10)
+    parser.add_argument('--number', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(23)
+    balances = rng.uniform(500, 20000, (args.clients, 1))
+    rates = rng.uniform(6, 16, (args.clients, 1))
+    percents = np.linspace(10, 100, args.percents)
+    policies = [
+        (float(balance), float(rate), float(percent))
+        for balance, rate in zip(balances[:, 0], rates[:, 0]) for percent in percents
+    ]
+
+    for label, count in (('1 cliente', 1), (f'{args.clients} clientes', args.clients)):
+        legacy = _best(lambda: [
+            legacy_card_debt(balance, rate, percent, 50)
+            for balance, rate, percent in policies[:count * args.percents]
+        ], args.number)
+        current = _best(lambda: simulate_card_debt(
+            balances[:count], rates[:count], percents
+        ), args.number)
+        print(f"{label:>15} x {args.percents} percentuais  "
+              f"laço por política: {legacy / 1000:8.2f} ms  "
+              f"lote: {current / 1000:7.2f} ms  speedup: {legacy / current:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
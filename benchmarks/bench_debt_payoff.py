@@ -0,0 +1,82 @@
+"""Benchmark do planejador de quitação de dívidas.
+
+Compara a simulação mês a mês de todas as dívidas com o planejador por
+eventos (heap de quitações), para carteiras grandes e prazos longos.
+
+Uso:
+    python -m benchmarks.bench_debt_payoff [--debts 60] [--years 30]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.bench_amortization import _best
+from src.calculators.debt_payoff import Debt, _priority, plan_debt_payoff
+
+
+def legacy_payoff(debts, monthly_budget, priority, max_months):
+    """Laço mês a mês sobre todas as dívidas (referência)."""
+    balance = [debt.balance for debt in debts]
+    rate = [debt.annual_rate / 100 / 12 for debt in debts]
+    payoff = [0] * len(debts)
+    month = 0
+    while any(balance) and month < max_months:
+        month += 1
+        available = monthly_budget
+        for k, debt in enumerate(debts):
+            if balance[k] > 0:
+                balance[k] *= 1 + rate[k]
+                pay = min(debt.minimum_payment, balance[k])
+                balance[k] -= pay
+                available -= pay
+                if balance[k] <= 1e-9:
+                    balance[k], payoff[k] = 0.0, month
+        for k in priority:
+            if available <= 1e-12:
+                break
+            if balance[k] > 0:
+                pay = min(available, balance[k])
+                balance[k] -= pay
+                available -= pay
+                if balance[k] <= 1e-9:
+                    balance[k], payoff[k] = 0.0, month
+    return payoff
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--debts', type=int, default=60)
+    parser.add_argument('--years', type=int, default=30)
+    parser.add_argument('--number', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(21)
+    debts = []
+    for k in range(args.debts):
+        balance = float(rng.uniform(1000, 80000))
+        rate = float(rng.uniform(0, 60))
+        # Mínimo que quita a dívida sozinho nos últimos 5 anos do horizonte
+        months = int(rng.integers(args.years * 12 - 60, args.years * 12 + 1))
+        minimum = balance * (rate / 1200 + 1 / months)
+        debts.append(Debt(f'dívida {k}', balance, rate, minimum))
+    budget = sum(debt.minimum_payment for debt in debts)
+    max_months = args.years * 12
+
+    for strategy in ('avalanche', 'snowball'):
+        plan = plan_debt_payoff(debts, budget, strategy, max_months=max_months)
+        priority = _priority(debts, strategy, None)
+        start = time.perf_counter()
+        expected = legacy_payoff(debts, budget, priority, max_months)
+        before = (time.perf_counter() - start) * 1e6
+        assert expected == plan.payoff_month.tolist()
+        after = _best(lambda: plan_debt_payoff(debts, budget, strategy,
+                                               max_months=max_months), args.number)
+        print(f"{strategy:<9} {args.debts} dívidas, {plan.months} meses  "
+              f"mês a mês: {before / 1000:7.2f} ms  eventos: {after / 1000:6.3f} ms  "
+              f"speedup: {before / after:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
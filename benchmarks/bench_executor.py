@@ -0,0 +1,74 @@
+"""Benchmark de escalabilidade do executor de lotes em processos.
+
+Mede a simulação de Monte Carlo com 1, 2, ... processos até o número de
+núcleos e reporta o ganho em relação à execução serial. O pool é
+aquecido antes da medição para não contar a criação dos processos.
+
+Em máquinas com mais de um núcleo, termina com código 1 se a eficiência
+com todos os processos ficar abaixo de ``--min-efficiency``.
+
+Uso:
+    python -m benchmarks.bench_executor [--paths 200000] [--months 480]
+                                        [--min-efficiency 0.6]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from src.calculators.executor import BatchExecutor
+from src.calculators.monte_carlo import simulate_retirement
+
+
+def run(paths: int, months: int, chunk_size: int, executor=None) -> float:
+    """Executa uma simulação e retorna o tempo em segundos."""
+    accumulation = months * 3 // 4
+    start = time.perf_counter()
+    simulate_retirement(
+        current_savings=10000,
+        monthly_contribution=1000,
+        accumulation_months=accumulation,
+        monthly_withdrawal=4000,
+        withdrawal_months=months - accumulation,
+        n_paths=paths,
+        seed=42,
+        chunk_size=chunk_size,
+        executor=executor
+    )
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--paths', type=int, default=200_000)
+    parser.add_argument('--months', type=int, default=480)
+    parser.add_argument('--chunk-size', type=int, default=10_000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--min-efficiency', type=float, default=0.6)
+    args = parser.parse_args()
+
+    serial = run(args.paths, args.months, args.chunk_size)
+    print(f"{args.paths} cenários x {args.months} meses")
+    print(f"serial: {serial:.3f} s")
+
+    for workers in range(1, args.max_workers + 1):
+        with BatchExecutor(max_workers=workers) as executor:
+            run(args.chunk_size, args.months, args.chunk_size, executor)  # Aquece o pool
+            elapsed = run(args.paths, args.months, args.chunk_size, executor)
+        speedup = serial / elapsed
+        efficiency = speedup / workers
+        print(f"{workers:>2} processo(s): {elapsed:.3f} s  "
+              f"ganho {speedup:.2f}x  eficiência {efficiency:.0%}")
+
+    if args.max_workers < 2 or (os.cpu_count() or 1) < 2:
+        print("Um único núcleo: escalabilidade não verificada")
+        return 0
+    if efficiency < args.min_efficiency:
+        print(f"Eficiência {efficiency:.0%} abaixo do mínimo de {args.min_efficiency:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""Benchmark da exportação de cronogramas em fluxo.
+
+Grava lotes crescentes de contratos e mostra que o pico de memória
+(``tracemalloc``) depende do tamanho do lote, não do número de contratos.
+
+Uso:
+    python -m benchmarks.bench_export [--contracts 10000 40000] [--format csv]
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from src.calculators.export import export_schedules
+
+
+def contracts(count: int, seed: int = 7):
+    """Gera contratos sintéticos sem materializar a lista."""
+    rng = np.random.default_rng(seed)
+    terms = np.array([12, 24, 36, 48, 60, 120, 240, 360])
+    for _ in range(count):
+        yield (
+            float(rng.uniform(5_000, 500_000)),
+            float(rng.uniform(6, 30)),
+            int(rng.choice(terms)),
+            'PRICE' if rng.random() < 0.5 else 'SAC',
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--contracts', type=int, nargs='+', default=[10_000, 40_000])
+    parser.add_argument('--format', default='csv', choices=['csv', 'parquet'])
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / f"bench.{args.format}"
+        for count in args.contracts:
+            def run():
+                return export_schedules(contracts(count), path, args.format, args.chunk_size)
+
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+
+            # tracemalloc deixa a gravação bem mais lenta: execução separada
+            tracemalloc.start()
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            size = path.stat().st_size / 2**20
+            print(f"{count:>7} contratos: {elapsed:6.2f} s  "
+                  f"pico: {peak / 2**20:6.1f} MiB  arquivo: {size:8.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
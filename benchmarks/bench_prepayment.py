@@ -0,0 +1,44 @@
+"""Benchmark do simulador de amortizações extraordinárias.
+
+Compara o cálculo completo do cronograma com edições interativas, que
+recalculam apenas os segmentos a partir do evento alterado.
+
+Uso:
+    python -m benchmarks.bench_prepayment [--months 360] [--events 12]
+"""
+
+import argparse
+
+from benchmarks.bench_amortization import _best
+from src.calculators.prepayment import PrepaymentSimulator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--months', type=int, default=360)
+    parser.add_argument('--events', type=int, default=12)
+    parser.add_argument('--number', type=int, default=2000)
+    args = parser.parse_args()
+
+    step = max(args.months // (args.events + 1), 1)
+    events = [(month, 3000, 'reduce_term') for month in range(step, args.months, step)]
+    events = events[:args.events]
+    simulator = PrepaymentSimulator(250000, 9.5, args.months, 'PRICE', events)
+
+    def full():
+        PrepaymentSimulator(250000, 9.5, args.months, 'PRICE', events).result()
+
+    def edit(month):
+        def run():
+            simulator.add_event(month, 7000, 'reduce_payment')
+            simulator.result()
+        return run
+
+    print(f"{args.months} meses, {len(events)} eventos ({args.number} execuções)")
+    print(f"Cronograma completo:      {_best(full, args.number):7.1f} µs")
+    for month in (step // 2, args.months // 2, events[-1][0] + 1):
+        print(f"Edição no mês {month:>3}:       {_best(edit(month), args.number):7.1f} µs")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Benchmark da grade de rendimentos líquidos de impostos e taxas.
+
+Compara ``scenario_grid`` (bruto) com ``net_scenario_grid`` (líquido de
+taxas, IOF e IR regressivo por lote) na mesma grade de cenários.
+
+Uso:
+    python -m benchmarks.bench_taxes [--products 200] [--number 2000]
+"""
+
+import argparse
+
+import numpy as np
+
+from benchmarks.bench_amortization import _best
+from src.calculators.scenarios import scenario_grid
+from src.calculators.taxes import net_scenario_grid
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=200)
+    parser.add_argument('--number', type=int, default=2000)
+    args = parser.parse_args()
+
+    rates = np.linspace(6, 16, args.products)
+    admin = np.where(np.arange(args.products) % 3 == 0, 1.0, 0.0)
+    exempt = np.arange(args.products) % 5 == 0
+    horizons = [1, 6, 12, 24, 36, 60, 120]
+    contributions = [0, 200, 500, 1000]
+
+    gross = _best(lambda: scenario_grid(10000, rates, horizons, contributions), args.number)
+    net = _best(lambda: net_scenario_grid(10000, rates, horizons, contributions,
+                                          admin_fees=admin, tax_exempt=exempt), args.number)
+    cells = args.products * len(horizons) * len(contributions)
+    print(f"{cells} cenários ({args.number} execuções)")
+    print(f"Bruto:   {gross:8.1f} µs")
+    print(f"Líquido: {net:8.1f} µs  ({net / gross:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,433 @@
+"""Suíte de benchmarks de todas as calculadoras, com baselines em JSON.
+
+Cobre os pontos de entrada de ``src/calculators.py`` (carregado pelo
+caminho, pois o pacote de mesmo nome o encobre), de
+``src.calculators.FinancialCalculators`` e de ``financial_calculators``:
+chamadas únicas, lotes e prazos de 12 a 600 meses. Para cada caso mede
+operações por segundo, latência p50/p99 por chamada e pico de memória
+(``tracemalloc``, em uma execução separada para não distorcer os tempos).
+
+As calculadoras memoizadas são medidas sem o cache (``__wrapped__``), ou
+seja, sempre o cálculo completo.
+
+Uso:
+    python -m benchmarks.suite run [--months 12 60 360] [--filter loan] [--quick]
+        [--output benchmarks/baselines/latest.json] [--baseline ARQUIVO]
+    python -m benchmarks.suite compare BASELINE ATUAL [--threshold 10]
+
+``compare`` (ou ``run --baseline``) termina com código 1 se algum caso
+ficar mais lento que a baseline além do limite, em percentual do p50.
+"""
+
+import argparse
+import atexit
+import json
+import platform
+import re
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from benchmarks.bench_adapters import _load_legacy_module
+from src.calculators import FinancialCalculators
+from src.calculators.business_days import business_days_between
+from src.calculators.debt_payoff import Debt
+from src.calculators.financial_calculators import (
+    FinancingCalculator,
+    InvestmentCalculator,
+    RetirementCalculator,
+)
+from src.calculators.rate_tables import rate_factors
+from src.calculators.taxes import net_scenario_grid
+
+MONTHS = (12, 60, 120, 360, 600)
+BASELINE_DIR = Path(__file__).resolve().parent / 'baselines'
+DEFAULT_THRESHOLD = 10.0
+
+INVESTMENTS = [
+    {'name': 'Poupança', 'rate': 6.17, 'tax_exempt': True},
+    {'name': 'CDB', 'rate': 11.0},
+    {'name': 'LCI', 'rate': 9.8, 'tax_exempt': True},
+    {'name': 'Fundo DI', 'rate': 11.2, 'admin_fee': 0.8},
+    {'name': 'Tesouro Selic', 'rate': 10.65, 'custody_fee': 0.2},
+]
+
+
+@dataclass
+class Case:
+    """Caso de benchmark: nome único, grupo e chamada sem argumentos."""
+    name: str
+    group: str
+    func: Callable[[], object]
+    months: Optional[int] = None
+
+
+def _uncached(method: Callable) -> Callable:
+    """Versão sem memoização de uma calculadora de ``calculator_cache``."""
+    return getattr(method, '__wrapped__', method)
+
+
+def build_cases(months: Sequence[int] = MONTHS) -> List[Case]:
+    """Monta os casos de todas as calculadoras para os prazos dados."""
+    en = _load_legacy_module().FinancialCalculators
+    pt = FinancialCalculators
+    loan = _uncached(en.loan_calculator)
+    compound = _uncached(en.compound_interest)
+    export_dir = tempfile.mkdtemp(prefix='bench_suite_')
+    atexit.register(shutil.rmtree, export_dir, ignore_errors=True)
+    rng = np.random.default_rng(18)
+    cases = []
+
+    def add(name, group, func, term=None):
+        label = f"{name}[{term}]" if term is not None else name
+        cases.append(Case(label, group, func, term))
+
+    for n in months:
+        index = rng.normal(0.003, 0.002, size=(100, n))
+        contracts = [(150000 + 1000 * k, 8 + k % 10, n, 'PRICE' if k % 2 else 'SAC')
+                     for k in range(100)]
+        add('en.loan_calculator.PRICE', 'loan', lambda n=n: loan(250000, 9.5, n, 'PRICE'), n)
+        add('en.loan_calculator.SAC', 'loan', lambda n=n: loan(250000, 9.5, n, 'SAC'), n)
+        add('en.loan_calculator.PRICE.rows', 'loan',
+            lambda n=n: loan(250000, 9.5, n, 'PRICE').installments.to_list(), n)
+        add('en.loan_calculator.SAC.rows', 'loan',
+            lambda n=n: loan(250000, 9.5, n, 'SAC').installments.to_list(), n)
+        # 9,37% a.a. fica fora da tabela de fatores do catálogo
+        add('en.loan_calculator.PRICE.off_catalog', 'loan',
+            lambda n=n: loan(250000, 9.37, n, 'PRICE'), n)
+        add('en.loan_calculator.cents', 'loan',
+            lambda n=n: loan(250000, 9.5, n, 'PRICE', exact_cents=True), n)
+        add('en.loan_calculator_batch.1000', 'batch',
+            lambda n=n: en.loan_calculator_batch(
+                np.linspace(50000, 500000, 1000), 9.5, n, 'PRICE'), n)
+        add('en.export_loan_schedules.100', 'batch',
+            lambda n=n, c=contracts: en.export_loan_schedules(
+                c, str(Path(export_dir) / f'suite_{n}.csv')), n)
+        add('en.compound_interest', 'investment',
+            lambda n=n: compound(10000, 10.0, n, 500), n)
+        add('en.compound_interest.rows', 'investment',
+            lambda n=n: compound(10000, 10.0, n, 500).monthly_breakdown.to_list(), n)
+        add('en.required_contribution', 'goal_seek',
+            lambda n=n: en.required_contribution(1000000, 10.0, n, 10000), n)
+        add('en.implied_rate', 'goal_seek',
+            lambda n=n: en.implied_rate(1000000, n, 1500, 10000), n)
+        add('en.implied_loan_rate', 'goal_seek',
+            lambda n=n: en.implied_loan_rate(250000, 250000 / n * 1.5, n), n)
+        add('en.max_loan_amount.SAC', 'goal_seek',
+            lambda n=n: en.max_loan_amount(3000, 9.5, n, 'SAC'), n)
+        add('en.prepayment_simulator', 'loan',
+            lambda n=n: en.prepayment_simulator(
+                250000, 9.5, n, 'PRICE', [(n // 3, 5000, 'reduce_term')]).result(), n)
+        add('en.indexed_loan_calculator.100', 'batch',
+            lambda n=n, index=index: en.indexed_loan_calculator(250000, 9.5, n, index), n)
+        add('en.loan_cet.1000', 'batch',
+            lambda n=n: en.loan_cet(np.linspace(50000, 500000, 1000), 9.5, n, fees=800), n)
+        add('en.credit_card_debt.100', 'batch',
+            lambda n=n: en.credit_card_debt(
+                5000, 14.0, np.linspace(5, 100, 100), max_months=n), n)
+        add('en.real_values', 'investment',
+            lambda result=compound(10000, 10.0, n, 500): en.real_values(
+                result, annual_inflation=4.5), n)
+        add('pt.calcular_financiamento_price', 'loan',
+            lambda n=n: pt.calcular_financiamento_price(300000, 50000, n, 9.5), n)
+        add('pt.calcular_financiamento_sac', 'loan',
+            lambda n=n: pt.calcular_financiamento_sac(300000, 50000, n, 9.5), n)
+        add('pt.calcular_investimento', 'investment',
+            lambda n=n: pt.calcular_investimento(10000, 500, 10.0, n), n)
+        add('pt.calcular_valor_maximo_financiamento', 'goal_seek',
+            lambda n=n: pt.calcular_valor_maximo_financiamento(3000, 9.5, n), n)
+        add('pt.calcular_cet', 'loan',
+            lambda n=n: pt.calcular_cet(300000, 9.5, n, tarifas=800), n)
+        add('pt.calcular_valores_reais', 'investment',
+            lambda result=pt.calcular_investimento(10000, 500, 10.0, n):
+                pt.calcular_valores_reais(result, 4.5), n)
+        add('financing.calculate_price', 'loan',
+            lambda n=n: FinancingCalculator.calculate_price(250000, 9.5, n), n)
+        add('financing.calculate_sac', 'loan',
+            lambda n=n: FinancingCalculator.calculate_sac(250000, 9.5, n), n)
+
+    flows = [-100000] + [2500] * 59
+    dates = np.datetime64('2024-01-02') + np.arange(60) * 30
+    starts = rng.integers(10957, 45000, 100000).astype('datetime64[D]')
+    ends = starts + rng.integers(0, 1100, 100000)
+    debts = []
+    for k in range(60):
+        balance, rate = float(rng.uniform(1000, 80000)), float(rng.uniform(0, 60))
+        # Mínimo que quita a dívida sozinho em até 30 anos
+        minimum = balance * (rate / 1200 + 1 / int(rng.integers(300, 361)))
+        debts.append(Debt(f'dívida {k}', balance, rate, minimum))
+    debt_tuples = [(debt.name, debt.balance, debt.annual_rate, debt.minimum_payment)
+                   for debt in debts]
+    budget = sum(debt.minimum_payment for debt in debts) * 1.2
+    add('rate_factors.get', 'loan', lambda: rate_factors.get(9.5 / 100 / 12, 360))
+    add('en.debt_payoff_planner.60', 'debt',
+        lambda: en.debt_payoff_planner(debts, budget, 'avalanche'))
+    add('pt.planejar_quitacao_dividas.60', 'debt',
+        lambda: pt.planejar_quitacao_dividas(debt_tuples, budget, 'snowball'))
+    add('en.consorcio_simulator.100000', 'debt',
+        lambda: en.consorcio_simulator(100000, 100, bid=25, n_paths=100000, seed=1))
+    add('pt.simular_consorcio.100000', 'debt',
+        lambda: pt.simular_consorcio(100000, 100, lance=25, n_cenarios=100000, semente=1))
+    add('en.card_installment_plan', 'debt', lambda: en.card_installment_plan(5000, 9.0))
+    add('pt.simular_cartao_credito', 'debt', lambda: pt.simular_cartao_credito(5000, 14.0))
+    add('pt.simular_parcelamento_fatura', 'debt',
+        lambda: pt.simular_parcelamento_fatura(5000, 9.0))
+    add('en.affordability_matrix', 'goal_seek',
+        lambda: en.affordability_matrix(10000, list(months), np.linspace(6, 16, 21)))
+    add('pt.calcular_capacidade_financiamento', 'goal_seek',
+        lambda: pt.calcular_capacidade_financiamento(10000, list(months), np.linspace(6, 16, 21)))
+    add('en.retirement_calculator', 'retirement',
+        lambda: en.retirement_calculator(30, 65, 1000, 8.0, 20000))
+    add('en.retirement_monte_carlo.10000', 'retirement',
+        lambda: en.retirement_monte_carlo(30, 65, 1000, 8.0, 20000, n_paths=10000, seed=1))
+    add('pt.calcular_aposentadoria', 'retirement',
+        lambda: pt.calcular_aposentadoria(30, 65, 8000, 20000))
+    add('pt.calcular_aposentadoria_monte_carlo.10000', 'retirement',
+        lambda: pt.calcular_aposentadoria_monte_carlo(
+            30, 65, 8000, 20000, n_cenarios=10000, semente=1))
+    add('retirement.calculate_retirement_savings', 'retirement',
+        lambda: RetirementCalculator.calculate_retirement_savings(30, 65, 8000))
+    add('investment.calculate_compound_interest', 'investment',
+        lambda: InvestmentCalculator.calculate_compound_interest(10000, 10.0, 30, 500))
+    add('en.compare_investments', 'investment',
+        lambda: _uncached(en.compare_investments)(10000, 24, INVESTMENTS))
+    add('en.compare_investments.net', 'investment',
+        lambda: _uncached(en.compare_investments)(10000, 24, INVESTMENTS, net=True))
+    add('en.compare_investments_grid.net', 'batch',
+        lambda: en.compare_investments_grid(10000, list(months), INVESTMENTS, (0, 500), net=True))
+    add('taxes.net_scenario_grid.200', 'batch',
+        lambda: net_scenario_grid(10000, np.linspace(6, 16, 200), list(months), (0, 500)))
+    add('en.required_time', 'goal_seek', lambda: en.required_time(1000000, 10.0, 1500, 10000))
+    add('en.post_fixed_investment', 'investment',
+        lambda: en.post_fixed_investment(10000, 10.65, '2024-01-02', '2026-01-02', 110))
+    add('business_days_between.100000', 'batch', lambda: business_days_between(starts, ends))
+    add('pt.calcular_juros_compostos', 'investment',
+        lambda: pt.calcular_juros_compostos(10000, 10.0, 120, 500))
+    add('pt.calcular_valor_presente', 'investment',
+        lambda: pt.calcular_valor_presente(100000, 10.0, 120))
+    add('pt.calcular_valor_futuro', 'investment',
+        lambda: pt.calcular_valor_futuro(100000, 10.0, 120))
+    add('pt.calcular_tir', 'cashflow', lambda: pt.calcular_tir(flows))
+    add('pt.calcular_xtir', 'cashflow', lambda: pt.calcular_xtir(flows, dates))
+    add('pt.calcular_vpl', 'cashflow', lambda: pt.calcular_vpl(flows, 10.0))
+    add('pt.calcular_aporte_necessario', 'goal_seek',
+        lambda: pt.calcular_aporte_necessario(1000000, 10.0, 360, 10000))
+    add('pt.calcular_prazo_necessario', 'goal_seek',
+        lambda: pt.calcular_prazo_necessario(1000000, 10.0, 1500, 10000))
+    add('pt.calcular_taxa_necessaria', 'goal_seek',
+        lambda: pt.calcular_taxa_necessaria(1000000, 360, 1500, 10000))
+    add('pt.simular_amortizacao_extraordinaria', 'loan',
+        lambda: pt.simular_amortizacao_extraordinaria(
+            300000, 50000, 360, 9.5, [(60, 10000, 'reduce_term')]).result())
+    add('pt.calcular_financiamento_indexado', 'loan',
+        lambda: pt.calcular_financiamento_indexado(300000, 50000, 360, 9.5, 0.002))
+    add('pt.calcular_rendimento_cdi', 'investment',
+        lambda: pt.calcular_rendimento_cdi(10000, 10.65, '2024-01-02', '2026-01-02'))
+    return cases
+
+
+def measure(
+    func: Callable[[], object],
+    samples: int = 30,
+    sample_time: float = 0.002
+) -> Dict[str, float]:
+    """Mede uma chamada: operações/s, latência p50/p99 (µs) e pico de memória.
+
+    Cada amostra executa ``number`` chamadas, calibrado para durar ao menos
+    ``sample_time`` segundos; chamadas lentas são amostradas uma a uma.
+    Cada chamada é cronometrada individualmente, então p50 e p99 são
+    percentis por chamada (a cauda não se dilui na média da amostra); em
+    chamadas de poucos µs o custo do relógio entra na medida.
+
+    Args:
+        func: Chamada sem argumentos
+        samples: Número de amostras de latência
+        sample_time: Duração mínima de cada amostra (s)
+
+    Returns:
+        Dicionário com ``ops_per_sec``, ``p50_us``, ``p99_us``,
+        ``peak_kib`` e ``number``
+    """
+    func()  # Aquecimento (imports, caches de módulo)
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= sample_time:
+            break
+        number *= 2
+
+    clock = time.perf_counter
+    timings = np.empty(samples * number)
+    for call in range(timings.size):
+        start = clock()
+        func()
+        timings[call] = clock() - start
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    p50, p99 = np.percentile(timings, [50, 99])
+    return {
+        'ops_per_sec': float(1.0 / timings.mean()),
+        'p50_us': float(p50 * 1e6),
+        'p99_us': float(p99 * 1e6),
+        'peak_kib': peak / 1024,
+        'number': number,
+    }
+
+
+def run_suite(
+    months: Sequence[int] = MONTHS,
+    pattern: Optional[str] = None,
+    samples: int = 30,
+    sample_time: float = 0.002,
+    verbose: bool = True
+) -> Dict:
+    """Executa os casos (filtrados por regex no nome) e monta o relatório."""
+    cases = build_cases(months)
+    if pattern:
+        cases = [case for case in cases if re.search(pattern, case.name)]
+    results = {}
+    for case in cases:
+        stats = measure(case.func, samples, sample_time)
+        results[case.name] = dict(stats, group=case.group, months=case.months)
+        if verbose:
+            print(_format_row(case.name, stats), flush=True)
+    return {'meta': _metadata(samples, sample_time), 'results': results}
+
+
+def compare_results(
+    baseline: Dict,
+    current: Dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    metric: str = 'p50_us'
+) -> Dict[str, List]:
+    """Compara dois relatórios pelo tempo ``metric`` de cada caso.
+
+    Args:
+        baseline: Relatório de referência
+        current: Relatório atual
+        threshold: Piora máxima tolerada (%)
+        metric: Métrica de tempo comparada ('p50_us' ou 'p99_us')
+
+    Returns:
+        Dicionário com ``regressions``, ``improvements`` e ``unchanged``
+        (listas de ``(nome, base, atual, variação %)``), ``missing`` e ``new``
+    """
+    if threshold < 0:
+        raise ValueError("Limite deve ser não negativo")
+    base, cur = baseline['results'], current['results']
+    report = {'regressions': [], 'improvements': [], 'unchanged': [],
+              'missing': sorted(set(base) - set(cur)), 'new': sorted(set(cur) - set(base))}
+    for name in base:
+        if name not in cur:
+            continue
+        before, after = base[name][metric], cur[name][metric]
+        change = (after / before - 1) * 100 if before > 0 else 0.0
+        entry = (name, before, after, change)
+        if change > threshold:
+            report['regressions'].append(entry)
+        elif change < -threshold:
+            report['improvements'].append(entry)
+        else:
+            report['unchanged'].append(entry)
+    return report
+
+
+def save_report(report: Dict, path) -> Path:
+    """Grava o relatório em JSON, criando o diretório se preciso."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+    return path
+
+
+def load_report(path) -> Dict:
+    """Lê um relatório salvo por ``save_report``."""
+    return json.loads(Path(path).read_text(encoding='utf-8'))
+
+
+def _metadata(samples: int, sample_time: float) -> Dict:
+    """Ambiente da execução, para saber se duas baselines são comparáveis."""
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'samples': samples,
+        'sample_time': sample_time,
+    }
+
+
+def _format_row(name: str, stats: Dict[str, float]) -> str:
+    return (f"{name:<52} {stats['ops_per_sec']:>12,.0f} op/s  "
+            f"p50 {stats['p50_us']:>10.1f} µs  p99 {stats['p99_us']:>10.1f} µs  "
+            f"pico {stats['peak_kib']:>9.1f} KiB")
+
+
+def _print_comparison(report: Dict, threshold: float) -> None:
+    for title, key in (('Regressões', 'regressions'), ('Melhorias', 'improvements')):
+        print(f"{title} (limite {threshold:g}%): {len(report[key])}")
+        for name, before, after, change in sorted(report[key], key=lambda e: -abs(e[3])):
+            print(f"  {name:<52} {before:>10.1f} -> {after:>10.1f} µs  {change:+6.1f}%")
+    print(f"Sem alteração: {len(report['unchanged'])}")
+    for title, key in (('Ausentes na execução atual', 'missing'), ('Novos casos', 'new')):
+        if report[key]:
+            names = report[key] if len(report[key]) <= 10 else report[key][:10] + ['...']
+            print(f"{title}: {len(report[key])} ({', '.join(names)})")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='executa a suíte e grava o JSON')
+    run.add_argument('--months', type=int, nargs='+', default=list(MONTHS))
+    run.add_argument('--filter', dest='pattern', help='regex sobre o nome dos casos')
+    run.add_argument('--samples', type=int, default=30)
+    run.add_argument('--sample-time', type=float, default=0.002)
+    run.add_argument('--quick', action='store_true', help='10 amostras de 1 ms')
+    run.add_argument('--output', default=str(BASELINE_DIR / 'latest.json'))
+    run.add_argument('--baseline', help='compara com esta baseline ao final')
+    run.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+
+    compare = commands.add_parser('compare', help='compara dois JSONs')
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    compare.add_argument('--metric', choices=('p50_us', 'p99_us'), default='p50_us')
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        samples, sample_time = (10, 0.001) if args.quick else (args.samples, args.sample_time)
+        report = run_suite(args.months, args.pattern, samples, sample_time)
+        print(f"Relatório gravado em {save_report(report, args.output)}")
+        if not args.baseline:
+            return 0
+        baseline, metric = load_report(args.baseline), 'p50_us'
+    else:
+        baseline, report, metric = load_report(args.baseline), load_report(args.current), args.metric
+
+    comparison = compare_results(baseline, report, args.threshold, metric)
+    _print_comparison(comparison, args.threshold)
+    return 1 if comparison['regressions'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
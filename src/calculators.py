@@ -4,15 +4,55 @@ Implementa cálculos demonstrativos para educação financeira
 incluindo juros compostos, investimentos e financiamentos.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 import math
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+import numpy as np
+import pandas as pd
 
-@dataclass
+from src.calculators.amortization import (
+    SCHEDULE_COLUMNS,
+    LoanBatchResult,
+    batch_schedule,
+    price_payment,
+    price_schedule,
+    sac_schedule,
+)
+from src.calculators.business_days import post_fixed_yield
+from src.calculators.cache import calculator_cache
+from src.calculators.cet import CETResult, cet_batch
+from src.calculators.cents import price_schedule_cents, sac_schedule_cents
+from src.calculators.consorcio import simulate_consorcio
+from src.calculators.credit_card import CardDebtResult, installment_plan, simulate_card_debt
+from src.calculators.debt_payoff import DebtPayoffPlan, plan_debt_payoff
+from src.calculators.executor import BatchExecutor
+from src.calculators.export import export_schedules
+from src.calculators import goal_seek
+from src.calculators.indexed import IndexedLoanResult, indexed_schedule
+from src.calculators.inflation import real_values
+from src.calculators.investment import COMPOUND_COLUMNS, compound_schedule, compound_totals
+from src.calculators.monte_carlo import simulate_retirement
+from src.calculators.prepayment import PrepaymentSimulator
+from src.calculators.rate_tables import rate_factors
+from src.calculators.results import ScheduleRows, ScheduleTable
+from src.calculators.scenarios import ScenarioCube, scenario_grid
+from src.calculators.taxes import net_scenario_grid
+
+
+@dataclass(frozen=True)
 class InvestmentResult:
-    """Resultado de cálculo de investimento."""
+    """Resultado de cálculo de investimento.
+    
+    ``monthly_breakdown`` é uma visão em dicionários sobre colunas
+    ``float64`` contíguas, acessíveis sem cópia por ``to_numpy()`` e
+    ``to_dataframe()``. Imutável, pois é compartilhado pelo cache.
+    """
+    __slots__ = (
+        'initial_amount', 'monthly_contribution', 'interest_rate', 'months',
+        'final_amount', 'total_invested', 'total_interest', 'monthly_breakdown'
+    )
     initial_amount: float
     monthly_contribution: float
     interest_rate: float
@@ -20,25 +60,86 @@ class InvestmentResult:
     final_amount: float
     total_invested: float
     total_interest: float
-    monthly_breakdown: List[Dict[str, float]]
+    monthly_breakdown: ScheduleRows
+    
+    def __reduce__(self):
+        # Congelada e com __slots__: copia e pickle recriam pelo construtor
+        return (type(self), tuple(getattr(self, name) for name in self.__slots__))
+    
+    def to_numpy(self) -> np.ndarray:
+        """Evolução mensal como array (meses x colunas), sem cópia."""
+        return self.monthly_breakdown.to_numpy()
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """Evolução mensal como DataFrame indexado por 'month'."""
+        return self.monthly_breakdown.to_dataframe()
+    
+    def to_dict(self) -> Dict:
+        """Resumo serializável em JSON, com a evolução em colunas."""
+        return _result_to_dict(self, 'monthly_breakdown')
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoanResult:
-    """Resultado de cálculo de financiamento."""
+    """Resultado de cálculo de financiamento.
+    
+    ``installments`` é uma visão em dicionários sobre colunas ``float64``
+    contíguas, acessíveis sem cópia por ``to_numpy()`` e ``to_dataframe()``.
+    Imutável, pois é compartilhado pelo cache.
+    """
+    __slots__ = (
+        'loan_amount', 'interest_rate', 'months', 'monthly_payment',
+        'total_amount', 'total_interest', 'installments'
+    )
     loan_amount: float
     interest_rate: float
     months: int
     monthly_payment: float
     total_amount: float
     total_interest: float
-    installments: List[Dict[str, float]]
+    installments: ScheduleRows
+    
+    def __reduce__(self):
+        # Congelada e com __slots__: copia e pickle recriam pelo construtor
+        return (type(self), tuple(getattr(self, name) for name in self.__slots__))
+    
+    def to_numpy(self) -> np.ndarray:
+        """Parcelas como array (meses x colunas), sem cópia."""
+        return self.installments.to_numpy()
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """Parcelas como DataFrame indexado por 'installment'."""
+        return self.installments.to_dataframe()
+    
+    def to_dict(self) -> Dict:
+        """Resumo serializável em JSON, com as parcelas em colunas."""
+        return _result_to_dict(self, 'installments')
+
+
+def _result_to_dict(result, schedule_field: str) -> Dict:
+    """Converte um resultado em dicionário com o cronograma em listas por coluna.
+    
+    Formato compacto para ``DatabaseManager.salvar_simulacao``.
+    """
+    data = {
+        name: getattr(result, name)
+        for name in result.__slots__
+        if name != schedule_field
+    }
+    table = getattr(result, schedule_field).table
+    data[schedule_field] = {name: table[name].tolist() for name in table}
+    return data
 
 
 class FinancialCalculators:
-    """Coleção de calculadoras financeiras."""
+    """Coleção de calculadoras financeiras.
+    
+    As calculadoras públicas são memoizadas em ``calculator_cache``,
+    compartilhado entre sessões; seus resultados são somente leitura.
+    """
     
     @staticmethod
+    @calculator_cache.memoize
     def compound_interest(
         principal: float,
         rate: float,
@@ -64,26 +165,22 @@ class FinancialCalculators:
         # Converte taxa anual para mensal
         monthly_rate = rate / 100 / 12
         
-        monthly_breakdown = []
-        current_amount = principal
-        total_invested = principal
-        
-        for month in range(1, time + 1):
-            # Aplica juros
-            interest = current_amount * monthly_rate
-            current_amount += interest
-            
-            # Adiciona aporte
-            if month < time:  # Não adiciona aporte no último mês
-                current_amount += contribution
-                total_invested += contribution
-            
-            monthly_breakdown.append({
-                'month': month,
-                'contribution': contribution if month < time else 0,
-                'interest': interest,
-                'balance': current_amount
-            })
+        # Totais em tempo constante; a evolução mensal é gerada sob demanda.
+        # Taxas e prazos do catálogo usam os fatores pré-calculados.
+        factors = rate_factors.get(monthly_rate, time)
+        if factors is not None:
+            total_invested = principal + contribution * (time - 1)
+            current_amount = principal * factors.growth + contribution * (factors.annuity - 1)
+        else:
+            current_amount, total_invested = compound_totals(
+                principal, monthly_rate, time, contribution
+            )
+        monthly_breakdown = ScheduleRows(
+            lambda: compound_schedule(principal, monthly_rate, time, contribution),
+            index_key='month',
+            length=time,
+            width=len(COMPOUND_COLUMNS)
+        )
         
         total_interest = current_amount - total_invested
         
@@ -99,11 +196,14 @@ class FinancialCalculators:
         )
     
     @staticmethod
+    @calculator_cache.memoize
     def loan_calculator(
         loan_amount: float,
         annual_rate: float,
         months: int,
-        system: str = 'PRICE'
+        system: str = 'PRICE',
+        exact_cents: bool = False,
+        rounding: str = 'half_even'
     ) -> LoanResult:
         """Calcula parcelas de financiamento.
         
@@ -112,6 +212,10 @@ class FinancialCalculators:
             annual_rate: Taxa de juros anual (%)
             months: Número de parcelas
             system: Sistema de amortização ('PRICE' ou 'SAC')
+            exact_cents: Calcula em centavos inteiros; parcela, amortização,
+                juros e saldo fecham exatamente ao centavo
+            rounding: Arredondamento do modo em centavos ('half_even',
+                bancário/ABNT, ou 'half_up')
             
         Returns:
             LoanResult com detalhes do financiamento
@@ -121,6 +225,11 @@ class FinancialCalculators:
         
         monthly_rate = annual_rate / 100 / 12
         
+        if exact_cents and system.upper() in ('PRICE', 'SAC'):
+            return FinancialCalculators._calculate_cents(
+                loan_amount, monthly_rate, months, system.upper(), rounding
+            )
+        
         if system.upper() == 'PRICE':
             return FinancialCalculators._calculate_price(
                 loan_amount, monthly_rate, months
@@ -132,6 +241,46 @@ class FinancialCalculators:
         else:
             raise ValueError("Sistema deve ser 'PRICE' ou 'SAC'")
     
+    @staticmethod
+    def loan_calculator_batch(
+        loan_amounts,
+        annual_rates,
+        months,
+        systems='PRICE'
+    ) -> LoanBatchResult:
+        """Calcula vários financiamentos de uma vez (tabelas "taxa × prazo").
+        
+        Args:
+            loan_amounts: Valores dos empréstimos (escalar ou array)
+            annual_rates: Taxas de juros anuais (%) (escalar ou array)
+            months: Números de parcelas (escalar ou array)
+            systems: Sistemas de amortização ('PRICE' ou 'SAC')
+            
+        Returns:
+            LoanBatchResult com cronogramas em colunas e totais por cenário
+        """
+        return batch_schedule(loan_amounts, annual_rates, months, systems)
+    
+    @staticmethod
+    def export_loan_schedules(
+        contracts,
+        path: Optional[str] = None,
+        file_format: str = 'csv',
+        chunk_size: int = 1000
+    ):
+        """Exporta cronogramas de muitos contratos em fluxo, com memória constante.
+        
+        Args:
+            contracts: Iterável de ``(valor, taxa anual %, prazo, sistema)``
+            path: Arquivo de destino; padrão em ``data/exports/`` do projeto
+            file_format: 'csv' ou 'parquet'
+            chunk_size: Contratos calculados e gravados por vez
+            
+        Returns:
+            Caminho do arquivo gravado
+        """
+        return export_schedules(contracts, path, file_format, chunk_size)
+    
     @staticmethod
     def _calculate_price(
         loan_amount: float,
@@ -139,28 +288,11 @@ class FinancialCalculators:
         months: int
     ) -> LoanResult:
         """Calcula financiamento pelo sistema PRICE (parcelas fixas)."""
-        # Fórmula: PMT = PV * (i * (1+i)^n) / ((1+i)^n - 1)
-        if monthly_rate == 0:
-            monthly_payment = loan_amount / months
+        factors = rate_factors.get(monthly_rate, months)
+        if factors is not None:
+            monthly_payment = loan_amount * factors.payment
         else:
-            factor = (1 + monthly_rate) ** months
-            monthly_payment = loan_amount * (monthly_rate * factor) / (factor - 1)
-        
-        installments = []
-        balance = loan_amount
-        
-        for month in range(1, months + 1):
-            interest = balance * monthly_rate
-            principal = monthly_payment - interest
-            balance -= principal
-            
-            installments.append({
-                'installment': month,
-                'payment': monthly_payment,
-                'principal': principal,
-                'interest': interest,
-                'balance': max(0, balance)  # Evita valores negativos por arredondamento
-            })
+            monthly_payment = price_payment(loan_amount, monthly_rate, months)
         
         total_amount = monthly_payment * months
         total_interest = total_amount - loan_amount
@@ -172,7 +304,12 @@ class FinancialCalculators:
             monthly_payment=monthly_payment,
             total_amount=total_amount,
             total_interest=total_interest,
-            installments=installments
+            # Mesma parcela do resumo, venha ela da tabela ou da fórmula
+            installments=ScheduleRows(
+                lambda: price_schedule(loan_amount, monthly_rate, months, monthly_payment),
+                length=months,
+                width=len(SCHEDULE_COLUMNS)
+            )
         )
     
     @staticmethod
@@ -182,24 +319,8 @@ class FinancialCalculators:
         months: int
     ) -> LoanResult:
         """Calcula financiamento pelo sistema SAC (amortização constante)."""
-        amortization = loan_amount / months
-        installments = []
-        balance = loan_amount
-        total_paid = 0
-        
-        for month in range(1, months + 1):
-            interest = balance * monthly_rate
-            payment = amortization + interest
-            balance -= amortization
-            total_paid += payment
-            
-            installments.append({
-                'installment': month,
-                'payment': payment,
-                'principal': amortization,
-                'interest': interest,
-                'balance': max(0, balance)
-            })
+        # Soma dos juros em forma fechada: i * PV * (n + 1) / 2
+        total_paid = loan_amount + loan_amount * monthly_rate * (months + 1) / 2
         
         total_interest = total_paid - loan_amount
         avg_payment = total_paid / months
@@ -211,10 +332,44 @@ class FinancialCalculators:
             monthly_payment=avg_payment,  # Média das parcelas
             total_amount=total_paid,
             total_interest=total_interest,
-            installments=installments
+            installments=ScheduleRows(
+                lambda: sac_schedule(loan_amount, monthly_rate, months),
+                length=months,
+                width=len(SCHEDULE_COLUMNS)
+            )
+        )
+    
+    @staticmethod
+    def _calculate_cents(
+        loan_amount: float,
+        monthly_rate: float,
+        months: int,
+        system: str,
+        rounding: str
+    ) -> LoanResult:
+        """Calcula financiamento em centavos inteiros (PRICE ou SAC)."""
+        kernel = price_schedule_cents if system == 'PRICE' else sac_schedule_cents
+        cents = kernel(loan_amount, monthly_rate, months, rounding)
+        total_paid, financed, total_interest = cents.data[:3].sum(axis=1).tolist()
+        
+        # Parcela fixa no PRICE, média das parcelas no SAC
+        if system == 'PRICE':
+            monthly_payment = int(cents['payment'][0]) / 100
+        else:
+            monthly_payment = total_paid / months / 100
+        
+        return LoanResult(
+            loan_amount=financed / 100,
+            interest_rate=monthly_rate * 12 * 100,
+            months=months,
+            monthly_payment=monthly_payment,
+            total_amount=total_paid / 100,
+            total_interest=total_interest / 100,
+            installments=ScheduleRows(ScheduleTable(cents.data / 100, cents.names))
         )
     
     @staticmethod
+    @calculator_cache.memoize
     def retirement_calculator(
         current_age: int,
         retirement_age: int,
@@ -259,38 +414,532 @@ class FinancialCalculators:
         }
     
     @staticmethod
+    def retirement_monte_carlo(
+        current_age: int,
+        retirement_age: int,
+        monthly_contribution: float,
+        expected_return: float,
+        current_savings: float = 0,
+        volatility: float = 15.0,
+        inflation: float = 0.0,
+        inflation_volatility: float = 0.0,
+        monthly_withdrawal: Optional[float] = None,
+        life_expectancy: int = 85,
+        n_paths: int = 100_000,
+        seed: Optional[int] = None,
+        executor: Optional[BatchExecutor] = None
+    ) -> Dict[str, any]:
+        """Simula a aposentadoria em cenários aleatórios de retorno e inflação.
+        
+        Args:
+            current_age: Idade atual
+            retirement_age: Idade de aposentadoria desejada
+            monthly_contribution: Contribuição mensal
+            expected_return: Retorno esperado (% ao ano)
+            current_savings: Patrimônio atual
+            volatility: Volatilidade anual do retorno (%)
+            inflation: Inflação anual esperada (%)
+            inflation_volatility: Volatilidade anual da inflação (%)
+            monthly_withdrawal: Retirada mensal na aposentadoria; por padrão
+                a renda estimada por ``retirement_calculator`` (regra dos 4%)
+            life_expectancy: Idade até a qual a reserva deve durar
+            n_paths: Número de cenários simulados
+            seed: Semente para resultados reprodutíveis
+            executor: ``BatchExecutor`` para distribuir a simulação entre
+                processos, liberando a thread da interface
+            
+        Returns:
+            Dicionário com percentis da reserva, probabilidade de
+            esgotamento e a simulação completa em 'simulation'
+        """
+        if retirement_age <= current_age:
+            raise ValueError("Idade de aposentadoria deve ser maior que idade atual")
+        if life_expectancy < retirement_age:
+            raise ValueError("Expectativa de vida deve ser maior que idade de aposentadoria")
+        
+        if monthly_withdrawal is None:
+            monthly_withdrawal = FinancialCalculators.retirement_calculator(
+                current_age, retirement_age, monthly_contribution,
+                expected_return, current_savings
+            )['estimated_monthly_income']
+        
+        simulation = simulate_retirement(
+            current_savings=current_savings,
+            monthly_contribution=monthly_contribution,
+            accumulation_months=(retirement_age - current_age) * 12,
+            monthly_withdrawal=monthly_withdrawal,
+            withdrawal_months=(life_expectancy - retirement_age) * 12,
+            expected_return=expected_return,
+            volatility=volatility,
+            inflation=inflation,
+            inflation_volatility=inflation_volatility,
+            n_paths=n_paths,
+            seed=seed,
+            executor=executor
+        )
+        
+        return {
+            'years_until_retirement': retirement_age - current_age,
+            'monthly_withdrawal': monthly_withdrawal,
+            'retirement_fund_p5': simulation.retirement_balance[5],
+            'retirement_fund_p50': simulation.retirement_balance[50],
+            'retirement_fund_p95': simulation.retirement_balance[95],
+            'depletion_probability': simulation.depletion_probability,
+            'simulation': simulation
+        }
+    
+    @staticmethod
+    @calculator_cache.memoize
     def compare_investments(
         amount: float,
         time_months: int,
-        investments: List[Dict[str, any]]
+        investments: List[Dict[str, any]],
+        net: bool = False
     ) -> List[Dict[str, any]]:
         """Compara diferentes opções de investimento.
         
         Args:
             amount: Valor a investir
             time_months: Período em meses
-            investments: Lista de investimentos com 'name' e 'rate'
+            investments: Lista de investimentos com 'name' e 'rate' e,
+                opcionalmente, 'admin_fee', 'custody_fee' (% a.a.) e
+                'tax_exempt'
+            net: Compara valores líquidos de taxas, IOF e IR regressivo
             
         Returns:
             Lista com resultados comparativos
         """
-        results = []
+        if not investments:
+            return []
         
-        for inv in investments:
-            result = FinancialCalculators.compound_interest(
-                principal=amount,
-                rate=inv['rate'],
-                time=time_months
-            )
-            
-            results.append({
-                'name': inv['name'],
-                'rate': inv['rate'],
-                'final_amount': result.final_amount,
-                'total_return': result.total_interest,
-                'return_percentage': (result.total_interest / amount * 100)
-            })
+        cube = FinancialCalculators._investment_grid(
+            amount, [time_months], investments, (0,), net
+        )
         
         # Ordena por retorno
-        results.sort(key=lambda x: x['final_amount'], reverse=True)
-        return results
+        return cube.ranking(time_months).to_dict('records')
+    
+    @staticmethod
+    def compare_investments_grid(
+        amount: float,
+        horizons: Sequence[int],
+        investments: List[Dict[str, any]],
+        contributions: Sequence[float] = (0,),
+        net: bool = False
+    ) -> ScenarioCube:
+        """Compara investimentos em vários prazos e aportes de uma vez.
+        
+        Args:
+            amount: Valor a investir
+            horizons: Períodos em meses
+            investments: Lista de investimentos com 'name' e 'rate' (e as
+                chaves opcionais de ``compare_investments``)
+            contributions: Aportes mensais
+            net: Compara valores líquidos de taxas, IOF e IR regressivo
+            
+        Returns:
+            ScenarioCube de forma (investimentos, prazos, aportes); use
+            ``top_k`` ou ``ranking`` para selecionar os melhores
+        """
+        return FinancialCalculators._investment_grid(
+            amount, horizons, investments, contributions, net
+        )
+    
+    @staticmethod
+    def _investment_grid(
+        amount: float,
+        horizons: Sequence[int],
+        investments: List[Dict[str, any]],
+        contributions: Sequence[float],
+        net: bool
+    ) -> ScenarioCube:
+        """Monta a grade bruta ou líquida a partir da lista de investimentos."""
+        rates = [inv['rate'] for inv in investments]
+        names = [inv['name'] for inv in investments]
+        if not net:
+            return scenario_grid(amount, rates, horizons, contributions, names=names)
+        return net_scenario_grid(
+            amount, rates, horizons, contributions, names=names,
+            admin_fees=[inv.get('admin_fee', 0.0) for inv in investments],
+            custody_fees=[inv.get('custody_fee', 0.0) for inv in investments],
+            tax_exempt=[inv.get('tax_exempt', False) for inv in investments]
+        )
+    
+    @staticmethod
+    def required_contribution(
+        target_amount: float,
+        rate: float,
+        time: int,
+        principal: float = 0
+    ) -> float:
+        """Calcula o aporte mensal que leva ``compound_interest`` à meta.
+        
+        Args:
+            target_amount: Montante desejado
+            rate: Taxa de juros (% ao ano)
+            time: Período em meses
+            principal: Valor inicial
+            
+        Returns:
+            Aporte mensal; zero se o valor inicial já atinge a meta
+        """
+        return goal_seek.required_contribution(target_amount, rate, time, principal)
+    
+    @staticmethod
+    def required_time(
+        target_amount: float,
+        rate: float,
+        contribution: float,
+        principal: float = 0
+    ) -> int:
+        """Calcula o menor período, em meses, para atingir a meta.
+        
+        Args:
+            target_amount: Montante desejado
+            rate: Taxa de juros (% ao ano)
+            contribution: Aporte mensal
+            principal: Valor inicial
+            
+        Returns:
+            Número de meses
+        """
+        return goal_seek.required_months(target_amount, rate, contribution, principal)
+    
+    @staticmethod
+    def implied_rate(
+        target_amount: float,
+        time: int,
+        contribution: float = 0,
+        principal: float = 0
+    ) -> float:
+        """Calcula a taxa anual necessária para atingir a meta.
+        
+        Args:
+            target_amount: Montante desejado
+            time: Período em meses
+            contribution: Aporte mensal
+            principal: Valor inicial
+            
+        Returns:
+            Taxa de juros (% ao ano)
+        """
+        return goal_seek.implied_investment_rate(target_amount, time, contribution, principal)
+    
+    @staticmethod
+    def implied_loan_rate(
+        loan_amount: float,
+        monthly_payment: float,
+        months: int,
+        system: str = 'PRICE'
+    ) -> float:
+        """Calcula a taxa anual que resulta na parcela informada.
+        
+        Args:
+            loan_amount: Valor do empréstimo
+            monthly_payment: Parcela (a primeira, no SAC)
+            months: Número de parcelas
+            system: Sistema de amortização ('PRICE' ou 'SAC')
+            
+        Returns:
+            Taxa de juros anual (%)
+        """
+        return goal_seek.implied_loan_rate(loan_amount, monthly_payment, months, system)
+    
+    @staticmethod
+    def max_loan_amount(
+        monthly_payment: float,
+        annual_rate: float,
+        months: int,
+        system: str = 'PRICE'
+    ) -> float:
+        """Calcula o maior empréstimo cuja parcela cabe no valor informado.
+        
+        Args:
+            monthly_payment: Parcela máxima (a primeira, no SAC)
+            annual_rate: Taxa de juros anual (%)
+            months: Número de parcelas
+            system: Sistema de amortização ('PRICE' ou 'SAC')
+            
+        Returns:
+            Valor máximo do empréstimo
+        """
+        return goal_seek.max_loan_amount(monthly_payment, annual_rate, months, system)
+    
+    @staticmethod
+    def affordability_matrix(
+        monthly_income: float,
+        terms: Sequence[int],
+        annual_rates: Sequence[float],
+        system: str = 'PRICE',
+        max_commitment: float = 30.0,
+        other_obligations: float = 0.0
+    ) -> pd.DataFrame:
+        """Calcula o maior financiamento por prazo e taxa pela regra de comprometimento.
+        
+        Args:
+            monthly_income: Renda mensal bruta
+            terms: Prazos em meses
+            annual_rates: Taxas de juros anuais (%)
+            system: Sistema de amortização ('PRICE' ou 'SAC'; no SAC a
+                primeira parcela limita o valor)
+            max_commitment: Comprometimento máximo da renda (%)
+            other_obligations: Parcelas de outras dívidas
+            
+        Returns:
+            DataFrame prazo × taxa com o valor máximo financiável
+        """
+        return goal_seek.affordability_matrix(
+            monthly_income, terms, annual_rates, system, max_commitment, other_obligations
+        )
+    
+    @staticmethod
+    def prepayment_simulator(
+        loan_amount: float,
+        annual_rate: float,
+        months: int,
+        system: str = 'PRICE',
+        events: Sequence = ()
+    ) -> PrepaymentSimulator:
+        """Cria um simulador de amortizações extraordinárias.
+        
+        Args:
+            loan_amount: Valor do empréstimo
+            annual_rate: Taxa de juros anual (%)
+            months: Número de parcelas
+            system: Sistema de amortização ('PRICE' ou 'SAC')
+            events: Tuplas ``(mês, valor, modo)`` com modo 'reduce_term'
+                ou 'reduce_payment'
+            
+        Returns:
+            PrepaymentSimulator; cada edição de evento recalcula só o sufixo
+            do cronograma
+        """
+        return PrepaymentSimulator(loan_amount, annual_rate, months, system, events)
+    
+    @staticmethod
+    def indexed_loan_calculator(
+        loan_amount: float,
+        annual_rate: float,
+        months: int,
+        index_rates,
+        system: str = 'PRICE',
+        indexation: str = 'balance'
+    ) -> IndexedLoanResult:
+        """Calcula financiamentos indexados (TR, IPCA, CDI) em muitos cenários.
+        
+        Args:
+            loan_amount: Valor do empréstimo
+            annual_rate: Taxa de juros anual (%) além do índice
+            months: Número de parcelas
+            index_rates: Variação mensal do índice (decimal): escalar,
+                trajetória ``(meses,)`` ou cenários ``(cenários, meses)``
+            system: Sistema de amortização ('PRICE' ou 'SAC')
+            indexation: 'balance' (correção do saldo) ou 'rate' (pós-fixado)
+            
+        Returns:
+            IndexedLoanResult com colunas ``(cenários, meses)``
+        """
+        return indexed_schedule(loan_amount, annual_rate, months, index_rates, system, indexation)
+    
+    @staticmethod
+    def post_fixed_investment(
+        amount: float,
+        annual_rate: float,
+        start_date,
+        end_date,
+        percent: float = 100.0,
+        tax_exempt: bool = False
+    ) -> Dict[str, any]:
+        """Projeta CDB, LCI ou Tesouro Selic por dias úteis (base 252).
+        
+        Args:
+            amount: Valor aplicado
+            annual_rate: Taxa anual do CDI ou da Selic (%)
+            start_date: Data de aplicação
+            end_date: Data de resgate
+            percent: Percentual do CDI contratado (ex.: 110)
+            tax_exempt: Produto isento de IR e IOF
+            
+        Returns:
+            Dicionário com dias úteis, valor bruto, IOF, IR e valor líquido;
+            arrays quando as entradas são arrays
+        """
+        return post_fixed_yield(amount, annual_rate, start_date, end_date, percent, tax_exempt)
+    
+    @staticmethod
+    def loan_cet(
+        loan_amounts,
+        annual_rates,
+        months,
+        systems='PRICE',
+        fees=0.0,
+        monthly_insurance=0.0,
+        insurance_rate=0.0,
+        finance_costs: bool = True
+    ) -> CETResult:
+        """Calcula o Custo Efetivo Total (CET) de uma ou várias ofertas.
+        
+        Args:
+            loan_amounts: Valores solicitados (escalar ou array)
+            annual_rates: Taxas de juros nominais anuais (%)
+            months: Números de parcelas
+            systems: Sistemas de amortização ('PRICE' ou 'SAC')
+            fees: Tarifas de contratação (R$)
+            monthly_insurance: Seguro fixo por prestação (R$)
+            insurance_rate: Seguro sobre o saldo devedor (% ao mês)
+            finance_costs: Financia tarifas e IOF em vez de descontá-los
+                do valor liberado
+            
+        Returns:
+            CETResult com CET mensal e anual (%) e a decomposição dos custos
+        """
+        return cet_batch(
+            loan_amounts, annual_rates, months, systems, fees,
+            monthly_insurance, insurance_rate, finance_costs=finance_costs
+        )
+    
+    @staticmethod
+    def debt_payoff_planner(
+        debts: Sequence,
+        monthly_budget: float,
+        strategy: str = 'avalanche',
+        order: Optional[Sequence[str]] = None,
+        max_months: int = 600
+    ) -> DebtPayoffPlan:
+        """Planeja a quitação de várias dívidas com um orçamento mensal.
+        
+        Args:
+            debts: ``Debt`` ou tuplas ``(nome, saldo, taxa anual %, mínimo)``
+            monthly_budget: Valor total pago por mês
+            strategy: 'avalanche' (maior taxa), 'snowball' (menor saldo)
+                ou 'custom'
+            order: Nomes em ordem de prioridade (estratégia 'custom')
+            max_months: Prazo máximo da simulação
+            
+        Returns:
+            DebtPayoffPlan com mês de quitação e juros de cada dívida
+        """
+        return plan_debt_payoff(debts, monthly_budget, strategy, order, max_months)
+    
+    @staticmethod
+    def consorcio_simulator(
+        credit_value: float,
+        months: int,
+        admin_fee: float = 15.0,
+        reserve_fund: float = 2.0,
+        bid: float = 0.0,
+        embedded_bid: float = 0.0,
+        group_size: Optional[int] = None,
+        financing_rate: Optional[float] = None,
+        n_paths: int = 100_000,
+        seed: Optional[int] = None
+    ) -> Dict[str, any]:
+        """Simula uma cota de consórcio e, opcionalmente, o financiamento equivalente.
+        
+        Args:
+            credit_value: Valor da carta de crédito
+            months: Prazo do grupo em meses
+            admin_fee: Taxa de administração total (% do crédito)
+            reserve_fund: Fundo de reserva total (% do crédito)
+            bid: Lance com recursos próprios (% do crédito)
+            embedded_bid: Lance embutido (% do crédito)
+            group_size: Cotas no grupo; padrão de duas contemplações por mês
+            financing_rate: Taxa anual (%) de um financiamento PRICE do mesmo
+                valor e prazo, calculado com ``loan_calculator``
+            n_paths: Número de cenários sorteados
+            seed: Semente para resultados reprodutíveis
+            
+        Returns:
+            Dicionário com parcela, mês esperado e percentis de contemplação
+            e custo, a simulação completa em 'simulation' e, com
+            ``financing_rate``, a parcela e os juros do financiamento
+        """
+        simulation = simulate_consorcio(
+            credit_value, months, admin_fee, reserve_fund, bid, embedded_bid,
+            group_size=group_size, n_paths=n_paths, seed=seed
+        )
+        percentiles = simulation.percentiles()
+        result = {
+            'monthly_installment': simulation.monthly_installment,
+            'expected_contemplation_month': simulation.expected_month,
+            'contemplation_month_p5': percentiles['contemplation_month'][5],
+            'contemplation_month_p50': percentiles['contemplation_month'][50],
+            'contemplation_month_p95': percentiles['contemplation_month'][95],
+            'bid_probability': float(simulation.by_bid.mean()),
+            'total_cost_p50': percentiles['cost_ratio'][50],
+            'annual_cost_p50': percentiles['annual_cost'][50],
+            'simulation': simulation
+        }
+        if financing_rate is not None:
+            loan = FinancialCalculators.loan_calculator(credit_value, financing_rate, months)
+            result['financing_monthly_payment'] = loan.monthly_payment
+            result['financing_total_cost'] = loan.total_interest / credit_value * 100
+        return result
+    
+    @staticmethod
+    def credit_card_debt(
+        balance,
+        monthly_rate,
+        payment_percents=(15.0, 20.0, 30.0, 50.0, 100.0),
+        minimum_payment: float = 50.0,
+        monthly_spending: float = 0.0,
+        interest_cap: bool = True,
+        max_months: int = 360
+    ) -> CardDebtResult:
+        """Projeta a dívida do cartão no rotativo para vários percentuais de pagamento.
+        
+        Args:
+            balance: Valor da fatura atual (escalar ou array)
+            monthly_rate: Juros do rotativo (% ao mês)
+            payment_percents: Percentuais da fatura pagos por mês
+            minimum_payment: Pagamento mínimo em reais
+            monthly_spending: Compras novas somadas a cada fatura
+            interest_cap: Limita juros a 100% da dívida (Lei 14.690/2023)
+            max_months: Horizonte máximo da projeção
+            
+        Returns:
+            CardDebtResult com saldo, pagamentos, juros e IOF por política
+        """
+        return simulate_card_debt(
+            balance, monthly_rate, payment_percents, minimum_payment,
+            monthly_spending, interest_cap=interest_cap, max_months=max_months
+        )
+    
+    @staticmethod
+    def card_installment_plan(
+        balance: float,
+        monthly_rate: float,
+        installments=(3, 6, 10, 12, 18, 24)
+    ) -> pd.DataFrame:
+        """Compara prazos de parcelamento da fatura com juros.
+        
+        Args:
+            balance: Valor da fatura parcelada
+            monthly_rate: Juros do parcelamento (% ao mês)
+            installments: Números de parcelas
+            
+        Returns:
+            DataFrame com parcela, total pago, juros, IOF e CET por prazo
+        """
+        return installment_plan(balance, monthly_rate, installments)
+    
+    @staticmethod
+    def real_values(
+        result,
+        annual_inflation: Optional[float] = None,
+        monthly_inflation: Optional[Sequence[float]] = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """Expressa um resultado já calculado em reais de hoje.
+        
+        Args:
+            result: ``InvestmentResult``, ``LoanResult``, cronograma ou
+                DataFrame
+            annual_inflation: IPCA anual constante (%)
+            monthly_inflation: Série mensal do IPCA (decimal)
+            columns: Colunas a deflacionar; padrão são todas as numéricas
+            
+        Returns:
+            DataFrame com as colunas deflacionadas mês a mês
+        """
+        return real_values(result, annual_inflation, monthly_inflation, columns)
@@ -0,0 +1,347 @@
+"""Motor vetorizado de amortização (PRICE e SAC).
+
+Calcula as colunas do cronograma (parcela, amortização, juros e saldo)
+em forma fechada com NumPy, sem laço mês a mês nem um dicionário por
+parcela. As colunas ficam em um ``ScheduleTable``; as linhas no formato
+legado são geradas sob demanda por ``ScheduleRows``.
+"""
+
+import math
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional
+
+from .results import ScheduleTable
+
+
+SCHEDULE_COLUMNS = ('payment', 'principal', 'interest', 'balance')
+
+
+def price_payment(loan_amount: float, monthly_rate: float, months: int) -> float:
+    """Calcula a parcela fixa do sistema PRICE.
+
+    Args:
+        loan_amount: Valor financiado
+        monthly_rate: Taxa de juros mensal (decimal)
+        months: Número de parcelas
+
+    Returns:
+        Valor da parcela
+    """
+    # Fórmula: PMT = PV * (i * (1+i)^n) / ((1+i)^n - 1)
+    if monthly_rate == 0:
+        return loan_amount / months
+    factor = (1 + monthly_rate) ** months
+    return loan_amount * (monthly_rate * factor) / (factor - 1)
+
+
+def price_schedule(
+    loan_amount: float,
+    monthly_rate: float,
+    months: int,
+    payment: Optional[float] = None
+) -> ScheduleTable:
+    """Gera o cronograma PRICE como colunas ``float64``.
+
+    O saldo após ``k`` parcelas é ``PV*((1+i)^n - (1+i)^k)/((1+i)^n - 1)``,
+    forma que não acumula erro de arredondamento ao longo do prazo; juros
+    e amortização decorrem diretamente do saldo anterior.
+
+    Args:
+        loan_amount: Valor financiado
+        monthly_rate: Taxa de juros mensal (decimal)
+        months: Número de parcelas
+        payment: Parcela já calculada (por exemplo, de uma tabela de
+            fatores); padrão é ``price_payment``
+
+    Returns:
+        ScheduleTable com as colunas 'payment', 'principal', 'interest'
+        e 'balance', cada uma com ``months`` posições
+    """
+    if payment is None:
+        payment = price_payment(loan_amount, monthly_rate, months)
+    table = ScheduleTable.empty(SCHEDULE_COLUMNS, months)
+    data = table.data
+    payments, principal, interest, balance = data[0], data[1], data[2], data[3]
+    elapsed = _periods(months)[1:]
+
+    if monthly_rate == 0:
+        np.multiply(elapsed, -payment, out=balance)
+        balance += loan_amount
+    else:
+        # (1+i)^k para k = 1..n; o saldo final é exatamente zero
+        np.multiply(elapsed, math.log1p(monthly_rate), out=balance)
+        np.exp(balance, out=balance)
+        factor = float(balance[-1])
+        np.subtract(factor, balance, out=balance)
+        balance *= loan_amount / (factor - 1.0)
+    # Evita resíduo negativo por arredondamento na última parcela
+    balance[-1] = 0.0
+
+    _fill_interest(interest, balance, loan_amount, monthly_rate)
+    payments.fill(payment)
+    np.subtract(payment, interest, out=principal)
+    return table
+
+
+def sac_schedule(
+    loan_amount: float,
+    monthly_rate: float,
+    months: int
+) -> ScheduleTable:
+    """Gera o cronograma SAC como colunas ``float64``.
+
+    A amortização é constante, logo o saldo é uma progressão aritmética
+    e os juros são proporcionais ao saldo anterior.
+
+    Args:
+        loan_amount: Valor financiado
+        monthly_rate: Taxa de juros mensal (decimal)
+        months: Número de parcelas
+
+    Returns:
+        ScheduleTable com as colunas 'payment', 'principal', 'interest'
+        e 'balance', cada uma com ``months`` posições
+    """
+    amortization = loan_amount / months
+    table = ScheduleTable.empty(SCHEDULE_COLUMNS, months)
+    data = table.data
+    payments, principal, interest, balance = data[0], data[1], data[2], data[3]
+
+    np.multiply(_periods(months)[1:], -amortization, out=balance)
+    balance += loan_amount
+    # Evita resíduo negativo por arredondamento na última parcela
+    balance[-1] = 0.0
+
+    _fill_interest(interest, balance, loan_amount, monthly_rate)
+    principal.fill(amortization)
+    np.add(interest, amortization, out=payments)
+    return table
+
+
+SCHEDULE_KERNELS = {'PRICE': price_schedule, 'SAC': sac_schedule}
+
+
+def amortization_schedule(
+    loan_amount: float,
+    monthly_rate: float,
+    months: int,
+    system: str = 'PRICE'
+) -> ScheduleTable:
+    """Gera o cronograma do sistema informado.
+
+    Kernel único das calculadoras: cada uma apenas adapta as colunas ao
+    seu formato de saída.
+
+    Args:
+        loan_amount: Valor financiado
+        monthly_rate: Taxa de juros mensal (decimal)
+        months: Número de parcelas
+        system: Sistema de amortização ('PRICE' ou 'SAC')
+
+    Returns:
+        ScheduleTable com as colunas 'payment', 'principal', 'interest'
+        e 'balance'
+    """
+    kernel = SCHEDULE_KERNELS.get(system.upper())
+    if kernel is None:
+        raise ValueError("Sistema deve ser 'PRICE' ou 'SAC'")
+    return kernel(loan_amount, monthly_rate, months)
+
+
+def _fill_interest(
+    interest: np.ndarray,
+    balance: np.ndarray,
+    loan_amount: float,
+    monthly_rate: float
+) -> None:
+    """Preenche os juros de cada mês a partir do saldo do mês anterior."""
+    interest[0] = loan_amount * monthly_rate
+    np.multiply(balance[:-1], monthly_rate, out=interest[1:])
+
+
+@dataclass
+class LoanBatchResult:
+    """Resultado de financiamentos simulados em lote.
+
+    As colunas do cronograma têm forma ``(cenários, maior prazo)``; meses
+    além do prazo de cada cenário ficam zerados e marcados como ``False``
+    em ``mask``.
+    """
+    loan_amount: np.ndarray
+    interest_rate: np.ndarray
+    months: np.ndarray
+    system: np.ndarray
+    monthly_payment: np.ndarray
+    total_amount: np.ndarray
+    total_interest: np.ndarray
+    payment: np.ndarray
+    principal: np.ndarray
+    interest: np.ndarray
+    balance: np.ndarray
+    mask: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.loan_amount)
+
+    def schedule(self, index: int) -> Dict[str, np.ndarray]:
+        """Retorna as colunas do cronograma de um cenário, sem preenchimento.
+
+        Args:
+            index: Posição do cenário no lote
+
+        Returns:
+            Dicionário no mesmo formato de ``price_schedule``/``sac_schedule``
+        """
+        months = int(self.months[index])
+        return {
+            name: getattr(self, name)[index, :months]
+            for name in SCHEDULE_COLUMNS
+        }
+
+    def summary(self) -> pd.DataFrame:
+        """Tabela com os totais de cada cenário."""
+        return pd.DataFrame({
+            'loan_amount': self.loan_amount,
+            'interest_rate': self.interest_rate,
+            'months': self.months,
+            'system': self.system,
+            'monthly_payment': self.monthly_payment,
+            'total_amount': self.total_amount,
+            'total_interest': self.total_interest,
+        })
+
+
+def batch_schedule(
+    loan_amounts,
+    annual_rates,
+    months,
+    systems='PRICE'
+) -> LoanBatchResult:
+    """Simula vários financiamentos de uma só vez.
+
+    Os parâmetros seguem as regras de broadcasting do NumPy, de modo que
+    uma grade "taxa × prazo" pode ser passada como
+    ``annual_rates[:, None]`` e ``months[None, :]``. Cenários com prazos
+    diferentes são preenchidos com zeros até o maior prazo.
+
+    Args:
+        loan_amounts: Valores financiados
+        annual_rates: Taxas de juros anuais (%)
+        months: Números de parcelas
+        systems: Sistemas de amortização ('PRICE' ou 'SAC')
+
+    Returns:
+        LoanBatchResult com um cenário por combinação, em ordem achatada
+    """
+    amounts, rates, terms, names = np.broadcast_arrays(
+        np.asarray(loan_amounts, dtype=np.float64),
+        np.asarray(annual_rates, dtype=np.float64),
+        np.asarray(months),
+        np.char.upper(np.asarray(systems, dtype=str)),
+    )
+    amounts = amounts.ravel()
+    rates = rates.ravel()
+    terms = terms.ravel().astype(np.int64)
+    names = names.ravel()
+
+    if amounts.size == 0:
+        raise ValueError("Nenhum cenário informado")
+    if (amounts <= 0).any() or (rates < 0).any() or (terms <= 0).any():
+        raise ValueError("Parâmetros inválidos")
+    is_price = names == 'PRICE'
+    if not (is_price | (names == 'SAC')).all():
+        raise ValueError("Sistema deve ser 'PRICE' ou 'SAC'")
+
+    monthly_rate = rates / 100 / 12
+    periods = _periods(int(terms.max()))[None, :]
+    n = terms[:, None].astype(np.float64)
+    pv = amounts[:, None]
+    amortization = amounts / terms
+    compound = is_price & (monthly_rate > 0)
+
+    # As operações escrevem direto nos buffers finais (``out``/``where``)
+    # para evitar temporários do tamanho da grade
+    balances = np.empty((amounts.size, periods.shape[1]), dtype=np.float64)
+    linear_rows = _row_selector(~compound)
+    compound_rows = _row_selector(compound)
+
+    # SAC e PRICE com taxa zero: saldo em progressão aritmética
+    if linear_rows is not None:
+        np.multiply(periods, -amortization[:, None], out=balances, where=linear_rows)
+        np.add(balances, pv, out=balances, where=linear_rows)
+
+    payment = amortization.copy()
+    if compound_rows is not None:
+        log_growth = np.log1p(monthly_rate)[:, None]
+        factor = np.exp(n * log_growth)
+        scale = pv / np.where(compound[:, None], factor - 1.0, 1.0)
+        np.multiply(periods, log_growth, out=balances, where=compound_rows)
+        np.exp(balances, out=balances, where=compound_rows)
+        np.subtract(factor, balances, out=balances, where=compound_rows)
+        np.multiply(balances, scale, out=balances, where=compound_rows)
+        payment = np.where(compound, (scale * monthly_rate[:, None] * factor)[:, 0], payment)
+
+    # Saldo nulo a partir da última parcela de cada cenário
+    np.maximum(balances, 0.0, out=balances)
+    np.copyto(balances, 0.0, where=periods >= n)
+
+    mask = periods[:, 1:] <= n
+    interest = balances[:, :-1] * monthly_rate[:, None]
+    installment = np.empty_like(interest)
+    principal = np.empty_like(interest)
+    price_rows = _row_selector(is_price)
+    sac_rows = _row_selector(~is_price)
+    if price_rows is not None:
+        np.copyto(installment, payment[:, None], where=price_rows)
+        np.subtract(payment[:, None], interest, out=principal, where=price_rows)
+    if sac_rows is not None:
+        np.copyto(principal, amortization[:, None], where=sac_rows)
+        np.add(interest, amortization[:, None], out=installment, where=sac_rows)
+    np.copyto(installment, 0.0, where=~mask)
+    np.copyto(principal, 0.0, where=~mask)
+
+    # Totais em forma fechada, como em FinancialCalculators
+    total_amount = np.where(
+        is_price,
+        payment * terms,
+        amounts + amounts * monthly_rate * (terms + 1) / 2
+    )
+
+    return LoanBatchResult(
+        loan_amount=amounts,
+        interest_rate=rates,
+        months=terms,
+        system=names,
+        monthly_payment=np.where(is_price, payment, total_amount / terms),
+        total_amount=total_amount,
+        total_interest=total_amount - amounts,
+        payment=installment,
+        principal=principal,
+        interest=interest,
+        balance=balances[:, 1:],
+        mask=mask,
+    )
+
+
+def _row_selector(rows: np.ndarray):
+    """Converte uma máscara de cenários no argumento ``where`` dos ufuncs.
+
+    Retorna ``None`` se nenhum cenário for selecionado e ``True`` se todos
+    forem, evitando a máscara completa no caso mais comum.
+    """
+    if not rows.any():
+        return None
+    if rows.all():
+        return True
+    return rows[:, None]
+
+
+@lru_cache(maxsize=1024)
+def _periods(months: int) -> np.ndarray:
+    """Retorna ``[0, 1, ..., months]`` somente leitura, reaproveitado entre chamadas."""
+    periods = np.arange(months + 1, dtype=np.float64)
+    periods.flags.writeable = False
+    return periods
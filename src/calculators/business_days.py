@@ -0,0 +1,249 @@
+"""Calendário de dias úteis para rendimentos diários (CDI, Selic), base 252.
+
+Os feriados nacionais são gerados por regra (datas fixas e móveis a partir
+da Páscoa) e guardados em um array ordenado com apenas os que caem em dias
+de semana. A contagem de dias úteis entre duas datas é o número de dias de
+semana, em forma fechada, menos os feriados no intervalo, obtidos com duas
+buscas binárias (``searchsorted``); tudo vetorizado sobre arrays de datas.
+
+Produtos atrelados ao CDI ou à Selic rendem por dia útil:
+    fator = (1 + taxa)^(du/252)
+e, para um percentual do CDI ``p``, o fator diário é
+``1 + p * ((1 + taxa)^(1/252) - 1)``.
+"""
+
+import numpy as np
+from datetime import date, timedelta
+from typing import Dict, Tuple, Union
+
+from .taxes import tax_on_gain
+
+ArrayLike = Union[float, np.ndarray]
+
+BUSINESS_DAYS_PER_YEAR = 252
+CALENDAR_YEARS = (2000, 2099)
+
+# Feriados nacionais de data fixa (mês, dia)
+FIXED_HOLIDAYS = (
+    (1, 1),    # Confraternização Universal
+    (4, 21),   # Tiradentes
+    (5, 1),    # Dia do Trabalho
+    (9, 7),    # Independência
+    (10, 12),  # Nossa Senhora Aparecida
+    (11, 2),   # Finados
+    (11, 15),  # Proclamação da República
+    (12, 25),  # Natal
+)
+
+# Feriados móveis: dias em relação ao domingo de Páscoa
+EASTER_OFFSETS = (
+    -48,  # Segunda-feira de Carnaval
+    -47,  # Terça-feira de Carnaval
+    -2,   # Sexta-feira Santa
+    60,   # Corpus Christi
+)
+
+# Dia Nacional de Zumbi e da Consciência Negra (Lei 14.759/2023)
+BLACK_CONSCIOUSNESS_DAY = (11, 20)
+BLACK_CONSCIOUSNESS_SINCE = 2024
+
+
+def easter_sunday(year: int) -> date:
+    """Domingo de Páscoa pelo algoritmo gregoriano anônimo."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def brazilian_holidays(first_year: int, last_year: int) -> np.ndarray:
+    """Feriados nacionais (inclusive os de fim de semana) entre dois anos.
+
+    Args:
+        first_year: Primeiro ano
+        last_year: Último ano (inclusive)
+
+    Returns:
+        Array ``datetime64[D]`` ordenado e sem repetições
+    """
+    holidays = []
+    for year in range(first_year, last_year + 1):
+        holidays.extend(date(year, month, day) for month, day in FIXED_HOLIDAYS)
+        easter = easter_sunday(year)
+        holidays.extend(easter + timedelta(days=offset) for offset in EASTER_OFFSETS)
+        if year >= BLACK_CONSCIOUSNESS_SINCE:
+            holidays.append(date(year, *BLACK_CONSCIOUSNESS_DAY))
+    return np.unique(np.array(holidays, dtype='datetime64[D]'))
+
+
+def _build_holiday_days() -> np.ndarray:
+    """Feriados em dias de semana, como dias desde 1970-01-01."""
+    holidays = brazilian_holidays(*CALENDAR_YEARS)
+    holidays = holidays[np.is_busday(holidays)]
+    days = holidays.astype(np.int64)
+    days.flags.writeable = False
+    return days
+
+
+_HOLIDAY_DAYS = _build_holiday_days()
+HOLIDAYS = _HOLIDAY_DAYS.astype('datetime64[D]')
+HOLIDAYS.flags.writeable = False
+_FIRST_DAY = np.datetime64(f'{CALENDAR_YEARS[0]}-01-01', 'D').astype(np.int64)
+_LAST_DAY = np.datetime64(f'{CALENDAR_YEARS[1] + 1}-01-01', 'D').astype(np.int64)
+
+
+def business_days_between(start, end) -> np.ndarray:
+    """Conta os dias úteis no intervalo ``[start, end)``.
+
+    Args:
+        start: Data(s) inicial(is) (``date``, ``datetime64`` ou texto ISO)
+        end: Data(s) final(is); negativo se anterior ao início
+
+    Returns:
+        Número de dias úteis (array com a forma das datas combinadas)
+    """
+    start, end = _as_days(start), _as_days(end)
+    return _business_days_before(end) - _business_days_before(start)
+
+
+def is_business_day(dates) -> np.ndarray:
+    """Indica se cada data é dia útil (dia de semana e não feriado)."""
+    days = _as_days(dates)
+    position = np.searchsorted(_HOLIDAY_DAYS, days)
+    holiday = _HOLIDAY_DAYS[np.minimum(position, len(_HOLIDAY_DAYS) - 1)] == days
+    return ((days + 3) % 7 < 5) & ~holiday
+
+
+def business_days(start, end) -> np.ndarray:
+    """Lista os dias úteis do intervalo ``[start, end)`` (``datetime64[D]``)."""
+    first, last = int(_as_days(start)), int(_as_days(end))
+    days = np.arange(first, max(last, first), dtype=np.int64)
+    return days[is_business_day(days.astype('datetime64[D]'))].astype('datetime64[D]')
+
+
+def daily_rate(annual_rate: ArrayLike, percent: ArrayLike = 100.0) -> np.ndarray:
+    """Taxa diária (decimal) de ``percent``% de uma taxa anual base 252.
+
+    Args:
+        annual_rate: Taxa anual (%), como o CDI ou a Selic
+        percent: Percentual da taxa contratado (110 = 110% do CDI)
+    """
+    rate = np.asarray(annual_rate, dtype=np.float64)
+    if (rate <= -100).any():
+        raise ValueError("Taxa deve ser maior que -100%")
+    base = np.expm1(np.log1p(rate / 100) / BUSINESS_DAYS_PER_YEAR)
+    return base * (np.asarray(percent, dtype=np.float64) / 100)
+
+
+def accrual_factor(
+    annual_rate: ArrayLike,
+    start,
+    end,
+    percent: ArrayLike = 100.0
+) -> np.ndarray:
+    """Fator de rendimento entre duas datas com taxa anual constante.
+
+    Args:
+        annual_rate: Taxa anual (%) base 252
+        start: Data(s) de aplicação
+        end: Data(s) de resgate
+        percent: Percentual da taxa contratado
+
+    Returns:
+        ``(1 + taxa diária)^du``, vetorizado sobre taxas e datas
+    """
+    count = business_days_between(start, end)
+    return np.exp(count * np.log1p(daily_rate(annual_rate, percent)))
+
+
+def accrual_curve(
+    annual_rates: ArrayLike,
+    start,
+    end,
+    percent: ArrayLike = 100.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Fator acumulado ao fim de cada dia útil do intervalo.
+
+    Args:
+        annual_rates: Taxa anual (%) constante ou uma por dia útil
+            (série histórica do CDI), com forma ``(..., dias úteis)``
+        start: Data de aplicação
+        end: Data de resgate
+        percent: Percentual da taxa contratado
+
+    Returns:
+        Tupla (dias úteis, fator acumulado após cada um)
+    """
+    days = business_days(start, end)
+    rates = np.asarray(annual_rates, dtype=np.float64)
+    if rates.ndim and rates.shape[-1] != days.size:
+        raise ValueError("Número de taxas difere do número de dias úteis")
+    daily = np.broadcast_to(daily_rate(rates, percent), rates.shape[:-1] + days.shape)
+    return days, np.cumprod(1.0 + daily, axis=-1)
+
+
+def post_fixed_yield(
+    amount: ArrayLike,
+    annual_rate: ArrayLike,
+    start,
+    end,
+    percent: ArrayLike = 100.0,
+    tax_exempt: bool = False
+) -> Dict[str, np.ndarray]:
+    """Projeta uma aplicação pós-fixada (CDB, LCI, Tesouro Selic) até o resgate.
+
+    O rendimento corre por dia útil; IOF e IR usam os dias corridos.
+
+    Args:
+        amount: Valor aplicado
+        annual_rate: Taxa anual (%) do CDI ou da Selic
+        start: Data de aplicação
+        end: Data de resgate
+        percent: Percentual da taxa contratado
+        tax_exempt: Produto isento de IR e IOF
+
+    Returns:
+        Dicionário com dias úteis, dias corridos, valor bruto, IOF, IR e
+        valor líquido
+    """
+    amount = np.asarray(amount, dtype=np.float64)
+    if (amount <= 0).any():
+        raise ValueError("Valor aplicado deve ser positivo")
+    count = business_days_between(start, end)
+    calendar_days = _as_days(end) - _as_days(start)
+    if (calendar_days < 0).any():
+        raise ValueError("Data de resgate anterior à aplicação")
+    gross_amount = amount * accrual_factor(annual_rate, start, end, percent)
+    iof, income_tax = tax_on_gain(gross_amount - amount, calendar_days, tax_exempt)
+    return {
+        'business_days': count,
+        'calendar_days': calendar_days,
+        'gross_amount': gross_amount,
+        'iof': iof,
+        'income_tax': income_tax,
+        'net_amount': gross_amount - iof - income_tax,
+    }
+
+
+def _as_days(dates) -> np.ndarray:
+    """Converte datas em dias desde 1970-01-01, validando o calendário."""
+    days = np.asarray(dates, dtype='datetime64[D]').astype(np.int64)
+    if (days < _FIRST_DAY).any() or (days > _LAST_DAY).any():
+        raise ValueError(
+            f"Data fora do calendário de feriados ({CALENDAR_YEARS[0]} a {CALENDAR_YEARS[1]})"
+        )
+    return days
+
+
+def _business_days_before(days: np.ndarray) -> np.ndarray:
+    """Dias úteis desde a segunda-feira 1969-12-29 até a data (exclusive)."""
+    weeks, rest = np.divmod(days + 3, 7)
+    weekdays = weeks * 5 + np.minimum(rest, 5)
+    return weekdays - np.searchsorted(_HOLIDAY_DAYS, days)
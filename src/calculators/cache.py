@@ -0,0 +1,255 @@
+"""Cache de memoização compartilhado pelas calculadoras.
+
+O Streamlit reexecuta o script a cada interação, repetindo cálculos com
+os mesmos parâmetros. Este módulo mantém um cache LRU limitado por bytes,
+seguro para uso entre sessões de um mesmo processo.
+
+Os resultados em cache são compartilhados entre sessões: dicionários,
+listas e dataclasses mutáveis são devolvidos como cópia; os resultados
+congelados e seus cronogramas são somente leitura.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass, replace
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import numpy as np
+
+from .results import ScheduleRows, ScheduleTable
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_FLOAT_DIGITS = 8
+
+
+def normalize_key(value: Any, digits: int = DEFAULT_FLOAT_DIGITS) -> Hashable:
+    """Converte argumentos em uma chave hashable e estável.
+
+    Números são arredondados para ``digits`` casas (``1000`` e ``1000.0``
+    geram a mesma chave), textos e coleções são convertidos recursivamente
+    e arrays são identificados por forma, tipo e conteúdo.
+
+    Args:
+        value: Valor a normalizar
+        digits: Casas decimais preservadas em números
+
+    Returns:
+        Chave hashable equivalente
+    """
+    kind = type(value)
+    # Caminho rápido para os argumentos mais comuns das calculadoras
+    if kind is float or kind is int:
+        return round(float(value), digits) + 0.0  # Evita distinguir -0.0
+    if kind is str or value is None or kind is bool:
+        return value
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return round(float(value), digits) + 0.0
+    if isinstance(value, dict):
+        return tuple(sorted(
+            (str(key), normalize_key(item, digits)) for key, item in value.items()
+        ))
+    if isinstance(value, (list, tuple)):
+        return tuple([normalize_key(item, digits) for item in value])
+    if isinstance(value, np.ndarray):
+        data = np.round(value, digits) if value.dtype.kind == 'f' else value
+        return (value.shape, value.dtype.str, np.ascontiguousarray(data).tobytes())
+    return value
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Estima a memória ocupada por um resultado de calculadora.
+
+    Cronogramas adiados contam o tamanho que terão depois de gerados.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, ScheduleTable):
+        return value.data.nbytes
+    if isinstance(value, ScheduleRows):
+        return sys.getsizeof(value) + value.nbytes
+    if is_dataclass(value):
+        return sys.getsizeof(value) + sum(
+            estimate_nbytes(getattr(value, field.name)) for field in fields(value)
+        )
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_nbytes(key) + estimate_nbytes(item) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class CalculatorCache:
+    """Cache LRU thread-safe com orçamento em bytes.
+
+    Example:
+        >>> cache = CalculatorCache(max_bytes=1024 * 1024)
+        >>> @cache.memoize
+        ... def dobro(valor):
+        ...     return valor * 2
+        >>> dobro(2.0), dobro(2), cache.stats()['hits']
+        (4.0, 4.0, 1)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        float_digits: int = DEFAULT_FLOAT_DIGITS
+    ):
+        """Inicializa o cache.
+
+        Args:
+            max_bytes: Orçamento de memória; entradas menos usadas são
+                descartadas ao ultrapassá-lo
+            float_digits: Casas decimais usadas na normalização das chaves
+        """
+        if max_bytes < 0:
+            raise ValueError("Orçamento de memória deve ser positivo")
+        self.max_bytes = max_bytes
+        self.float_digits = float_digits
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.RLock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def make_key(self, name: str, args: tuple, kwargs: Dict[str, Any]) -> Hashable:
+        """Monta a chave de uma chamada.
+
+        Argumentos posicionais e nomeados geram chaves distintas; a ordem
+        dos argumentos nomeados é irrelevante.
+        """
+        digits = self.float_digits
+        key = [name]
+        key.extend([normalize_key(arg, digits) for arg in args])
+        if kwargs:
+            for arg_name in sorted(kwargs):
+                key.append(arg_name)
+                key.append(normalize_key(kwargs[arg_name], digits))
+        return tuple(key)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Obtém uma entrada, marcando-a como usada recentemente."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Armazena uma entrada e descarta as menos usadas se necessário."""
+        size = estimate_nbytes(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def memoize(self, func: Callable) -> Callable:
+        """Decorador que memoiza ``func`` neste cache.
+
+        Exceções não são armazenadas. Em chamadas simultâneas com a mesma
+        chave o cálculo pode ocorrer mais de uma vez; o último resultado
+        prevalece.
+        """
+        name = f"{func.__module__}.{func.__qualname__}"
+        missing = object()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = self.make_key(name, args, kwargs)
+            value = self.get(key, missing)
+            if value is missing:
+                value = func(*args, **kwargs)
+                self.put(key, value)
+            return _detach(value)
+
+        wrapper.cache = self
+        return wrapper
+
+    def clear(self) -> None:
+        """Remove todas as entradas e zera as estatísticas."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Retorna estatísticas de uso do cache.
+
+        Returns:
+            Dicionário com acertos, falhas, descartes, entradas, bytes
+            ocupados e taxa de acerto
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (f"CalculatorCache(entries={len(self._entries)}, "
+                f"bytes={self._bytes}, max_bytes={self.max_bytes})")
+
+
+_MUTABLE = (dict, list)
+
+
+def _detach(value: Any) -> Any:
+    """Copia contêineres mutáveis antes de devolvê-los ao chamador.
+
+    Dicionários, listas e dataclasses não congeladas são copiados
+    recursivamente; dataclasses congeladas, arrays e escalares são
+    devolvidos como estão.
+    """
+    if isinstance(value, dict):
+        return {key: _detach(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_detach(item) if isinstance(item, _MUTABLE) else item for item in value]
+    if (is_dataclass(value) and not isinstance(value, type)
+            and not value.__dataclass_params__.frozen):
+        return replace(value, **{
+            field.name: _detach(getattr(value, field.name))
+            for field in fields(value) if field.init
+        })
+    return value
+
+
+def _max_bytes_from_env(default: int = DEFAULT_MAX_BYTES) -> int:
+    """Lê o orçamento do cache de ``CALCULATOR_CACHE_MAX_BYTES``."""
+    value: Optional[str] = os.getenv('CALCULATOR_CACHE_MAX_BYTES')
+    try:
+        return int(value) if value else default
+    except ValueError:
+        return default
+
+
+# Instância compartilhada por todas as sessões do processo
+calculator_cache = CalculatorCache(max_bytes=_max_bytes_from_env())
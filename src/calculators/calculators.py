@@ -5,10 +5,30 @@ Implementa cálculos de financiamento, investimento e planejamento financeiro.
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+from .amortization import amortization_schedule
+from .business_days import post_fixed_yield
+from .cache import calculator_cache
+from .cashflow import irr, npv, xirr
+from .cet import cet_batch
+from .consorcio import simulate_consorcio
+from .credit_card import installment_plan, simulate_card_debt
+from .debt_payoff import DebtPayoffPlan, plan_debt_payoff
+from .goal_seek import (
+    affordability_matrix,
+    implied_investment_rate,
+    max_loan_amount,
+    required_contribution,
+    required_months,
+)
+from .indexed import IndexedLoanResult, indexed_schedule
+from .inflation import real_values
+from .monte_carlo import simulate_retirement
+from .prepayment import PrepaymentSimulator
+
 
 @dataclass
 class ResultadoFinanciamento:
@@ -31,12 +51,35 @@ class ResultadoInvestimento:
     evolucao_mensal: List[Dict[str, float]]
 
 
+def _resultado_financiamento(
+    valor_financiado: float,
+    taxa_mensal: float,
+    prazo: int,
+    sistema: str
+) -> ResultadoFinanciamento:
+    """Adapta o cronograma do kernel de amortização ao formato em listas."""
+    tabela = amortization_schedule(valor_financiado, taxa_mensal, prazo, sistema)
+    parcelas, amortizacoes, juros_parcela, saldo_devedor = tabela.data.tolist()
+    total_pago, _, total_juros, _ = tabela.data.sum(axis=1).tolist()
+
+    return ResultadoFinanciamento(
+        valor_financiado=valor_financiado,
+        parcelas=parcelas,
+        total_juros=total_juros,
+        total_pago=total_pago,
+        amortizacoes=amortizacoes,
+        juros_parcela=juros_parcela,
+        saldo_devedor=saldo_devedor
+    )
+
+
 class FinancialCalculators:
     """
     Classe para cálculos financeiros diversos.
     """
 
     @staticmethod
+    @calculator_cache.memoize
     def calcular_financiamento_sac(
         valor: float,
         entrada: float,
@@ -62,39 +105,10 @@ class FinancialCalculators:
             raise ValueError("Entrada não pode ser maior ou igual ao valor total")
 
         valor_financiado = valor - entrada
-        taxa_mensal = taxa / 100 / 12
-        amortizacao = valor_financiado / prazo
-
-        parcelas = []
-        juros_parcela = []
-        saldo_devedor = []
-        amortizacoes = []
-        saldo_atual = valor_financiado
-
-        for i in range(prazo):
-            juros = saldo_atual * taxa_mensal
-            parcela = amortizacao + juros
-            
-            parcelas.append(parcela)
-            juros_parcela.append(juros)
-            amortizacoes.append(amortizacao)
-            saldo_atual -= amortizacao
-            saldo_devedor.append(max(0, saldo_atual))
-
-        total_pago = sum(parcelas)
-        total_juros = sum(juros_parcela)
-
-        return ResultadoFinanciamento(
-            valor_financiado=valor_financiado,
-            parcelas=parcelas,
-            total_juros=total_juros,
-            total_pago=total_pago,
-            amortizacoes=amortizacoes,
-            juros_parcela=juros_parcela,
-            saldo_devedor=saldo_devedor
-        )
+        return _resultado_financiamento(valor_financiado, taxa / 100 / 12, prazo, 'SAC')
 
     @staticmethod
+    @calculator_cache.memoize
     def calcular_financiamento_price(
         valor: float,
         entrada: float,
@@ -120,46 +134,10 @@ class FinancialCalculators:
             raise ValueError("Entrada não pode ser maior ou igual ao valor total")
 
         valor_financiado = valor - entrada
-        taxa_mensal = taxa / 100 / 12
-
-        # Fórmula da Tabela Price
-        if taxa_mensal > 0:
-            parcela_fixa = valor_financiado * (
-                taxa_mensal * (1 + taxa_mensal) ** prazo
-            ) / ((1 + taxa_mensal) ** prazo - 1)
-        else:
-            parcela_fixa = valor_financiado / prazo
-
-        parcelas = []
-        juros_parcela = []
-        amortizacoes = []
-        saldo_devedor = []
-        saldo_atual = valor_financiado
-
-        for i in range(prazo):
-            juros = saldo_atual * taxa_mensal
-            amortizacao = parcela_fixa - juros
-            
-            parcelas.append(parcela_fixa)
-            juros_parcela.append(juros)
-            amortizacoes.append(amortizacao)
-            saldo_atual -= amortizacao
-            saldo_devedor.append(max(0, saldo_atual))
-
-        total_pago = sum(parcelas)
-        total_juros = sum(juros_parcela)
-
-        return ResultadoFinanciamento(
-            valor_financiado=valor_financiado,
-            parcelas=parcelas,
-            total_juros=total_juros,
-            total_pago=total_pago,
-            amortizacoes=amortizacoes,
-            juros_parcela=juros_parcela,
-            saldo_devedor=saldo_devedor
-        )
+        return _resultado_financiamento(valor_financiado, taxa / 100 / 12, prazo, 'PRICE')
 
     @staticmethod
+    @calculator_cache.memoize
     def calcular_investimento(
         valor_inicial: float,
         aporte_mensal: float,
@@ -243,6 +221,7 @@ class FinancialCalculators:
             return montante_principal + montante_aportes
 
     @staticmethod
+    @calculator_cache.memoize
     def calcular_aposentadoria(
         idade_atual: int,
         idade_aposentadoria: int,
@@ -307,6 +286,74 @@ class FinancialCalculators:
             'taxa_real': taxa_real
         }
 
+    @staticmethod
+    def calcular_aposentadoria_monte_carlo(
+        idade_atual: int,
+        idade_aposentadoria: int,
+        renda_desejada: float,
+        valor_atual: float = 0,
+        taxa_rendimento: float = 8.0,
+        taxa_inflacao: float = 4.0,
+        expectativa_vida: int = 85,
+        volatilidade: float = 15.0,
+        volatilidade_inflacao: float = 1.0,
+        aporte_mensal: Optional[float] = None,
+        n_cenarios: int = 100_000,
+        semente: Optional[int] = None
+    ) -> Dict:
+        """
+        Avalia o plano de aposentadoria em cenários aleatórios (Monte Carlo).
+
+        Args:
+            idade_atual: Idade atual
+            idade_aposentadoria: Idade planejada para aposentar
+            renda_desejada: Renda mensal desejada na aposentadoria (valores de hoje)
+            valor_atual: Valor já acumulado
+            taxa_rendimento: Taxa de rendimento anual esperada
+            taxa_inflacao: Taxa de inflação anual esperada
+            expectativa_vida: Expectativa de vida
+            volatilidade: Volatilidade anual do rendimento (%)
+            volatilidade_inflacao: Volatilidade anual da inflação (%)
+            aporte_mensal: Aporte mensal; por padrão o necessário segundo
+                calcular_aposentadoria
+            n_cenarios: Número de cenários simulados
+            semente: Semente para resultados reprodutíveis
+
+        Returns:
+            Dict com o plano determinístico, percentis do montante
+            acumulado e probabilidade de esgotamento
+        """
+        plano = FinancialCalculators.calcular_aposentadoria(
+            idade_atual, idade_aposentadoria, renda_desejada, valor_atual,
+            taxa_rendimento, taxa_inflacao, expectativa_vida
+        )
+        if aporte_mensal is None:
+            aporte_mensal = plano['aporte_mensal_necessario']
+
+        simulacao = simulate_retirement(
+            current_savings=valor_atual,
+            monthly_contribution=aporte_mensal,
+            accumulation_months=plano['anos_ate_aposentar'] * 12,
+            monthly_withdrawal=renda_desejada,
+            withdrawal_months=plano['anos_aposentado'] * 12,
+            expected_return=taxa_rendimento,
+            volatility=volatilidade,
+            inflation=taxa_inflacao,
+            inflation_volatility=volatilidade_inflacao,
+            n_paths=n_cenarios,
+            seed=semente
+        )
+
+        return {
+            **plano,
+            'aporte_mensal_simulado': aporte_mensal,
+            'montante_p5': simulacao.retirement_balance[5],
+            'montante_p50': simulacao.retirement_balance[50],
+            'montante_p95': simulacao.retirement_balance[95],
+            'probabilidade_esgotamento': simulacao.depletion_probability,
+            'simulacao': simulacao
+        }
+
     @staticmethod
     def calcular_valor_presente(
         valor_futuro: float,
@@ -356,11 +403,29 @@ class FinancialCalculators:
 
         Args:
             fluxos: Lista de fluxos de caixa (primeiro deve ser negativo)
+                ou lote de listas, uma por projeto
 
         Returns:
-            TIR em percentual
+            TIR em percentual (array para lotes); ``nan`` se não existir
         """
-        return np.irr(fluxos) * 100
+        return irr(fluxos) * 100
+
+    @staticmethod
+    def calcular_xtir(
+        fluxos: List[float],
+        datas: List
+    ) -> float:
+        """
+        Calcula a TIR anual de fluxos em datas irregulares.
+
+        Args:
+            fluxos: Lista de fluxos de caixa ou lote de listas
+            datas: Data de cada fluxo (``date``, ``datetime`` ou texto ISO)
+
+        Returns:
+            TIR anual em percentual (base 365 dias)
+        """
+        return xirr(fluxos, datas) * 100
 
     @staticmethod
     def calcular_vpl(
@@ -371,11 +436,410 @@ class FinancialCalculators:
         Calcula o Valor Presente Líquido (VPL).
 
         Args:
-            fluxos: Lista de fluxos de caixa
+            fluxos: Lista de fluxos de caixa ou lote de listas
             taxa: Taxa de desconto (anual em percentual)
 
         Returns:
-            VPL
+            VPL (array para lotes)
         """
-        taxa_decimal = taxa / 100
-        return np.npv(taxa_decimal, fluxos)
\ No newline at end of file
+        taxa_decimal = np.asarray(taxa, dtype=float) / 100
+        return npv(taxa_decimal, fluxos)
+
+    @staticmethod
+    def calcular_aporte_necessario(
+        valor_objetivo: float,
+        taxa: float,
+        prazo: int,
+        valor_inicial: float = 0
+    ) -> float:
+        """
+        Calcula o aporte mensal necessário para atingir um valor.
+
+        Segue a convenção de ``calcular_investimento`` (aporte em todos os
+        meses, inclusive o último).
+
+        Args:
+            valor_objetivo: Montante desejado
+            taxa: Taxa de rendimento anual em percentual
+            prazo: Prazo em meses
+            valor_inicial: Valor inicial investido
+
+        Returns:
+            Aporte mensal
+        """
+        return required_contribution(
+            valor_objetivo, taxa, prazo, valor_inicial, contribute_last_month=True
+        )
+
+    @staticmethod
+    def calcular_prazo_necessario(
+        valor_objetivo: float,
+        taxa: float,
+        aporte_mensal: float,
+        valor_inicial: float = 0
+    ) -> int:
+        """
+        Calcula o menor prazo, em meses, para atingir um valor.
+
+        Args:
+            valor_objetivo: Montante desejado
+            taxa: Taxa de rendimento anual em percentual
+            aporte_mensal: Valor de aporte mensal
+            valor_inicial: Valor inicial investido
+
+        Returns:
+            Prazo em meses
+        """
+        return required_months(
+            valor_objetivo, taxa, aporte_mensal, valor_inicial, contribute_last_month=True
+        )
+
+    @staticmethod
+    def calcular_taxa_necessaria(
+        valor_objetivo: float,
+        prazo: int,
+        aporte_mensal: float = 0,
+        valor_inicial: float = 0
+    ) -> float:
+        """
+        Calcula a taxa anual necessária para atingir um valor.
+
+        Args:
+            valor_objetivo: Montante desejado
+            prazo: Prazo em meses
+            aporte_mensal: Valor de aporte mensal
+            valor_inicial: Valor inicial investido
+
+        Returns:
+            Taxa de rendimento anual em percentual
+        """
+        return implied_investment_rate(
+            valor_objetivo, prazo, aporte_mensal, valor_inicial, contribute_last_month=True
+        )
+
+    @staticmethod
+    def calcular_valor_maximo_financiamento(
+        parcela_maxima: float,
+        taxa: float,
+        prazo: int,
+        sistema: str = 'PRICE'
+    ) -> float:
+        """
+        Calcula o maior valor financiável com a parcela informada.
+
+        Args:
+            parcela_maxima: Parcela máxima (a primeira, no SAC)
+            taxa: Taxa de juros anual em percentual
+            prazo: Prazo em meses
+            sistema: Sistema de amortização ('PRICE' ou 'SAC')
+
+        Returns:
+            Valor máximo financiado (sem a entrada)
+        """
+        return max_loan_amount(parcela_maxima, taxa, prazo, sistema)
+
+    @staticmethod
+    def calcular_capacidade_financiamento(
+        renda_mensal: float,
+        prazos: Iterable[int],
+        taxas: Iterable[float],
+        sistema: str = 'SAC',
+        comprometimento_maximo: float = 30.0,
+        outras_dividas: float = 0.0
+    ) -> pd.DataFrame:
+        """
+        Calcula o maior financiamento para cada prazo e taxa (pré-aprovação).
+
+        Args:
+            renda_mensal: Renda mensal bruta
+            prazos: Prazos em meses
+            taxas: Taxas de juros anuais em percentual
+            sistema: Sistema de amortização ('PRICE' ou 'SAC')
+            comprometimento_maximo: Parte máxima da renda para a parcela (%)
+            outras_dividas: Parcelas de outras dívidas já assumidas
+
+        Returns:
+            DataFrame com os prazos nas linhas, as taxas nas colunas e o
+            valor máximo financiado (sem a entrada)
+        """
+        return affordability_matrix(
+            renda_mensal, list(prazos), list(taxas), sistema,
+            comprometimento_maximo, outras_dividas
+        )
+
+    @staticmethod
+    def simular_amortizacao_extraordinaria(
+        valor: float,
+        entrada: float,
+        prazo: int,
+        taxa: float,
+        eventos: Iterable = (),
+        sistema: str = 'PRICE'
+    ) -> PrepaymentSimulator:
+        """
+        Simula pagamentos extras, reduzindo o prazo ou a parcela.
+
+        Args:
+            valor: Valor total do bem
+            entrada: Valor da entrada
+            prazo: Prazo em meses
+            taxa: Taxa de juros anual em percentual
+            eventos: Tuplas ``(mês, valor, modo)`` com modo 'reduce_term'
+                ou 'reduce_payment'
+            sistema: Sistema de amortização ('PRICE' ou 'SAC')
+
+        Returns:
+            PrepaymentSimulator; novas edições recalculam só o sufixo
+        """
+        if entrada >= valor:
+            raise ValueError("Entrada não pode ser maior ou igual ao valor total")
+        return PrepaymentSimulator(valor - entrada, taxa, prazo, sistema, eventos)
+
+    @staticmethod
+    def calcular_financiamento_indexado(
+        valor: float,
+        entrada: float,
+        prazo: int,
+        taxa: float,
+        indice,
+        sistema: str = 'PRICE',
+        indexacao: str = 'balance'
+    ) -> IndexedLoanResult:
+        """
+        Calcula financiamento indexado (ex.: 9,5% a.a. + TR) em vários cenários.
+
+        Args:
+            valor: Valor total do bem
+            entrada: Valor da entrada
+            prazo: Prazo em meses
+            taxa: Taxa de juros anual em percentual, além do índice
+            indice: Variação mensal do índice (decimal): escalar, trajetória
+                ou matriz ``(cenários, meses)``
+            sistema: Sistema de amortização ('PRICE' ou 'SAC')
+            indexacao: 'balance' (correção do saldo, TR/IPCA) ou 'rate'
+                (taxa pós-fixada, CDI)
+
+        Returns:
+            IndexedLoanResult com um cronograma por cenário
+        """
+        if entrada >= valor:
+            raise ValueError("Entrada não pode ser maior ou igual ao valor total")
+        return indexed_schedule(valor - entrada, taxa, prazo, indice, sistema, indexacao)
+
+    @staticmethod
+    def calcular_rendimento_cdi(
+        valor: float,
+        taxa_cdi: float,
+        data_inicio,
+        data_fim,
+        percentual_cdi: float = 100.0,
+        isento: bool = False
+    ) -> Dict:
+        """
+        Calcula o rendimento de uma aplicação atrelada ao CDI ou à Selic.
+
+        Args:
+            valor: Valor aplicado
+            taxa_cdi: Taxa anual do CDI ou da Selic em percentual
+            data_inicio: Data de aplicação
+            data_fim: Data de resgate
+            percentual_cdi: Percentual do CDI contratado (ex.: 110)
+            isento: Produto isento de IR e IOF (LCI, LCA)
+
+        Returns:
+            Dicionário com dias úteis, valor bruto, IOF, IR e valor líquido
+        """
+        return post_fixed_yield(valor, taxa_cdi, data_inicio, data_fim, percentual_cdi, isento)
+
+    @staticmethod
+    def calcular_cet(
+        valor: float,
+        taxa: float,
+        prazo: int,
+        sistema: str = 'PRICE',
+        tarifas: float = 0.0,
+        seguro_mensal: float = 0.0,
+        taxa_seguro: float = 0.0
+    ) -> Dict:
+        """
+        Calcula o Custo Efetivo Total (CET) de um empréstimo.
+
+        Tarifas e IOF são financiados junto com o valor solicitado.
+
+        Args:
+            valor: Valor solicitado
+            taxa: Taxa de juros nominal anual em percentual
+            prazo: Prazo em meses
+            sistema: Sistema de amortização ('PRICE' ou 'SAC')
+            tarifas: Tarifas de contratação (R$)
+            seguro_mensal: Seguro fixo somado a cada prestação (R$)
+            taxa_seguro: Seguro sobre o saldo devedor (% ao mês)
+
+        Returns:
+            Dicionário com valor financiado, IOF, seguro e CET mensal e anual (%)
+        """
+        resultado = cet_batch(valor, taxa, prazo, sistema, tarifas, seguro_mensal, taxa_seguro)
+        return {
+            'valor_financiado': float(resultado.financed_amount[0]),
+            'iof': float(resultado.iof[0]),
+            'tarifas': float(resultado.fees[0]),
+            'seguro': float(resultado.insurance[0]),
+            'primeira_parcela': float(resultado.installments[0, 0]),
+            'cet_mensal': float(resultado.monthly_cet[0]),
+            'cet_anual': float(resultado.annual_cet[0]),
+        }
+
+    @staticmethod
+    def planejar_quitacao_dividas(
+        dividas: Iterable,
+        orcamento_mensal: float,
+        estrategia: str = 'avalanche',
+        ordem: Optional[List[str]] = None
+    ) -> DebtPayoffPlan:
+        """
+        Planeja a quitação de várias dívidas (cartão, crédito pessoal, veículo).
+
+        Args:
+            dividas: Tuplas ``(nome, saldo, taxa anual %, pagamento mínimo)``
+            orcamento_mensal: Valor disponível por mês para as dívidas
+            estrategia: 'avalanche' (maior taxa primeiro), 'snowball'
+                (menor saldo primeiro) ou 'custom'
+            ordem: Nomes das dívidas em ordem de prioridade ('custom')
+
+        Returns:
+            DebtPayoffPlan com o mês de quitação e os juros de cada dívida
+        """
+        return plan_debt_payoff(dividas, orcamento_mensal, estrategia, ordem)
+
+    @staticmethod
+    def simular_consorcio(
+        valor_credito: float,
+        prazo: int,
+        taxa_administracao: float = 15.0,
+        fundo_reserva: float = 2.0,
+        lance: float = 0.0,
+        lance_embutido: float = 0.0,
+        n_cenarios: int = 100_000,
+        semente: Optional[int] = None
+    ) -> Dict:
+        """
+        Simula uma cota de consórcio: parcela, contemplação e custo.
+
+        Args:
+            valor_credito: Valor da carta de crédito
+            prazo: Prazo do grupo em meses
+            taxa_administracao: Taxa de administração total (% do crédito)
+            fundo_reserva: Fundo de reserva total (% do crédito)
+            lance: Lance com recursos próprios (% do crédito)
+            lance_embutido: Lance embutido na carta (% do crédito)
+            n_cenarios: Número de cenários sorteados
+            semente: Semente para resultados reprodutíveis
+
+        Returns:
+            Dict com parcela, mês esperado de contemplação, probabilidade
+            de contemplação no primeiro ano e custo total mediano (%)
+        """
+        simulacao = simulate_consorcio(
+            valor_credito, prazo, taxa_administracao, fundo_reserva,
+            lance, lance_embutido, n_paths=n_cenarios, seed=semente
+        )
+        percentis = simulacao.percentiles()
+        return {
+            'parcela_mensal': simulacao.monthly_installment,
+            'mes_esperado_contemplacao': simulacao.expected_month,
+            'mes_contemplacao_p50': percentis['contemplation_month'][50],
+            'probabilidade_primeiro_ano': float(simulacao.probability[:12].sum()),
+            'custo_total_p50': percentis['cost_ratio'][50],
+            'custo_anual_p50': percentis['annual_cost'][50],
+            'simulacao': simulacao
+        }
+
+    @staticmethod
+    def simular_cartao_credito(
+        saldo: float,
+        taxa_mensal: float,
+        percentual_pagamento: float = 15.0,
+        pagamento_minimo: float = 50.0,
+        gasto_mensal: float = 0.0
+    ) -> Dict:
+        """
+        Simula a dívida do cartão no rotativo ("e se eu pagar só o mínimo?").
+
+        Args:
+            saldo: Valor da fatura atual
+            taxa_mensal: Juros do rotativo (% ao mês)
+            percentual_pagamento: Percentual da fatura pago por mês
+            pagamento_minimo: Pagamento mínimo em reais
+            gasto_mensal: Compras novas por mês
+
+        Returns:
+            Dict com meses para quitar (None se não quitar em 30 anos),
+            total pago, juros e IOF, e a economia ao pagar a fatura integral
+        """
+        resultado = simulate_card_debt(
+            saldo, taxa_mensal, [percentual_pagamento, 100.0],
+            pagamento_minimo, gasto_mensal
+        )
+        meses = resultado.payoff_month[0]
+        total_pago = resultado.total_paid
+        return {
+            'primeiro_pagamento': float(resultado.payments[0, 0]),
+            'meses_para_quitar': None if np.isnan(meses) else int(meses),
+            'total_pago': float(total_pago[0]),
+            'total_juros': float(resultado.total_interest[0]),
+            'total_iof': float(resultado.total_iof[0]),
+            'economia_fatura_integral': float(total_pago[0] - total_pago[1]),
+        }
+
+    @staticmethod
+    def simular_parcelamento_fatura(
+        valor: float,
+        taxa_mensal: float,
+        parcelas: Iterable[int] = (3, 6, 10, 12, 18, 24)
+    ) -> pd.DataFrame:
+        """
+        Compara prazos de parcelamento da fatura com juros.
+
+        Args:
+            valor: Valor da fatura parcelada
+            taxa_mensal: Juros do parcelamento (% ao mês)
+            parcelas: Números de parcelas a comparar
+
+        Returns:
+            DataFrame com parcela, total pago, juros, IOF e CET por prazo
+        """
+        return installment_plan(valor, taxa_mensal, tuple(parcelas))
+
+    @staticmethod
+    def calcular_valores_reais(
+        resultado,
+        inflacao_anual: Optional[float] = 4.0,
+        ipca_mensal: Optional[List[float]] = None,
+        colunas: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Converte a evolução de uma simulação para reais de hoje.
+
+        Args:
+            resultado: ResultadoInvestimento, ResultadoFinanciamento ou
+                DataFrame com uma linha por mês
+            inflacao_anual: IPCA anual constante em percentual
+            ipca_mensal: Série mensal do IPCA (decimal); substitui a taxa anual
+            colunas: Colunas a deflacionar; padrão são todas as numéricas
+
+        Returns:
+            DataFrame com os valores de cada mês em reais de hoje
+        """
+        if isinstance(resultado, ResultadoInvestimento):
+            resultado = resultado.evolucao_mensal
+        elif isinstance(resultado, ResultadoFinanciamento):
+            resultado = pd.DataFrame({
+                'mes': np.arange(1, len(resultado.parcelas) + 1),
+                'parcela': resultado.parcelas,
+                'amortizacao': resultado.amortizacoes,
+                'juros': resultado.juros_parcela,
+                'saldo_devedor': resultado.saldo_devedor,
+            })
+        if ipca_mensal is not None:
+            inflacao_anual = None
+        return real_values(resultado, inflacao_anual, ipca_mensal, colunas)
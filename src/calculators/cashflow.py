@@ -0,0 +1,261 @@
+"""VPL, TIR e XTIR vetorizados.
+
+Substitui ``np.npv``/``np.irr``, removidas do NumPy. Todas as funções
+aceitam uma série de fluxos ou um lote de séries (uma por linha; listas de
+tamanhos diferentes são completadas com zeros ao final, o que não altera
+o VPL). A TIR é obtida por Newton protegido por bisseção dentro de um
+intervalo com troca de sinal, iterando todas as séries ao mesmo tempo.
+"""
+
+import numpy as np
+from typing import Sequence, Tuple, Union
+
+
+ArrayLike = Union[float, Sequence, np.ndarray]
+
+# Grade de busca em ln(1 + taxa), de -99,99% a 1.000.000% por período
+BRACKET_GRID = np.linspace(np.log(1e-4), np.log1p(1e4), 185)
+DEFAULT_TOLERANCE = 1e-12
+DEFAULT_MAX_ITERATIONS = 100
+
+
+def npv(rate: ArrayLike, cash_flows: ArrayLike) -> Union[float, np.ndarray]:
+    """Calcula o valor presente líquido, com o primeiro fluxo na data zero.
+
+    Args:
+        rate: Taxa de desconto por período (decimal), uma por série
+        cash_flows: Série de fluxos ou lote de séries
+
+    Returns:
+        VPL (escalar para uma série, array para um lote)
+
+    Example:
+        >>> round(npv(0.1, [-100, 60, 60]), 4)
+        4.1322
+    """
+    flows, single = _as_flow_matrix(cash_flows)
+    periods = np.arange(flows.shape[1], dtype=np.float64)
+    values = _present_value(_as_rates(rate, flows.shape[0]), flows, periods)
+    return float(values[0]) if single else values
+
+
+def xnpv(rate: ArrayLike, cash_flows: ArrayLike, dates) -> Union[float, np.ndarray]:
+    """Calcula o VPL de fluxos em datas irregulares (base 365 dias).
+
+    Args:
+        rate: Taxa de desconto anual (decimal), uma por série
+        cash_flows: Série de fluxos ou lote de séries
+        dates: Datas dos fluxos, comuns a todas as séries ou uma por fluxo
+
+    Returns:
+        VPL na data do primeiro fluxo
+    """
+    flows, single = _as_flow_matrix(cash_flows)
+    years = _year_fractions(dates, flows.shape)
+    values = _present_value(_as_rates(rate, flows.shape[0]), flows, years)
+    return float(values[0]) if single else values
+
+
+def irr(
+    cash_flows: ArrayLike,
+    guess: float = 0.1,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS
+) -> Union[float, np.ndarray]:
+    """Calcula a taxa interna de retorno por período.
+
+    Args:
+        cash_flows: Série de fluxos ou lote de séries
+        guess: Estimativa inicial da taxa (decimal)
+        tolerance: Tolerância na taxa
+        max_iterations: Limite de iterações
+
+    Returns:
+        TIR (decimal); ``nan`` para séries sem troca de sinal no VPL, só
+        de zeros ou que não convergem em ``max_iterations``
+
+    Example:
+        >>> round(irr([-100, 60, 60]), 6)
+        0.130662
+    """
+    flows, single = _as_flow_matrix(cash_flows)
+    periods = np.arange(flows.shape[1], dtype=np.float64)
+    rates = _solve_rate(flows, periods, guess, tolerance, max_iterations)
+    return float(rates[0]) if single else rates
+
+
+def xirr(
+    cash_flows: ArrayLike,
+    dates,
+    guess: float = 0.1,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS
+) -> Union[float, np.ndarray]:
+    """Calcula a TIR anual de fluxos em datas irregulares (base 365 dias).
+
+    Args:
+        cash_flows: Série de fluxos ou lote de séries
+        dates: Datas dos fluxos, comuns a todas as séries ou uma por fluxo
+        guess: Estimativa inicial da taxa anual (decimal)
+        tolerance: Tolerância na taxa
+        max_iterations: Limite de iterações
+
+    Returns:
+        TIR anual (decimal); ``nan`` quando não há solução
+    """
+    flows, single = _as_flow_matrix(cash_flows)
+    years = _year_fractions(dates, flows.shape)
+    rates = _solve_rate(flows, years, guess, tolerance, max_iterations)
+    return float(rates[0]) if single else rates
+
+
+def _as_flow_matrix(cash_flows: ArrayLike) -> Tuple[np.ndarray, bool]:
+    """Converte fluxos em matriz ``(séries, períodos)``, completando com zeros."""
+    if isinstance(cash_flows, np.ndarray):
+        flows = cash_flows.astype(np.float64, copy=False)
+    elif len(cash_flows) and all(np.ndim(series) == 1 for series in cash_flows):
+        longest = max(len(series) for series in cash_flows)
+        flows = np.zeros((len(cash_flows), longest), dtype=np.float64)
+        for row, series in enumerate(cash_flows):
+            flows[row, :len(series)] = series
+    else:
+        flows = np.asarray(cash_flows, dtype=np.float64)
+
+    single = flows.ndim == 1
+    if single:
+        flows = flows[None, :]
+    if flows.ndim != 2 or flows.shape[1] == 0:
+        raise ValueError("Fluxos de caixa devem ser uma série ou um lote de séries")
+    return flows, single
+
+
+def _as_rates(rate: ArrayLike, count: int) -> np.ndarray:
+    """Expande a taxa para uma por série."""
+    rates = np.broadcast_to(np.asarray(rate, dtype=np.float64), (count,))
+    if (rates <= -1).any():
+        raise ValueError("Taxa deve ser maior que -100%")
+    return rates
+
+
+def _year_fractions(dates, shape: Tuple[int, int]) -> np.ndarray:
+    """Converte datas em anos desde o primeiro fluxo de cada série."""
+    days = np.asarray(dates, dtype='datetime64[D]')
+    if days.shape[-1] != shape[1]:
+        raise ValueError("Número de datas difere do número de fluxos")
+    offsets = (days - days[..., :1]).astype(np.float64)
+    return np.broadcast_to(offsets / 365.0, shape)
+
+
+def _present_value(rates: np.ndarray, flows: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """VPL de cada série para a taxa correspondente."""
+    discount = np.exp(-times * np.log1p(rates)[:, None])
+    return np.einsum('ij,ij->i', flows, discount)
+
+
+def _npv_and_derivative(
+    rates: np.ndarray,
+    flows: np.ndarray,
+    times: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """VPL e sua derivada em relação à taxa, para cada série."""
+    log_growth = np.log1p(rates)[:, None]
+    discounted = flows * np.exp(-times * log_growth)
+    value = discounted.sum(axis=1)
+    slope = -(discounted * times).sum(axis=1) / (1 + rates)
+    return value, slope
+
+
+def _npv_grid(flows: np.ndarray, times: np.ndarray, log_growth: np.ndarray) -> np.ndarray:
+    """Sinal do VPL de todas as séries em todas as taxas da grade ``(séries, taxas)``.
+
+    Em taxas negativas os fluxos são trazidos para a última data em vez da
+    primeira, o que preserva o sinal e evita estouro em séries longas.
+    """
+    if times.ndim == 1:
+        # Datas comuns: uma única multiplicação de matrizes
+        shift = np.where(log_growth < 0, times.max(), 0.0)
+        exponents = np.subtract.outer(shift, times) * log_growth[:, None]
+        return np.sign(flows @ np.exp(exponents).T)
+    values = np.empty((flows.shape[0], log_growth.size))
+    last = times.max(axis=1, keepdims=True)
+    for column, growth in enumerate(log_growth):
+        shifted = times - last if growth < 0 else times
+        values[:, column] = np.einsum('ij,ij->i', flows, np.exp(-shifted * growth))
+    return np.sign(values)
+
+
+def _bracket(
+    flows: np.ndarray,
+    times: np.ndarray,
+    guess: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Localiza, para cada série, o intervalo com troca de sinal mais próximo da estimativa.
+
+    Returns:
+        Limites inferior e superior da taxa e máscara das séries com raiz
+    """
+    signs = _npv_grid(flows, times, BRACKET_GRID)
+    changes = (signs[:, :-1] != signs[:, 1:]) | (signs[:, :-1] == 0)
+
+    midpoints = (BRACKET_GRID[:-1] + BRACKET_GRID[1:]) / 2
+    distance = np.where(changes, np.abs(midpoints - np.log1p(guess)), np.inf)
+    column = distance.argmin(axis=1)
+    # Séries só de zeros têm VPL nulo em toda taxa, sem TIR definida
+    solvable = changes[np.arange(flows.shape[0]), column] & (flows != 0).any(axis=1)
+
+    low = np.expm1(BRACKET_GRID[column])
+    high = np.expm1(BRACKET_GRID[column + 1])
+    return low, high, solvable
+
+
+def _solve_rate(
+    flows: np.ndarray,
+    times: np.ndarray,
+    guess: float,
+    tolerance: float,
+    max_iterations: int
+) -> np.ndarray:
+    """Resolve VPL(taxa) = 0 para todas as séries simultaneamente.
+
+    O VPL é avaliado numa grade de taxas para isolar a raiz mais próxima de
+    ``guess`` (com mais de uma troca de sinal o polinômio tem várias
+    raízes); em seguida cada iteração aplica o passo de Newton e recorre à
+    bisseção quando o passo sai do intervalo.
+    """
+    if guess <= -1:
+        raise ValueError("Estimativa deve ser maior que -100%")
+
+    low, high, solvable = _bracket(flows, times, guess)
+    times = np.broadcast_to(times, flows.shape)
+    f_low, _ = _npv_and_derivative(low, flows, times)
+    rising = f_low < 0
+
+    rate = np.full(flows.shape[0], guess, dtype=np.float64)
+    outside = ~((rate > low) & (rate < high))
+    rate[outside] = (low[outside] + high[outside]) / 2
+    active = solvable.copy()
+
+    for _ in range(max_iterations):
+        if not active.any():
+            break
+        index = np.flatnonzero(active)
+        value, slope = _npv_and_derivative(rate[index], flows[index], times[index])
+
+        # Mantém o intervalo [low, high] com troca de sinal
+        below_root = (value < 0) == rising[index]
+        low[index[below_root]] = rate[index[below_root]]
+        high[index[~below_root]] = rate[index[~below_root]]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            candidate = rate[index] - value / slope
+        outside = ~((candidate >= low[index]) & (candidate <= high[index]))
+        candidate[outside] = (low[index[outside]] + high[index[outside]]) / 2
+
+        step = np.abs(candidate - rate[index])
+        rate[index] = candidate
+        done = (step <= tolerance * (1 + np.abs(candidate))) | (value == 0)
+        active[index[done]] = False
+
+    # Séries que não convergiram no limite de iterações não têm TIR confiável
+    rate[~solvable | active] = np.nan
+    return rate
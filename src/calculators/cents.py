@@ -0,0 +1,206 @@
+"""Cronogramas em centavos inteiros (``int64``).
+
+Para demonstrativos que exigem valores exatos, todas as colunas são
+inteiros em centavos e satisfazem, sem erro algum::
+
+    parcela = amortização + juros
+    saldo[k] = saldo[k-1] - amortização[k]
+    soma das amortizações = valor financiado, saldo final = 0
+
+Os saldos são o saldo exato arredondado ao centavo: no PRICE, o saldo de
+quem paga a parcela já arredondada; no SAC, a fração ``(n-k)/n`` do valor
+financiado. Assim o arredondamento não se acumula e o cálculo continua
+vetorizado; a última parcela absorve o resíduo. Os juros do SAC são o
+saldo anterior vezes a taxa, arredondados. No PRICE os juros são a
+parcela menos a amortização: como os dois saldos envolvidos têm erro de
+até meio centavo, eles diferem do saldo anterior (já arredondado) vezes
+a taxa ``i`` em até ``1 + i/2`` centavos, e desse produto arredondado em
+no máximo um centavo.
+
+Modos de arredondamento:
+    ``'half_even'``: meio para o par (bancário; equivale à ABNT NBR 5891)
+    ``'half_up'``: meio para cima (comercial)
+"""
+
+import math
+import numpy as np
+from typing import Union
+
+from .amortization import SCHEDULE_COLUMNS, _periods
+from .results import ScheduleTable
+
+
+ROUNDING_MODES = ('half_even', 'half_up')
+
+# Casas preservadas antes do arredondamento, descartando o ruído binário
+# (1.005 * 100 = 100.49999999999999)
+_SNAP_DIGITS = 6
+_SNAP_SCALE = 10.0 ** _SNAP_DIGITS
+
+
+def round_cents(
+    values: Union[float, np.ndarray],
+    rounding: str = 'half_even'
+) -> Union[int, np.ndarray]:
+    """Converte valores em reais para centavos inteiros.
+
+    Args:
+        values: Valor ou array em reais
+        rounding: Modo de arredondamento
+
+    Returns:
+        Centavos (``int`` para escalares, ``int64`` para arrays)
+
+    Example:
+        >>> round_cents(0.125), round_cents(0.125, 'half_up')
+        (12, 13)
+    """
+    if rounding not in ROUNDING_MODES:
+        raise ValueError("Arredondamento deve ser 'half_even' ou 'half_up'")
+    if np.ndim(values) == 0:
+        return _round_scalar(float(values) * 100, rounding)
+    cents = np.round(np.multiply(values, 100.0), _SNAP_DIGITS)
+    if rounding == 'half_even':
+        np.rint(cents, out=cents)
+    else:
+        np.copysign(np.floor(np.abs(cents) + 0.5), cents, out=cents)
+    return cents.astype(np.int64)
+
+
+def price_schedule_cents(
+    loan_amount: float,
+    monthly_rate: float,
+    months: int,
+    rounding: str = 'half_even'
+) -> ScheduleTable:
+    """Gera o cronograma PRICE em centavos inteiros.
+
+    Args:
+        loan_amount: Valor financiado (reais)
+        monthly_rate: Taxa de juros mensal (decimal)
+        months: Número de parcelas
+        rounding: Modo de arredondamento
+
+    Returns:
+        ScheduleTable ``int64`` com as colunas 'payment', 'principal',
+        'interest' e 'balance', em centavos
+    """
+    principal_cents = _validate(loan_amount, monthly_rate, months, rounding)
+    table = ScheduleTable.empty(SCHEDULE_COLUMNS, months, dtype=np.int64)
+    payments, principal, interest, balance = table.data
+    elapsed = _periods(months)[1:]
+
+    if monthly_rate == 0:
+        payment = _round_scalar(principal_cents / months, rounding)
+        exact = elapsed * -payment
+        exact += principal_cents
+        np.maximum(exact, 0.0, out=exact)
+    else:
+        log_growth = math.log1p(monthly_rate)
+        total_growth = math.exp(months * log_growth)
+        exact_payment = principal_cents * monthly_rate * total_growth / (total_growth - 1)
+        payment = _round_scalar(exact_payment, rounding)
+        first_amortization = payment - principal_cents * monthly_rate
+        if first_amortization <= 0:
+            # Juros quase iguais à parcela: arredondar para baixo faria o
+            # saldo crescer, então a parcela é arredondada para cima
+            payment = math.ceil(exact_payment)
+            first_amortization = payment - principal_cents * monthly_rate
+        # Saldo pagando a parcela arredondada: P - (g^k - 1) * (pmt' - P*i) / i
+        exact = elapsed * log_growth
+        np.expm1(exact, out=exact)
+        exact *= first_amortization / monthly_rate
+        np.subtract(principal_cents, exact, out=exact)
+        if payment > exact_payment:
+            # Parcela arredondada para cima quita antes do prazo
+            np.maximum(exact, 0.0, out=exact)
+
+    _round_into(exact, balance, rounding)
+    balance[-1] = 0  # A última parcela quita o saldo restante
+
+    _fill_principal(principal, balance, principal_cents)
+    np.subtract(payment, principal, out=interest)
+    payments.fill(payment)
+
+    # A parcela de quitação (a última, ou antes se a parcela arredondada
+    # para cima antecipar a quitação) cobra juros sobre o saldo anterior e
+    # absorve o resíduo; as seguintes ficam zeradas
+    payoff = months - 1
+    if months > 1 and balance[-2] == 0:
+        payoff = int(np.argmax(balance == 0))
+    opening = principal_cents if payoff == 0 else int(balance[payoff - 1])
+    interest[payoff] = _round_scalar(opening * monthly_rate, rounding)
+    payments[payoff] = principal[payoff] + interest[payoff]
+    if payoff < months - 1:
+        table.data[:3, payoff + 1:] = 0
+    return table
+
+
+def sac_schedule_cents(
+    loan_amount: float,
+    monthly_rate: float,
+    months: int,
+    rounding: str = 'half_even'
+) -> ScheduleTable:
+    """Gera o cronograma SAC em centavos inteiros.
+
+    Args:
+        loan_amount: Valor financiado (reais)
+        monthly_rate: Taxa de juros mensal (decimal)
+        months: Número de parcelas
+        rounding: Modo de arredondamento
+
+    Returns:
+        ScheduleTable ``int64`` com as colunas 'payment', 'principal',
+        'interest' e 'balance', em centavos
+    """
+    principal_cents = _validate(loan_amount, monthly_rate, months, rounding)
+    table = ScheduleTable.empty(SCHEDULE_COLUMNS, months, dtype=np.int64)
+    payments, principal, interest, balance = table.data
+
+    # Fração (n-k)/n do valor financiado; saldo anterior na posição k-1
+    opening = _periods(months)[:0:-1] * (principal_cents / months)
+    _round_into(opening, opening, rounding)
+    balance[:-1] = opening[1:]
+    balance[-1] = 0
+
+    _fill_principal(principal, balance, principal_cents)
+    opening *= monthly_rate
+    _round_into(opening, interest, rounding)
+    np.add(principal, interest, out=payments)
+    return table
+
+
+def _fill_principal(principal: np.ndarray, balance: np.ndarray, opening: int) -> None:
+    """Amortização de cada mês como a queda do saldo."""
+    principal[0] = opening - balance[0]
+    np.subtract(balance[:-1], balance[1:], out=principal[1:])
+
+
+def _round_into(values: np.ndarray, out: np.ndarray, rounding: str) -> None:
+    """Arredonda valores em centavos calculados, gravando em ``out``."""
+    # Descarta o ruído binário, como ``np.round(values, _SNAP_DIGITS)`` sem temporários
+    values *= _SNAP_SCALE
+    np.rint(values, out=values)
+    values /= _SNAP_SCALE
+    if rounding == 'half_even':
+        np.rint(values, out=out, casting='unsafe')
+    else:
+        values += 0.5
+        np.floor(values, out=out, casting='unsafe')
+
+
+def _round_scalar(value: float, rounding: str) -> int:
+    """Arredonda um valor em centavos, descartando o ruído binário."""
+    value = round(value * _SNAP_SCALE) / _SNAP_SCALE
+    if rounding == 'half_even':
+        return round(value)
+    return int(math.copysign(math.floor(abs(value) + 0.5), value))
+
+
+def _validate(loan_amount: float, monthly_rate: float, months: int, rounding: str) -> int:
+    if loan_amount <= 0 or monthly_rate < 0 or months <= 0:
+        raise ValueError("Parâmetros inválidos")
+    if rounding not in ROUNDING_MODES:
+        raise ValueError("Arredondamento deve ser 'half_even' ou 'half_up'")
+    return _round_scalar(loan_amount * 100.0, rounding)
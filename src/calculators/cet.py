@@ -0,0 +1,213 @@
+"""Custo Efetivo Total (CET) de ofertas de crédito, em lote.
+
+O CET é a taxa que iguala o valor liberado ao cliente às prestações
+efetivamente pagas, incluindo tarifas, IOF e seguro (Resolução CMN
+3.517/2007). Para cada oferta:
+
+    liberado = sum(prestação_k * (1 + cet)^-k),  k = 1..n
+
+IOF de pessoa física: 0,38% fixo mais 0,0082% ao dia sobre a amortização
+de cada parcela, limitado a 365 dias. Como o cronograma é linear no valor
+financiado, o IOF por real financiado sai do cronograma unitário e o
+financiamento do IOF e das tarifas é resolvido em forma fechada:
+``financiado = (liberado + tarifas) / (1 - IOF unitário)``.
+
+A equação é resolvida para todas as ofertas de uma vez por Newton
+vetorizado partindo da taxa nominal. Os custos só aumentam a taxa, então
+a estimativa fica à esquerda da raiz de uma função convexa e decrescente,
+e as iterações convergem de forma monótona, sem bisseção. Ofertas que não
+convergirem no limite de iterações recorrem a ``cashflow.irr``.
+"""
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Tuple
+
+from .amortization import batch_schedule
+from .cashflow import irr
+
+IOF_FIXED_RATE = 0.0038
+IOF_DAILY_RATE = 0.000082
+IOF_MAX_DAYS = 365
+DAYS_PER_INSTALLMENT = 30
+DEFAULT_TOLERANCE = 1e-12
+DEFAULT_MAX_ITERATIONS = 50
+
+
+@dataclass
+class CETResult:
+    """CET de um lote de ofertas.
+
+    ``installments`` tem forma ``(ofertas, maior prazo)`` e inclui o
+    seguro; meses além do prazo de cada oferta ficam zerados e marcados
+    como ``False`` em ``mask``. As taxas estão em percentual.
+    """
+    loan_amount: np.ndarray
+    interest_rate: np.ndarray
+    months: np.ndarray
+    system: np.ndarray
+    financed_amount: np.ndarray
+    released_amount: np.ndarray
+    fees: np.ndarray
+    iof: np.ndarray
+    insurance: np.ndarray
+    installments: np.ndarray
+    mask: np.ndarray
+    monthly_cet: np.ndarray
+    annual_cet: np.ndarray
+    iterations: int
+
+    def __len__(self) -> int:
+        return len(self.loan_amount)
+
+    def summary(self) -> pd.DataFrame:
+        """Tabela com os custos e o CET de cada oferta."""
+        return pd.DataFrame({
+            'loan_amount': self.loan_amount,
+            'interest_rate': self.interest_rate,
+            'months': self.months,
+            'system': self.system,
+            'financed_amount': self.financed_amount,
+            'fees': self.fees,
+            'iof': self.iof,
+            'insurance': self.insurance,
+            'first_installment': self.installments[:, 0],
+            'monthly_cet': self.monthly_cet,
+            'annual_cet': self.annual_cet,
+        })
+
+
+def cet_batch(
+    loan_amounts,
+    annual_rates,
+    months,
+    systems='PRICE',
+    fees=0.0,
+    monthly_insurance=0.0,
+    insurance_rate=0.0,
+    iof: bool = True,
+    finance_costs: bool = True,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS
+) -> CETResult:
+    """Calcula o CET de várias ofertas de uma só vez.
+
+    Os parâmetros seguem as regras de broadcasting do NumPy, como em
+    ``batch_schedule``.
+
+    Args:
+        loan_amounts: Valor solicitado pelo cliente
+        annual_rates: Taxa de juros nominal (% ao ano)
+        months: Número de parcelas
+        systems: Sistema de amortização ('PRICE' ou 'SAC')
+        fees: Tarifas cobradas na contratação (R$)
+        monthly_insurance: Seguro fixo somado a cada prestação (R$)
+        insurance_rate: Seguro mensal sobre o saldo devedor (% ao mês)
+        iof: Cobra o IOF de pessoa física
+        finance_costs: Tarifas e IOF financiados junto com o valor
+            solicitado; se ``False``, são descontados do valor liberado
+        tolerance: Tolerância na taxa mensal
+        max_iterations: Limite de iterações de Newton
+
+    Returns:
+        CETResult com uma oferta por combinação, em ordem achatada
+    """
+    shape = np.broadcast_shapes(*(np.shape(value) for value in (
+        loan_amounts, annual_rates, months, systems, fees, monthly_insurance, insurance_rate
+    )))
+
+    def flat(value, dtype=np.float64):
+        return np.broadcast_to(np.asarray(value, dtype=dtype), shape).ravel()
+
+    requested, fee, fixed_insurance, insurance_pct = (
+        flat(value) for value in (loan_amounts, fees, monthly_insurance, insurance_rate)
+    )
+    if (requested <= 0).any():
+        raise ValueError("Parâmetros inválidos")
+    if (fee < 0).any() or (fixed_insurance < 0).any() or (insurance_pct < 0).any():
+        raise ValueError("Tarifas e seguros devem ser não negativos")
+
+    # Cronograma por real financiado: tudo escala com o valor financiado
+    unit = batch_schedule(1.0, flat(annual_rates), flat(months, None), flat(systems, str))
+
+    iof_unit = np.zeros(len(unit))
+    if iof:
+        days = np.minimum(
+            DAYS_PER_INSTALLMENT * np.arange(1, unit.payment.shape[1] + 1), IOF_MAX_DAYS
+        )
+        iof_unit = IOF_FIXED_RATE + IOF_DAILY_RATE * (unit.principal @ days)
+
+    if finance_costs:
+        financed = (requested + fee) / (1.0 - iof_unit)
+        released = requested
+    else:
+        financed = requested
+        released = requested - fee - financed * iof_unit
+    if (released <= 0).any():
+        raise ValueError("Custos maiores que o valor solicitado")
+
+    # Prestações em reais, com seguro fixo e seguro sobre o saldo no início do mês
+    opening = np.empty_like(unit.balance)
+    opening[:, 0] = 1.0
+    opening[:, 1:] = unit.balance[:, :-1]
+    opening *= unit.mask
+    installments = unit.payment + opening * (insurance_pct / 100)[:, None]
+    installments *= financed[:, None]
+    installments += np.where(unit.mask, fixed_insurance[:, None], 0.0)
+    insurance = installments.sum(axis=1) - financed * unit.total_amount
+
+    monthly, iterations = _solve_cet(
+        released, installments, unit.interest_rate / 100 / 12, tolerance, max_iterations
+    )
+    return CETResult(
+        loan_amount=requested,
+        interest_rate=unit.interest_rate,
+        months=unit.months,
+        system=unit.system,
+        financed_amount=financed,
+        released_amount=released,
+        fees=fee,
+        iof=financed * iof_unit,
+        insurance=insurance,
+        installments=installments,
+        mask=unit.mask,
+        monthly_cet=monthly * 100,
+        annual_cet=np.expm1(12 * np.log1p(monthly)) * 100,
+        iterations=iterations,
+    )
+
+
+def _solve_cet(
+    released: np.ndarray,
+    installments: np.ndarray,
+    nominal: np.ndarray,
+    tolerance: float,
+    max_iterations: int
+) -> Tuple[np.ndarray, int]:
+    """Resolve ``VP(prestações, taxa) = liberado`` para todas as ofertas.
+
+    Returns:
+        Tupla (taxa mensal em decimal, iterações executadas)
+    """
+    periods = np.arange(1, installments.shape[1] + 1, dtype=np.float64)
+    rate = nominal.copy()
+    active = np.ones(rate.size, dtype=bool)
+    iterations = 0
+    while active.any() and iterations < max_iterations:
+        iterations += 1
+        index = np.flatnonzero(active)
+        flows = installments[index]
+        discounted = flows * np.exp(-periods * np.log1p(rate[index])[:, None])
+        value = discounted.sum(axis=1) - released[index]
+        slope = -(discounted @ periods) / (1.0 + rate[index])
+        step = value / slope
+        rate[index] -= step
+        done = np.abs(step) <= tolerance * (1.0 + np.abs(rate[index]))
+        active[index[done]] = False
+
+    if active.any():
+        index = np.flatnonzero(active)
+        flows = np.hstack([-released[index, None], installments[index]])
+        rate[index] = irr(flows, guess=float(np.median(nominal[index])))
+    return rate, iterations
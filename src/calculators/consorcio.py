@@ -0,0 +1,343 @@
+"""Simulador de consórcio: parcelas, lances e sorteio de contemplação.
+
+A parcela mensal é o fundo comum (crédito / prazo) acrescido da taxa de
+administração e do fundo de reserva, ambos em percentual do crédito
+rateados pelo prazo. A cada assembleia o grupo contempla
+``draws_per_month`` cotas por sorteio e ``bids_per_month`` pelos maiores
+lances; no último mês todas as cotas restantes são contempladas.
+
+Com ``R`` cotas ativas no mês, a chance de sorteio é ``draws / R``. Entre
+as ``c`` concorrentes restantes, cada uma oferta lance com probabilidade
+``bid_participation`` e valor uniforme em ``competitor_bids``; o lance da
+cota vence se no máximo ``k - 1`` ofertas concorrentes o superarem.
+
+O Monte Carlo percorre as assembleias mês a mês, vetorizado sobre os
+cenários ainda não contemplados: cada um sorteia seu bilhete entre as
+``R`` cotas ativas e se menos de ``k`` das ``c`` concorrentes superam o
+lance (por inversão da cauda binomial, equivalente a sortear cada
+oferta). Como essas chances dependem só do tamanho do grupo, a
+distribuição exata do mês de contemplação também sai em forma fechada
+(``lottery_probability`` e ``bid_probability``) e serve de referência
+para os cenários simulados.
+
+Custos são calculados uma vez por mês e forma de contemplação (sorteio ou
+lance) e atribuídos a cada cenário:
+
+    custo total     (total pago / crédito recebido - 1), em %
+    custo efetivo   taxa que iguala o crédito líquido na contemplação às
+                    parcelas restantes, comparável à de ``loan_calculator``
+
+O crédito líquido é a carta (menos o lance embutido), menos o lance
+próprio e as parcelas já pagas, capitalizadas a ``opportunity_rate``.
+Quando as parcelas pagas já superam o crédito, a cota funcionou como
+poupança e o custo efetivo fica ``nan``. O fundo de reserva é tratado
+como custo (sem devolução no encerramento do grupo).
+"""
+
+import math
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+from .cashflow import irr
+
+DEFAULT_ADMIN_FEE = 15.0
+DEFAULT_RESERVE_FUND = 2.0
+DEFAULT_COMPETITOR_BIDS = (10.0, 50.0)
+
+
+@dataclass
+class ConsorcioResult:
+    """Resultado da simulação de um consórcio.
+
+    Os arrays por mês têm tamanho ``months`` (mês 1 na posição 0); as
+    tabelas de custo têm forma ``(2, months)``, com a linha 0 para
+    contemplação por sorteio e a 1 por lance. ``contemplation_month``,
+    ``by_bid``, ``monthly_cost``, ``cost_ratio`` e ``total_paid`` trazem um
+    valor por cenário sorteado; taxas e custos estão em percentual.
+    """
+    credit_value: float
+    months: int
+    group_size: int
+    monthly_installment: float
+    installment_after_bid: np.ndarray
+    lottery_probability: np.ndarray
+    bid_probability: np.ndarray
+    monthly_cost_table: np.ndarray
+    cost_ratio_table: np.ndarray
+    contemplation_month: np.ndarray
+    by_bid: np.ndarray
+    monthly_cost: np.ndarray
+    cost_ratio: np.ndarray
+    total_paid: np.ndarray
+    n_paths: int
+
+    @property
+    def probability(self) -> np.ndarray:
+        """Probabilidade exata de contemplação em cada mês."""
+        return self.lottery_probability + self.bid_probability
+
+    @property
+    def annual_cost(self) -> np.ndarray:
+        """Custo efetivo anual (%) de cada cenário."""
+        return np.expm1(12 * np.log1p(self.monthly_cost / 100)) * 100
+
+    @property
+    def expected_month(self) -> float:
+        """Mês esperado de contemplação."""
+        return float(self.probability @ np.arange(1, self.months + 1))
+
+    @property
+    def financed_probability(self) -> float:
+        """Fração dos cenários em que o crédito superou as parcelas já pagas."""
+        return float(np.isfinite(self.monthly_cost).mean())
+
+    def percentiles(self, levels: Sequence[int] = (5, 50, 95)) -> Dict[str, Dict[int, float]]:
+        """Percentis do mês de contemplação, do custo total e do custo efetivo anual.
+
+        O custo efetivo considera só os cenários em que ele é definido.
+        """
+        values = {
+            'contemplation_month': np.percentile(self.contemplation_month, levels),
+            'cost_ratio': np.percentile(self.cost_ratio, levels),
+            'annual_cost': (np.nanpercentile(self.annual_cost, levels)
+                            if self.financed_probability > 0 else np.full(len(levels), np.nan)),
+        }
+        return {
+            name: {level: float(row[k]) for k, level in enumerate(levels)}
+            for name, row in values.items()
+        }
+
+    def summary(self) -> pd.DataFrame:
+        """Tabela por mês: probabilidades e custo anual por sorteio e por lance."""
+        annual = np.expm1(12 * np.log1p(self.monthly_cost_table / 100)) * 100
+        return pd.DataFrame({
+            'month': np.arange(1, self.months + 1),
+            'lottery_probability': self.lottery_probability,
+            'bid_probability': self.bid_probability,
+            'cumulative_probability': np.cumsum(self.probability),
+            'lottery_cost_ratio': self.cost_ratio_table[0],
+            'bid_cost_ratio': self.cost_ratio_table[1],
+            'lottery_annual_cost': annual[0],
+            'bid_annual_cost': annual[1],
+        })
+
+
+def simulate_consorcio(
+    credit_value: float,
+    months: int,
+    admin_fee: float = DEFAULT_ADMIN_FEE,
+    reserve_fund: float = DEFAULT_RESERVE_FUND,
+    bid: float = 0.0,
+    embedded_bid: float = 0.0,
+    group_size: Optional[int] = None,
+    draws_per_month: int = 1,
+    bids_per_month: int = 1,
+    bid_participation: float = 0.1,
+    competitor_bids: Tuple[float, float] = DEFAULT_COMPETITOR_BIDS,
+    opportunity_rate: float = 0.0,
+    n_paths: int = 100_000,
+    seed: Optional[int] = None
+) -> ConsorcioResult:
+    """Simula mês de contemplação e custo efetivo de uma cota de consórcio.
+
+    Args:
+        credit_value: Valor da carta de crédito
+        months: Prazo do grupo em meses
+        admin_fee: Taxa de administração total (% do crédito)
+        reserve_fund: Fundo de reserva total (% do crédito)
+        bid: Lance com recursos próprios (% do crédito)
+        embedded_bid: Lance embutido, descontado da carta (% do crédito)
+        group_size: Cotas no grupo; padrão é o prazo vezes as
+            contemplações por mês
+        draws_per_month: Contemplações por sorteio em cada assembleia
+        bids_per_month: Contemplações por lance em cada assembleia
+        bid_participation: Fração das concorrentes que oferta lance por mês
+        competitor_bids: Faixa (%, mínimo e máximo) dos lances concorrentes
+        opportunity_rate: Taxa anual (%) que capitaliza as parcelas pagas
+            antes da contemplação no cálculo do custo efetivo
+        n_paths: Número de cenários sorteados
+        seed: Semente do gerador
+
+    Returns:
+        ConsorcioResult com a distribuição do mês de contemplação e do
+        custo efetivo
+    """
+    if credit_value <= 0 or months < 2 or n_paths <= 0:
+        raise ValueError("Parâmetros inválidos")
+    if admin_fee < 0 or reserve_fund < 0 or bid < 0 or embedded_bid < 0:
+        raise ValueError("Taxas e lances devem ser não negativos")
+    if embedded_bid >= 100:
+        raise ValueError("Lance embutido deve ser menor que o crédito")
+    if draws_per_month < 1 or bids_per_month < 0 or not 0 <= bid_participation <= 1:
+        raise ValueError("Parâmetros inválidos")
+    low, high = competitor_bids
+    if not 0 <= low < high:
+        raise ValueError("Faixa de lances concorrentes inválida")
+    slots = draws_per_month + bids_per_month
+    if group_size is None:
+        group_size = months * slots
+    if group_size < 1:
+        raise ValueError("Grupo deve ter ao menos uma cota")
+
+    installment = credit_value * (1 + (admin_fee + reserve_fund) / 100) / months
+    lance = (bid + embedded_bid) / 100 * credit_value
+    remaining = months - np.arange(1, months + 1)
+    if lance > 0 and lance >= installment * remaining[0]:
+        raise ValueError("Lance maior que o saldo devedor")
+
+    # Lance só é aceito enquanto for menor que o saldo devedor
+    bid_allowed = (lance > 0) & (installment * remaining > lance)
+    lottery, by_bid = _contemplation_probabilities(
+        months, group_size, draws_per_month, bids_per_month, bid_allowed,
+        bid + embedded_bid, bid_participation, low, high
+    )
+
+    # Parcela após o lance: o lance abate o saldo e o prazo é mantido
+    with np.errstate(divide='ignore', invalid='ignore'):
+        after_bid = np.where(
+            remaining > 0, (installment * remaining - lance) / remaining, 0.0
+        )
+    # Crédito líquido na contemplação, descontadas as parcelas já pagas
+    # (capitalizadas à taxa de oportunidade), e parcelas restantes
+    month = np.arange(1, months + 1)
+    opportunity = (1 + opportunity_rate / 100) ** (1 / 12) - 1
+    paid_before = installment * (
+        month if opportunity == 0 else np.expm1(month * np.log1p(opportunity)) / opportunity
+    )
+    received = np.array([credit_value, credit_value * (1 - embedded_bid / 100)])
+    own_bid = np.array([0.0, credit_value * bid / 100])
+    later = np.stack([np.full(months, installment), after_bid])
+    net_credit = (received - own_bid)[:, None] - paid_before
+
+    flows = np.zeros((2, months, months))
+    flows[:, :, 0] = net_credit
+    flows[:, :, 1:] = np.where(
+        np.arange(1, months)[None, :] <= remaining[:, None], -later[:, :, None], 0.0
+    )
+    financed = (net_credit > 0) & (remaining > 0)
+    cost = np.full((2, months), np.nan)
+    cost[financed] = irr(flows[financed], guess=0.0) * 100
+
+    total_paid = installment * month + later * remaining + own_bid[:, None]
+    cost_ratio = (total_paid / received[:, None] - 1) * 100
+
+    index, won_by_bid = _simulate_assemblies(
+        months, group_size, draws_per_month, bids_per_month, bid_allowed,
+        _below_probability(bid + embedded_bid, bid_participation, low, high),
+        n_paths, np.random.default_rng(seed)
+    )
+    mode = won_by_bid.astype(np.intp)
+
+    return ConsorcioResult(
+        credit_value=credit_value,
+        months=months,
+        group_size=group_size,
+        monthly_installment=installment,
+        installment_after_bid=after_bid,
+        lottery_probability=lottery,
+        bid_probability=by_bid,
+        monthly_cost_table=cost,
+        cost_ratio_table=cost_ratio,
+        contemplation_month=index + 1,
+        by_bid=won_by_bid,
+        monthly_cost=cost[mode, index],
+        cost_ratio=cost_ratio[mode, index],
+        total_paid=total_paid[mode, index],
+        n_paths=n_paths,
+    )
+
+
+def _contemplation_probabilities(
+    months: int,
+    group_size: int,
+    draws: int,
+    bids: int,
+    bid_allowed: np.ndarray,
+    lance: float,
+    participation: float,
+    low: float,
+    high: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Probabilidade de a cota ser contemplada em cada mês, por sorteio e por lance.
+
+    Returns:
+        Tupla de arrays ``(meses,)``: contemplação por sorteio e por lance
+    """
+    below = _below_probability(lance, participation, low, high)
+    lottery = np.zeros(months)
+    by_bid = np.zeros(months)
+    survival = 1.0
+    for month in range(months):
+        active = group_size - month * (draws + bids)
+        if month == months - 1 or active <= draws:
+            lottery[month] = survival
+            break
+        drawn = draws / active
+        won = _bid_wins(active - draws - 1, bids, below) if bid_allowed[month] else 0.0
+        lottery[month] = survival * drawn
+        by_bid[month] = survival * (1 - drawn) * won
+        survival *= (1 - drawn) * (1 - won)
+    return lottery, by_bid
+
+
+def _simulate_assemblies(
+    months: int,
+    group_size: int,
+    draws: int,
+    bids: int,
+    bid_allowed: np.ndarray,
+    below: float,
+    n_paths: int,
+    rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorteia as assembleias de cada cenário até a contemplação da cota.
+
+    Returns:
+        Tupla com o índice do mês de contemplação (base 0) e se ela foi
+        por lance, um valor por cenário
+    """
+    index = np.full(n_paths, months - 1)
+    by_bid = np.zeros(n_paths, dtype=bool)
+    waiting = np.arange(n_paths)
+    for month in range(months - 1):
+        active = group_size - month * (draws + bids)
+        if active <= draws or waiting.size == 0:
+            break
+        # Bilhete da cota entre as ``active`` cotas ativas
+        drawn = rng.random(waiting.size) * active < draws
+        won = np.zeros(waiting.size, dtype=bool)
+        if bids > 0 and bid_allowed[month]:
+            # Concorrentes acima do lance, por inversão da binomial: vence
+            # se menos de ``bids`` ofertas o superarem
+            chance = _bid_wins(active - draws - 1, bids, below)
+            won = ~drawn & (rng.random(waiting.size) < chance)
+        contemplated = drawn | won
+        index[waiting[contemplated]] = month
+        by_bid[waiting[won]] = True
+        waiting = waiting[~contemplated]
+    return index, by_bid
+
+
+def _below_probability(lance: float, participation: float, low: float, high: float) -> float:
+    """Chance de uma concorrente não superar o lance da cota."""
+    return (1 - participation) + participation * min(max((lance - low) / (high - low), 0.0), 1.0)
+
+
+def _bid_wins(competitors: int, slots: int, below: float) -> float:
+    """Probabilidade de no máximo ``slots - 1`` concorrentes superarem o lance."""
+    if slots == 0:
+        return 0.0
+    if competitors < slots or below >= 1.0:
+        return 1.0
+    if below <= 0.0:
+        return 0.0
+    log_below, log_above = math.log(below), math.log1p(-below)
+    return min(1.0, sum(
+        math.exp(
+            math.lgamma(competitors + 1) - math.lgamma(j + 1) - math.lgamma(competitors - j + 1)
+            + j * log_above + (competitors - j) * log_below
+        )
+        for j in range(slots)
+    ))
@@ -0,0 +1,227 @@
+"""Dívida de cartão de crédito: rotativo, pagamento mínimo e fatura parcelada.
+
+A cada mês a fatura é o saldo rolado do mês anterior (com juros e IOF)
+mais as compras novas. O cliente paga um percentual da fatura, nunca menos
+que o pagamento mínimo em reais; o restante entra no rotativo:
+
+    rolado   = fatura - pagamento
+    saldo    = rolado * (1 + juros) + IOF(rolado)
+
+A recorrência roda mês a mês, mas cada passo é uma operação vetorizada
+sobre todas as políticas de pagamento (percentuais, saldos e taxas
+combinados por broadcasting). Políticas quitadas saem do lote, e a
+simulação para quando todas quitam o saldo.
+
+Desde 2024 (Lei 14.690/2023) juros e encargos do rotativo não podem
+passar de 100% da dívida original; com ``interest_cap`` os juros param
+de correr ao atingir o teto. O IOF é tributo e fica fora do teto.
+
+A fatura parcelada com juros é um financiamento PRICE; ``installment_plan``
+usa ``cet_batch`` para a parcela, o IOF e o custo efetivo de vários prazos.
+"""
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+
+from .cet import DAYS_PER_INSTALLMENT, IOF_DAILY_RATE, IOF_FIXED_RATE, cet_batch
+
+DEFAULT_MINIMUM_PAYMENT = 50.0
+DEFAULT_MAX_MONTHS = 360
+
+# IOF de cada mês no rotativo: alíquota fixa mais a diária de um ciclo
+MONTHLY_IOF_RATE = IOF_FIXED_RATE + IOF_DAILY_RATE * DAYS_PER_INSTALLMENT
+
+# Saldo residual (R$) considerado quitado
+_BALANCE_TOLERANCE = 1e-6
+
+
+@dataclass
+class CardDebtResult:
+    """Evolução da dívida do cartão para um lote de políticas de pagamento.
+
+    Arrays por política têm forma ``(políticas,)``; ``balance`` tem forma
+    ``(políticas, meses + 1)`` com o saldo inicial na coluna 0, e
+    ``payments``, ``interest`` e ``iof`` têm forma ``(políticas, meses)``.
+    ``payoff_month`` é ``nan`` quando o saldo não zera no horizonte.
+    """
+    initial_balance: np.ndarray
+    monthly_rate: np.ndarray
+    payment_percent: np.ndarray
+    balance: np.ndarray
+    payments: np.ndarray
+    interest: np.ndarray
+    iof: np.ndarray
+    payoff_month: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.payment_percent)
+
+    @property
+    def months(self) -> int:
+        """Meses simulados."""
+        return self.payments.shape[1]
+
+    @property
+    def total_paid(self) -> np.ndarray:
+        return self.payments.sum(axis=1)
+
+    @property
+    def total_interest(self) -> np.ndarray:
+        return self.interest.sum(axis=1)
+
+    @property
+    def total_iof(self) -> np.ndarray:
+        return self.iof.sum(axis=1)
+
+    def summary(self) -> pd.DataFrame:
+        """Tabela por política: prazo de quitação, total pago, juros e IOF."""
+        return pd.DataFrame({
+            'initial_balance': self.initial_balance,
+            'monthly_rate': self.monthly_rate,
+            'payment_percent': self.payment_percent,
+            'first_payment': self.payments[:, 0],
+            'payoff_month': self.payoff_month,
+            'total_paid': self.total_paid,
+            'total_interest': self.total_interest,
+            'total_iof': self.total_iof,
+            'final_balance': self.balance[:, -1],
+        })
+
+
+def simulate_card_debt(
+    balance,
+    monthly_rate,
+    payment_percents=15.0,
+    minimum_payment: float = DEFAULT_MINIMUM_PAYMENT,
+    monthly_spending: float = 0.0,
+    iof: bool = True,
+    interest_cap: bool = True,
+    max_months: int = DEFAULT_MAX_MONTHS
+) -> CardDebtResult:
+    """Projeta o saldo do cartão sob várias políticas de pagamento de uma vez.
+
+    Os três primeiros parâmetros seguem as regras de broadcasting do
+    NumPy, como em ``batch_schedule``.
+
+    Args:
+        balance: Valor da fatura atual
+        monthly_rate: Juros do rotativo (% ao mês)
+        payment_percents: Percentual da fatura pago por mês (15 = mínimo
+            usual; 100 = fatura integral)
+        minimum_payment: Pagamento mínimo em reais, limitado à fatura
+        monthly_spending: Compras novas somadas a cada fatura
+        iof: Cobra IOF sobre o valor rolado
+        interest_cap: Limita juros a 100% da dívida original
+        max_months: Horizonte máximo da projeção
+
+    Returns:
+        CardDebtResult com saldo, pagamentos, juros e IOF mês a mês
+    """
+    shape = np.broadcast_shapes(*(np.shape(value) for value in (
+        balance, monthly_rate, payment_percents
+    )))
+
+    def flat(value):
+        return np.broadcast_to(np.asarray(value, dtype=np.float64), shape).ravel()
+
+    initial, rate, percent = flat(balance), flat(monthly_rate), flat(payment_percents)
+    if (initial <= 0).any() or (rate < 0).any() or max_months <= 0:
+        raise ValueError("Parâmetros inválidos")
+    if ((percent <= 0) | (percent > 100)).any():
+        raise ValueError("Percentual de pagamento deve estar entre 0 e 100")
+    if minimum_payment < 0 or monthly_spending < 0:
+        raise ValueError("Valores devem ser não negativos")
+
+    count = initial.size
+    # Buffers mês a mês (linhas contíguas); a saída é a transposta
+    balances = np.zeros((max_months + 1, count))
+    payments = np.zeros((max_months, count))
+    interest = np.zeros((max_months, count))
+    taxes = np.zeros((max_months, count))
+    payoff = np.full(count, np.nan)
+    balances[0] = initial
+
+    iof_rate = MONTHLY_IOF_RATE if iof else 0.0
+    # Só as políticas com saldo seguem na recorrência
+    index = np.arange(count)
+    current = initial.copy()
+    monthly = rate / 100
+    share = percent / 100
+    room = initial.copy() if interest_cap else np.full(count, np.inf)
+    months = max_months
+
+    for month in range(max_months):
+        invoice = current + monthly_spending
+        paid = invoice * share
+        np.maximum(paid, minimum_payment, out=paid)
+        np.minimum(paid, invoice, out=paid)
+        rolled = invoice - paid
+        settled = rolled <= _BALANCE_TOLERANCE
+        rolled[settled] = 0.0
+
+        charge = rolled * monthly
+        np.minimum(charge, room, out=charge)
+        room -= charge
+        tax = rolled * iof_rate
+        current = rolled + charge
+        current += tax
+
+        payments[month, index] = paid
+        interest[month, index] = charge
+        taxes[month, index] = tax
+        balances[month + 1, index] = current
+
+        if settled.any():
+            done = index[settled]
+            payoff[done[np.isnan(payoff[done])]] = month + 1
+            if monthly_spending == 0:
+                keep = ~settled
+                if not keep.any():
+                    months = month + 1
+                    break
+                index, current, monthly, share, room = (
+                    array[keep] for array in (index, current, monthly, share, room)
+                )
+
+    return CardDebtResult(
+        initial_balance=initial,
+        monthly_rate=rate,
+        payment_percent=percent,
+        balance=balances[:months + 1].T,
+        payments=payments[:months].T,
+        interest=interest[:months].T,
+        iof=taxes[:months].T,
+        payoff_month=payoff,
+    )
+
+
+def installment_plan(
+    balance: float,
+    monthly_rate: float,
+    installments=(3, 6, 10, 12, 18, 24),
+    iof: bool = True
+) -> pd.DataFrame:
+    """Compara prazos de parcelamento da fatura com juros.
+
+    Args:
+        balance: Valor da fatura parcelada
+        monthly_rate: Juros do parcelamento (% ao mês)
+        installments: Números de parcelas
+        iof: Cobra IOF (financiado junto com a fatura)
+
+    Returns:
+        DataFrame com parcela, total pago, juros, IOF e CET anual por prazo
+    """
+    terms = np.asarray(installments)
+    result = cet_batch(balance, monthly_rate * 12, terms, iof=iof)
+    total = result.installments.sum(axis=1)
+    return pd.DataFrame({
+        'installments': terms,
+        'payment': result.installments[:, 0],
+        'total_paid': total,
+        'total_interest': total - result.financed_amount,
+        'iof': result.iof,
+        'monthly_cet': result.monthly_cet,
+        'annual_cet': result.annual_cet,
+    })
@@ -0,0 +1,282 @@
+"""Execução de lotes pesados em processos paralelos.
+
+Os lotes são divididos em faixas ``[início, fim)`` distribuídas por um
+``ProcessPoolExecutor``. Cada processo escreve sua faixa diretamente em um
+array de ``multiprocessing.shared_memory``, de modo que apenas parâmetros
+pequenos trafegam entre processos; nenhum resultado volta serializado.
+
+A função de trabalho deve ser definida no nível do módulo (para poder ser
+enviada aos processos) e ter a assinatura ``func(out, start, stop, **params)``,
+preenchendo em ``out`` apenas a parte que corresponde à sua faixa.
+
+Example:
+    >>> with BatchExecutor(max_workers=2) as executor:  # doctest: +SKIP
+    ...     job = executor.submit(func, shape=(3, 1000), n_items=1000,
+    ...                           chunk_size=250, progress=print)
+    ...     values = job.result()
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class BatchCancelledError(RuntimeError):
+    """Lote cancelado antes de concluir."""
+
+
+class BatchJob:
+    """Lote em execução, com progresso e cancelamento.
+
+    O callback de progresso recebe ``(itens concluídos, total)`` e é chamado
+    em uma thread do processo principal a cada faixa concluída.
+    """
+
+    def __init__(
+        self,
+        futures: List[Tuple[Future, int]],
+        buffer: shared_memory.SharedMemory,
+        shape: Tuple[int, ...],
+        dtype: np.dtype,
+        total: int,
+        progress: Optional[ProgressCallback] = None
+    ):
+        self._futures = futures
+        self._buffer = buffer
+        self._shape = shape
+        self._dtype = dtype
+        self._total = total
+        self._progress = progress
+        self._completed = 0
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self._result: Optional[np.ndarray] = None
+
+        for future, size in futures:
+            future.add_done_callback(lambda done, size=size: self._on_done(done, size))
+
+    @property
+    def completed(self) -> int:
+        """Itens concluídos até o momento."""
+        return self._completed
+
+    @property
+    def total(self) -> int:
+        """Total de itens do lote."""
+        return self._total
+
+    def done(self) -> bool:
+        """Indica se todas as faixas terminaram ou foram canceladas."""
+        return all(future.done() for future, _ in self._futures)
+
+    def cancel(self) -> None:
+        """Cancela as faixas ainda não iniciadas.
+
+        Faixas em andamento terminam normalmente; ``result`` passa a
+        levantar ``BatchCancelledError``.
+        """
+        self._cancelled = True
+        for future, _ in self._futures:
+            future.cancel()
+
+    def result(self, timeout: Optional[float] = None) -> np.ndarray:
+        """Aguarda o lote e devolve o array de resultados.
+
+        A memória compartilhada é liberada na primeira leitura; chamadas
+        seguintes devolvem o mesmo array.
+
+        Args:
+            timeout: Tempo máximo de espera, em segundos
+
+        Returns:
+            Array com a forma e o tipo informados em ``submit``
+
+        Raises:
+            BatchCancelledError: Se o lote foi cancelado
+            TimeoutError: Se o prazo terminar antes do lote
+        """
+        if self._result is not None:
+            return self._result
+
+        futures = [future for future, _ in self._futures]
+        _, pending = wait(futures, timeout=timeout)
+        if pending:
+            raise TimeoutError("Lote não concluído no prazo")
+
+        try:
+            if self._cancelled:
+                raise BatchCancelledError("Lote cancelado")
+            for future in futures:
+                future.result()  # Propaga exceções dos processos
+            self._result = self._values().copy()
+            return self._result
+        finally:
+            self._release()
+
+    def _on_done(self, future: Future, size: int) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._lock:
+            self._completed += size
+            completed = self._completed
+        if self._progress is not None:
+            self._progress(completed, self._total)
+
+    def _values(self) -> np.ndarray:
+        return np.ndarray(self._shape, dtype=self._dtype, buffer=self._buffer.buf)
+
+    def _release(self) -> None:
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer.unlink()
+            self._buffer = None
+
+    def __del__(self):
+        # Garante a liberação se o resultado nunca for lido
+        try:
+            if self._buffer is not None and self.done():
+                self._release()
+        except (AttributeError, FileNotFoundError):
+            pass
+
+
+class BatchExecutor:
+    """Distribui lotes de cálculo em um pool de processos.
+
+    O pool é criado no primeiro uso e reaproveitado entre lotes; use como
+    gerenciador de contexto ou chame ``shutdown`` ao terminar.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Inicializa o executor.
+
+        Args:
+            max_workers: Número de processos; padrão é o número de núcleos
+        """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("Número de processos deve ser positivo")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: Set[Future] = set()
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        func: Callable,
+        shape: Tuple[int, ...],
+        n_items: int,
+        chunk_size: Optional[int] = None,
+        dtype=np.float64,
+        progress: Optional[ProgressCallback] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> BatchJob:
+        """Divide ``n_items`` em faixas e as executa em paralelo.
+
+        Args:
+            func: Função ``func(out, start, stop, **params)`` de nível de módulo
+            shape: Forma do array de resultados compartilhado
+            n_items: Número de itens a dividir entre as faixas
+            chunk_size: Itens por faixa; padrão divide igualmente entre os
+                processos
+            dtype: Tipo do array de resultados
+            progress: Callback ``(concluídos, total)``
+            params: Parâmetros nomeados repassados a ``func``
+
+        Returns:
+            BatchJob para acompanhar, cancelar e obter o resultado
+        """
+        if n_items <= 0:
+            raise ValueError("Lote deve ter ao menos um item")
+        if chunk_size is None:
+            chunk_size = -(-n_items // self.max_workers)
+        if chunk_size <= 0:
+            raise ValueError("Tamanho da faixa deve ser positivo")
+
+        dtype = np.dtype(dtype)
+        nbytes = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        buffer = shared_memory.SharedMemory(create=True, size=nbytes)
+
+        pool = self._get_pool()
+        futures = []
+        try:
+            for start in range(0, n_items, chunk_size):
+                stop = min(start + chunk_size, n_items)
+                future = pool.submit(
+                    _run_chunk, func, buffer.name, shape, dtype.str, start, stop, params or {}
+                )
+                futures.append((future, stop - start))
+                self._track(future)
+        except BaseException:
+            for future, _ in futures:
+                future.cancel()
+            buffer.close()
+            buffer.unlink()
+            raise
+
+        return BatchJob(futures, buffer, tuple(shape), dtype, n_items, progress)
+
+    def shutdown(self, cancel_pending: bool = False) -> None:
+        """Encerra o pool de processos.
+
+        Args:
+            cancel_pending: Cancela faixas ainda não iniciadas
+        """
+        with self._lock:
+            if self._pool is not None:
+                # ``cancel_futures`` de ``shutdown`` só existe a partir do 3.9
+                if cancel_pending:
+                    for future in list(self._pending):
+                        future.cancel()
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+    def _track(self, future: Future) -> None:
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+
+    def __enter__(self) -> 'BatchExecutor':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown(cancel_pending=exc_info[0] is not None)
+
+    def __repr__(self) -> str:
+        return f"BatchExecutor(max_workers={self.max_workers})"
+
+
+def _run_chunk(
+    func: Callable,
+    name: str,
+    shape: Tuple[int, ...],
+    dtype: str,
+    start: int,
+    stop: int,
+    params: Dict[str, Any]
+) -> None:
+    """Executa uma faixa no processo de trabalho sobre a memória compartilhada."""
+    buffer = shared_memory.SharedMemory(name=name)
+    out = np.ndarray(shape, dtype=np.dtype(dtype), buffer=buffer.buf)
+    try:
+        func(out, start, stop, **params)
+    finally:
+        del out  # Libera a visão antes de fechar o segmento
+        try:
+            buffer.close()
+        except BufferError:
+            # O traceback de uma exceção ainda referencia a memória; ela é
+            # liberada com o processo
+            pass
+
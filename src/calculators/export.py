@@ -0,0 +1,140 @@
+"""Exportação de cronogramas em fluxo (CSV ou Parquet).
+
+Os contratos são lidos de um iterável em lotes de ``chunk_size``; cada lote
+é calculado com ``batch_schedule`` e gravado antes do seguinte. A memória
+depende apenas do tamanho do lote (contratos × maior prazo do lote), não
+do número de contratos, e nenhum dicionário por parcela é criado.
+
+Cada contrato é uma tupla ``(valor, taxa anual %, prazo, sistema)``; um
+``DataFrame`` com essas quatro colunas, nessa ordem, também é aceito.
+
+Example:
+    >>> contratos = [(250000, 9.5, 360, 'PRICE'), (80000, 12, 48, 'SAC')]
+    >>> caminho = export_schedules(contratos, file_format='csv')  # doctest: +SKIP
+"""
+
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .amortization import SCHEDULE_COLUMNS, batch_schedule
+
+
+# Resolvido a partir da raiz do projeto, independente do diretório atual
+EXPORT_DIR = Path(__file__).resolve().parents[2] / 'data' / 'exports'
+EXPORT_COLUMNS = ('contract', 'installment') + SCHEDULE_COLUMNS
+FILE_FORMATS = ('csv', 'parquet')
+
+Contract = Tuple[float, float, int, str]
+
+
+def iter_schedule_chunks(
+    contracts: Union[Iterable[Contract], pd.DataFrame],
+    chunk_size: int = 1000
+) -> Iterator[pd.DataFrame]:
+    """Gera os cronogramas em blocos, um lote de contratos por vez.
+
+    Args:
+        contracts: Contratos ``(valor, taxa anual %, prazo, sistema)``
+        chunk_size: Contratos por bloco
+
+    Yields:
+        DataFrame com as colunas 'contract' (posição do contrato, base 0),
+        'installment' (base 1), 'payment', 'principal', 'interest' e
+        'balance', uma linha por parcela
+    """
+    if chunk_size <= 0:
+        raise ValueError("Tamanho do lote deve ser positivo")
+    if isinstance(contracts, pd.DataFrame):
+        contracts = contracts.itertuples(index=False, name=None)
+
+    iterator = iter(contracts)
+    offset = 0
+    while True:
+        batch = list(islice(iterator, chunk_size))
+        if not batch:
+            return
+        amounts, rates, terms, systems = zip(*batch)
+        result = batch_schedule(
+            np.asarray(amounts, dtype=np.float64),
+            np.asarray(rates, dtype=np.float64),
+            np.asarray(terms),
+            np.asarray(systems, dtype=str)
+        )
+
+        # Linhas do lote em ordem (contrato, parcela), descartando o
+        # preenchimento além do prazo de cada contrato
+        mask = result.mask
+        rows, columns = np.nonzero(mask)
+        frame = {'contract': rows + offset, 'installment': columns + 1}
+        for name in SCHEDULE_COLUMNS:
+            frame[name] = getattr(result, name)[mask]
+        yield pd.DataFrame(frame, copy=False)
+        offset += len(batch)
+
+
+def export_schedules(
+    contracts: Union[Iterable[Contract], pd.DataFrame],
+    path: Optional[Union[str, Path]] = None,
+    file_format: str = 'csv',
+    chunk_size: int = 1000,
+    directory: Union[str, Path] = EXPORT_DIR
+) -> Path:
+    """Grava os cronogramas de vários contratos, bloco a bloco.
+
+    Args:
+        contracts: Contratos ``(valor, taxa anual %, prazo, sistema)``
+        path: Arquivo de destino; padrão gera um nome com data e hora em
+            ``directory``
+        file_format: 'csv' ou 'parquet' (requer ``pyarrow``)
+        chunk_size: Contratos por bloco
+        directory: Diretório usado quando ``path`` não é informado
+
+    Returns:
+        Caminho do arquivo gravado
+    """
+    file_format = file_format.lower()
+    if file_format not in FILE_FORMATS:
+        raise ValueError("Formato deve ser 'csv' ou 'parquet'")
+
+    if path is None:
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        path = Path(directory) / f"cronogramas_{stamp}.{file_format}"
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    chunks = iter_schedule_chunks(contracts, chunk_size)
+    if file_format == 'csv':
+        _write_csv(chunks, path)
+    else:
+        _write_parquet(chunks, path)
+    return path
+
+
+def _write_csv(chunks: Iterator[pd.DataFrame], path: Path) -> None:
+    """Grava o cabeçalho uma vez e acrescenta cada bloco ao arquivo."""
+    with open(path, 'w', newline='', encoding='utf-8') as handle:
+        handle.write(','.join(EXPORT_COLUMNS) + '\n')
+        for frame in chunks:
+            frame.to_csv(handle, header=False, index=False)
+
+
+def _write_parquet(chunks: Iterator[pd.DataFrame], path: Path) -> None:
+    """Grava cada bloco como um row group do arquivo Parquet."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Exportação em Parquet requer o pacote 'pyarrow'") from exc
+
+    schema = pa.schema(
+        [(name, pa.int64()) for name in EXPORT_COLUMNS[:2]]
+        + [(name, pa.float64()) for name in SCHEDULE_COLUMNS]
+    )
+    with pq.ParquetWriter(path, schema) as writer:
+        for frame in chunks:
+            writer.write_table(pa.Table.from_pandas(frame, schema=schema, preserve_index=False))
@@ -3,6 +3,13 @@
 import numpy as np
 from typing import Dict, List
 
+from .amortization import price_schedule, sac_schedule
+from .results import ScheduleRows, ScheduleTable
+
+
+# Chaves das parcelas, na ordem das colunas do kernel de amortização
+INSTALLMENT_COLUMNS = ('installment', 'amortization', 'interest', 'balance')
+
 
 class FinancingCalculator:
     """Calculadora de financiamentos."""
@@ -19,34 +26,17 @@ class FinancingCalculator:
         Returns:
             Dicionário com detalhes do financiamento
         """
-        monthly_rate = annual_rate / 100 / 12
-        amortization = principal / months
-        
-        installments = []
-        balance = principal
+        table = sac_schedule(principal, annual_rate / 100 / 12, months)
         
-        for month in range(1, months + 1):
-            interest = balance * monthly_rate
-            installment = amortization + interest
-            balance -= amortization
-            
-            installments.append({
-                'month': month,
-                'installment': installment,
-                'amortization': amortization,
-                'interest': interest,
-                'balance': max(0, balance)
-            })
-        
-        total_paid = sum(i['installment'] for i in installments)
+        total_paid = float(table['payment'].sum())
         total_interest = total_paid - principal
         
         return {
-            'installments': installments,
+            'installments': _installment_rows(table),
             'total_paid': total_paid,
             'total_interest': total_interest,
-            'first_installment': installments[0]['installment'],
-            'last_installment': installments[-1]['installment']
+            'first_installment': float(table['payment'][0]),
+            'last_installment': float(table['payment'][-1])
         }
     
     @staticmethod
@@ -61,39 +51,29 @@ class FinancingCalculator:
         Returns:
             Dicionário com detalhes do financiamento
         """
-        monthly_rate = annual_rate / 100 / 12
-        
-        # Cálculo da prestação fixa
-        installment = principal * (monthly_rate * (1 + monthly_rate) ** months) / \
-                     ((1 + monthly_rate) ** months - 1)
-        
-        installments = []
-        balance = principal
-        
-        for month in range(1, months + 1):
-            interest = balance * monthly_rate
-            amortization = installment - interest
-            balance -= amortization
-            
-            installments.append({
-                'month': month,
-                'installment': installment,
-                'amortization': amortization,
-                'interest': interest,
-                'balance': max(0, balance)
-            })
+        table = price_schedule(principal, annual_rate / 100 / 12, months)
+        installment = float(table['payment'][0])
         
         total_paid = installment * months
         total_interest = total_paid - principal
         
         return {
-            'installments': installments,
+            'installments': _installment_rows(table),
             'total_paid': total_paid,
             'total_interest': total_interest,
             'fixed_installment': installment
         }
 
 
+def _installment_rows(table: ScheduleTable) -> List[Dict[str, float]]:
+    """Adapta o cronograma do kernel às chaves usadas por esta calculadora.
+
+    Devolve uma lista real: o resultado é um dicionário simples, que segue
+    serializável em JSON (``salvar_simulacao``).
+    """
+    return ScheduleRows(table.renamed(INSTALLMENT_COLUMNS), index_key='month').to_list()
+
+
 class InvestmentCalculator:
     """Calculadora de investimentos."""
     
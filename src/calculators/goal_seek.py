@@ -0,0 +1,294 @@
+"""Calculadoras inversas ("atingir meta").
+
+Respondem perguntas como "quanto aportar para chegar a R$ 1 milhão" ou
+"qual taxa resulta nesta parcela" sem chamar as calculadoras em laço.
+Aporte, prazo e valor máximo financiável têm forma fechada; a taxa
+implícita é a TIR do fluxo equivalente, resolvida por ``cashflow.irr``.
+``affordability_matrix`` calcula o valor máximo para toda uma grade
+prazo × taxa de uma vez.
+
+As taxas seguem a convenção das calculadoras: percentual nominal ao ano,
+dividido por 12. Por padrão o aporte do último mês não é feito, como em
+``FinancialCalculators.compound_interest``; ``contribute_last_month=True``
+reproduz ``calcular_investimento``.
+"""
+
+import math
+import numpy as np
+import pandas as pd
+
+from .cashflow import irr
+
+
+SYSTEMS = ('PRICE', 'SAC')
+
+
+def required_contribution(
+    target_amount: float,
+    annual_rate: float,
+    months: int,
+    principal: float = 0,
+    contribute_last_month: bool = False
+) -> float:
+    """Calcula o aporte mensal necessário para atingir um montante.
+
+    Args:
+        target_amount: Montante desejado
+        annual_rate: Taxa de juros (% ao ano)
+        months: Prazo em meses
+        principal: Valor inicial
+        contribute_last_month: Aporta também no último mês
+
+    Returns:
+        Aporte mensal; zero se o valor inicial já atinge a meta
+    """
+    _validate_investment(target_amount, annual_rate, principal)
+    if months <= 0:
+        raise ValueError("Prazo deve ser positivo")
+
+    monthly_rate = annual_rate / 100 / 12
+    growth = _growth(monthly_rate, months)
+    annuity = _annuity_factor(monthly_rate, months, contribute_last_month)
+
+    shortfall = target_amount - principal * growth
+    if shortfall <= 0:
+        return 0.0
+    if annuity == 0:
+        raise ValueError("Meta inatingível sem aportes no prazo informado")
+    return shortfall / annuity
+
+
+def required_months(
+    target_amount: float,
+    annual_rate: float,
+    contribution: float,
+    principal: float = 0,
+    contribute_last_month: bool = False
+) -> int:
+    """Calcula o menor prazo, em meses, para atingir um montante.
+
+    Com ``g = 1 + i`` o montante é ``P*g^n + c*(g^n - g0)/i``, onde
+    ``g0`` é ``1`` com aporte no último mês e ``g`` sem ele; isolando
+    ``g^n`` o prazo sai de um logaritmo.
+
+    Args:
+        target_amount: Montante desejado
+        annual_rate: Taxa de juros (% ao ano)
+        contribution: Aporte mensal
+        principal: Valor inicial
+        contribute_last_month: Aporta também no último mês
+
+    Returns:
+        Número de meses
+    """
+    _validate_investment(target_amount, annual_rate, principal)
+    if contribution < 0:
+        raise ValueError("Valores devem ser positivos")
+    if target_amount <= principal:
+        return 0
+
+    monthly_rate = annual_rate / 100 / 12
+    if monthly_rate == 0:
+        if contribution == 0:
+            raise ValueError("Meta inatingível sem rendimento e sem aportes")
+        months = _ceil((target_amount - principal) / contribution)
+        return months if contribute_last_month else months + 1
+    if principal == 0 and contribution == 0:
+        raise ValueError("Meta inatingível sem valor inicial e sem aportes")
+
+    offset = 1.0 if contribute_last_month else 1 + monthly_rate
+    scaled = contribution / monthly_rate
+    # g^n = (T + c*g0/i) / (P + c/i)
+    growth = (target_amount + scaled * offset) / (principal + scaled)
+    return max(1, _ceil(math.log(growth) / math.log1p(monthly_rate)))
+
+
+def implied_investment_rate(
+    target_amount: float,
+    months: int,
+    contribution: float = 0,
+    principal: float = 0,
+    contribute_last_month: bool = False
+) -> float:
+    """Calcula a taxa anual necessária para atingir um montante.
+
+    Args:
+        target_amount: Montante desejado
+        months: Prazo em meses
+        contribution: Aporte mensal
+        principal: Valor inicial
+        contribute_last_month: Aporta também no último mês
+
+    Returns:
+        Taxa de juros (% ao ano); negativa se a meta é menor que o total
+        investido
+    """
+    if target_amount <= 0 or contribution < 0 or principal < 0 or months <= 0:
+        raise ValueError("Parâmetros inválidos")
+    if principal == 0 and contribution == 0:
+        raise ValueError("Informe valor inicial ou aporte mensal")
+
+    flows = np.empty(months + 1)
+    flows[0] = -principal
+    flows[1:] = -contribution
+    flows[-1] = target_amount - (contribution if contribute_last_month else 0)
+    return _annual_rate(irr(flows, guess=0.01))
+
+
+def implied_loan_rate(
+    loan_amount: float,
+    monthly_payment: float,
+    months: int,
+    system: str = 'PRICE'
+) -> float:
+    """Calcula a taxa anual que resulta na parcela informada.
+
+    Args:
+        loan_amount: Valor do empréstimo
+        monthly_payment: Parcela (a primeira, no SAC)
+        months: Número de parcelas
+        system: Sistema de amortização ('PRICE' ou 'SAC')
+
+    Returns:
+        Taxa de juros (% ao ano)
+    """
+    system = _validate_loan(loan_amount, monthly_payment, months, system)
+    # Abaixo da parcela sem juros a taxa seria negativa
+    if monthly_payment * months < loan_amount:
+        raise ValueError("Parcela insuficiente para quitar o empréstimo")
+
+    if system == 'SAC':
+        # Primeira parcela: P/n + P*i
+        return _annual_rate(monthly_payment / loan_amount - 1 / months)
+
+    flows = np.full(months + 1, -float(monthly_payment))
+    flows[0] = loan_amount
+    return _annual_rate(irr(flows, guess=0.01))
+
+
+def max_loan_amount(
+    monthly_payment: float,
+    annual_rate: float,
+    months: int,
+    system: str = 'PRICE'
+) -> float:
+    """Calcula o maior empréstimo cuja parcela cabe no valor informado.
+
+    No SAC a primeira parcela é a maior e limita o valor.
+
+    Args:
+        monthly_payment: Parcela máxima
+        annual_rate: Taxa de juros (% ao ano)
+        months: Número de parcelas
+        system: Sistema de amortização ('PRICE' ou 'SAC')
+
+    Returns:
+        Valor máximo do empréstimo
+    """
+    system = _validate_loan(1.0, monthly_payment, months, system)
+    if annual_rate < 0:
+        raise ValueError("Parâmetros inválidos")
+
+    monthly_rate = annual_rate / 100 / 12
+    if system == 'SAC':
+        return monthly_payment / (1 / months + monthly_rate)
+    if monthly_rate == 0:
+        return monthly_payment * months
+    # Valor presente da anuidade: pmt * (1 - g^-n) / i
+    return -monthly_payment * math.expm1(-months * math.log1p(monthly_rate)) / monthly_rate
+
+
+def affordability_matrix(
+    monthly_income: float,
+    terms,
+    annual_rates,
+    system: str = 'PRICE',
+    max_commitment: float = 30.0,
+    other_obligations: float = 0.0
+) -> pd.DataFrame:
+    """Calcula o maior financiamento para cada prazo e taxa pela regra de renda.
+
+    A parcela máxima é ``renda * comprometimento - outras parcelas``. No
+    PRICE o valor é o valor presente da anuidade; no SAC a primeira
+    parcela, ``P*(1/n + i)``, é a maior e limita o valor. As duas formas
+    são fechadas e avaliadas sobre a grade inteira, com o mesmo resultado
+    de ``max_loan_amount`` em cada célula.
+
+    Args:
+        monthly_income: Renda mensal bruta
+        terms: Prazos em meses
+        annual_rates: Taxas de juros (% ao ano)
+        system: Sistema de amortização ('PRICE' ou 'SAC')
+        max_commitment: Comprometimento máximo da renda (%)
+        other_obligations: Parcelas de outras dívidas já assumidas
+
+    Returns:
+        DataFrame com os prazos no índice, as taxas nas colunas e o valor
+        máximo financiável em cada célula
+    """
+    if monthly_income <= 0 or not 0 < max_commitment <= 100 or other_obligations < 0:
+        raise ValueError("Parâmetros inválidos")
+    payment = monthly_income * max_commitment / 100 - other_obligations
+    system = _validate_loan(1.0, payment, 1, system)
+
+    months = np.asarray(terms, dtype=np.int64).ravel()
+    rates = np.asarray(annual_rates, dtype=np.float64).ravel()
+    if (months <= 0).any() or (rates < 0).any():
+        raise ValueError("Parâmetros inválidos")
+
+    n = months[:, None].astype(np.float64)
+    monthly_rate = (rates / 100 / 12)[None, :]
+    if system == 'SAC':
+        amounts = payment / (1 / n + monthly_rate)
+    else:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            amounts = np.where(
+                monthly_rate == 0,
+                payment * n,
+                -payment * np.expm1(-n * np.log1p(monthly_rate)) / monthly_rate
+            )
+    return pd.DataFrame(
+        amounts,
+        index=pd.Index(months, name='months'),
+        columns=pd.Index(rates, name='annual_rate'),
+    )
+
+
+def _validate_investment(target_amount: float, annual_rate: float, principal: float) -> None:
+    if target_amount <= 0 or annual_rate < 0 or principal < 0:
+        raise ValueError("Valores devem ser positivos")
+
+
+def _validate_loan(loan_amount: float, monthly_payment: float, months: int, system: str) -> str:
+    if loan_amount <= 0 or monthly_payment <= 0 or months <= 0:
+        raise ValueError("Parâmetros inválidos")
+    system = system.upper()
+    if system not in SYSTEMS:
+        raise ValueError("Sistema deve ser 'PRICE' ou 'SAC'")
+    return system
+
+
+def _growth(monthly_rate: float, months: int) -> float:
+    """Fator ``(1 + i)^n``."""
+    return math.exp(months * math.log1p(monthly_rate))
+
+
+def _annuity_factor(monthly_rate: float, months: int, contribute_last_month: bool) -> float:
+    """Montante gerado por um aporte mensal unitário."""
+    contributions = months if contribute_last_month else months - 1
+    if monthly_rate == 0:
+        return float(contributions)
+    # (g^k - 1)/i, capitalizado mais um mês quando não há aporte no último
+    factor = math.expm1(contributions * math.log1p(monthly_rate)) / monthly_rate
+    return factor if contribute_last_month else factor * (1 + monthly_rate)
+
+
+def _annual_rate(monthly_rate: float) -> float:
+    if math.isnan(monthly_rate):
+        raise ValueError("Não há taxa que satisfaça os valores informados")
+    return monthly_rate * 12 * 100
+
+
+def _ceil(value: float) -> int:
+    """Arredonda para cima tolerando o erro de ponto flutuante."""
+    return math.ceil(value - 1e-9)
@@ -0,0 +1,251 @@
+"""Financiamentos indexados (TR, IPCA, CDI) em muitos cenários de índice.
+
+Aceita uma trajetória mensal do índice ou uma matriz ``(cenários, meses)``
+e calcula todos os cronogramas de uma vez, sem laço por mês nem por
+cenário. Dois mecanismos de indexação são suportados:
+
+``'balance'`` (correção monetária, como "9,5% a.a. + TR" ou IPCA + taxa):
+    o saldo é corrigido pelo índice antes dos juros e a parcela é
+    recalculada sobre o saldo corrigido. Com a taxa fixa, o cronograma é o
+    cronograma pré-fixado multiplicado pelo fator acumulado do índice
+    ``C_k = (1+idx_1)...(1+idx_k)``, obtido com ``cumprod``.
+
+``'rate'`` (taxa pós-fixada, como CDI + spread):
+    a taxa do mês é ``(1+idx_k)(1+i) - 1`` e a parcela PRICE é recalculada
+    pelo prazo restante. O saldo após cada mês é o anterior vezes um fator
+    que depende apenas da taxa e do prazo restante, de modo que os saldos
+    também saem de um ``cumprod``.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Union
+
+from .amortization import SCHEDULE_COLUMNS, price_schedule, sac_schedule
+from .results import ScheduleTable
+
+
+INDEXATION_MODES = ('balance', 'rate')
+INDEXED_COLUMNS = ('payment', 'principal', 'interest', 'correction', 'balance')
+
+
+@dataclass
+class IndexedLoanResult:
+    """Cronogramas indexados, com um cenário de índice por linha.
+
+    As colunas têm forma ``(cenários, meses)``; ``correction`` é a correção
+    monetária incorporada ao saldo em cada mês (zero no modo ``'rate'``).
+    """
+    loan_amount: float
+    interest_rate: float
+    months: int
+    system: str
+    indexation: str
+    payment: np.ndarray
+    principal: np.ndarray
+    interest: np.ndarray
+    correction: np.ndarray
+    balance: np.ndarray
+    total_paid: np.ndarray
+    total_interest: np.ndarray
+    total_correction: np.ndarray
+
+    @property
+    def n_paths(self) -> int:
+        """Número de cenários de índice."""
+        return self.payment.shape[0]
+
+    def schedule(self, path: int = 0) -> ScheduleTable:
+        """Cronograma de um cenário, com as colunas de ``INDEXED_COLUMNS``."""
+        return ScheduleTable(
+            np.stack([getattr(self, name)[path] for name in INDEXED_COLUMNS]),
+            INDEXED_COLUMNS
+        )
+
+    def percentiles(
+        self,
+        column: str = 'payment',
+        q: Sequence[float] = (5, 50, 95)
+    ) -> Dict[float, np.ndarray]:
+        """Percentis mês a mês de uma coluna entre os cenários.
+
+        Args:
+            column: Nome da coluna ('payment', 'balance', ...)
+            q: Percentis desejados
+
+        Returns:
+            Dicionário ``percentil -> array com um valor por mês``
+        """
+        if column not in INDEXED_COLUMNS:
+            raise ValueError(f"Coluna desconhecida: {column}")
+        values = np.percentile(getattr(self, column), q, axis=0)
+        return dict(zip(q, values))
+
+
+def indexed_schedule(
+    loan_amount: float,
+    annual_rate: float,
+    months: int,
+    index_rates: Union[float, Sequence[float], np.ndarray],
+    system: str = 'PRICE',
+    indexation: str = 'balance'
+) -> IndexedLoanResult:
+    """Calcula cronogramas indexados para uma ou várias trajetórias do índice.
+
+    Args:
+        loan_amount: Valor financiado
+        annual_rate: Taxa de juros anual sobre o índice (%)
+        months: Número de parcelas
+        index_rates: Variação mensal do índice (decimal): escalar,
+            trajetória ``(meses,)`` ou cenários ``(cenários, meses)``
+        system: Sistema de amortização ('PRICE' ou 'SAC')
+        indexation: 'balance' (correção do saldo) ou 'rate' (taxa pós-fixada)
+
+    Returns:
+        IndexedLoanResult com colunas ``(cenários, meses)``
+    """
+    if loan_amount <= 0 or annual_rate < 0 or months <= 0:
+        raise ValueError("Parâmetros inválidos")
+    system = system.upper()
+    if system not in ('PRICE', 'SAC'):
+        raise ValueError("Sistema deve ser 'PRICE' ou 'SAC'")
+    if indexation not in INDEXATION_MODES:
+        raise ValueError("Indexação deve ser 'balance' ou 'rate'")
+
+    index = np.asarray(index_rates, dtype=np.float64)
+    if index.ndim > 2:
+        raise ValueError("Índice deve ter no máximo duas dimensões")
+    index = np.broadcast_to(index, (index.shape[0] if index.ndim == 2 else 1, months))
+    if (index <= -1).any():
+        raise ValueError("Variação do índice deve ser maior que -100%")
+
+    monthly_rate = annual_rate / 100 / 12
+    block = np.empty((len(INDEXED_COLUMNS), index.shape[0], months), dtype=np.float64)
+    if indexation == 'balance':
+        _balance_indexed(block, loan_amount, monthly_rate, index, system)
+    else:
+        _rate_indexed(block, loan_amount, monthly_rate, index, system)
+
+    payment, principal, interest, correction, balance = block
+    total_paid = payment.sum(axis=1)
+    return IndexedLoanResult(
+        loan_amount=loan_amount,
+        interest_rate=annual_rate,
+        months=months,
+        system=system,
+        indexation=indexation,
+        payment=payment,
+        principal=principal,
+        interest=interest,
+        correction=correction,
+        balance=balance,
+        total_paid=total_paid,
+        total_interest=interest.sum(axis=1),
+        total_correction=correction.sum(axis=1),
+    )
+
+
+def simulate_index_paths(
+    annual_mean: float,
+    annual_volatility: float,
+    months: int,
+    n_paths: int = 1000,
+    seed: Optional[int] = None,
+    floor: Optional[float] = None
+) -> np.ndarray:
+    """Sorteia trajetórias mensais de um índice para testes de estresse.
+
+    O log da variação mensal é normal com média ``ln(1+μ)/12`` e desvio
+    ``σ/sqrt(12)``, como nos cenários de ``monte_carlo``.
+
+    Args:
+        annual_mean: Variação anual esperada do índice (%)
+        annual_volatility: Volatilidade anual (%)
+        months: Número de meses
+        n_paths: Número de cenários
+        seed: Semente do gerador
+        floor: Variação mensal mínima (decimal), por exemplo ``0.0`` para a TR
+
+    Returns:
+        Array ``(n_paths, months)`` com a variação mensal (decimal)
+    """
+    rng = np.random.default_rng(seed)
+    drift = np.log1p(annual_mean / 100) / 12
+    shock = annual_volatility / 100 / np.sqrt(12)
+    paths = rng.standard_normal((n_paths, months))
+    paths *= shock
+    paths += drift
+    np.expm1(paths, out=paths)
+    if floor is not None:
+        np.maximum(paths, floor, out=paths)
+    return paths
+
+
+def annual_to_monthly(annual_rates: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """Converte variações anuais (%) em mensais equivalentes (decimal)."""
+    return np.expm1(np.log1p(np.asarray(annual_rates, dtype=np.float64) / 100) / 12)
+
+
+def _balance_indexed(
+    block: np.ndarray,
+    loan_amount: float,
+    monthly_rate: float,
+    index: np.ndarray,
+    system: str
+) -> None:
+    """Correção do saldo: cronograma pré-fixado vezes o fator acumulado."""
+    payment, principal, interest, correction, balance = block
+    kernel = price_schedule if system == 'PRICE' else sac_schedule
+    base = kernel(loan_amount, monthly_rate, block.shape[2])
+
+    growth = np.cumprod(1.0 + index, axis=1)
+    for name, out in zip(SCHEDULE_COLUMNS, (payment, principal, interest, balance)):
+        np.multiply(base[name], growth, out=out)
+
+    # Correção do mês: saldo anterior (em valores do contrato) vezes C_k - C_{k-1}
+    np.multiply(growth, index / (1.0 + index), out=correction)
+    correction[:, 0] *= loan_amount
+    correction[:, 1:] *= base['balance'][:-1]
+
+
+def _rate_indexed(
+    block: np.ndarray,
+    loan_amount: float,
+    monthly_rate: float,
+    index: np.ndarray,
+    system: str
+) -> None:
+    """Taxa pós-fixada: saldos pelo produto acumulado dos fatores mensais."""
+    payment, principal, interest, correction, balance = block
+    months = block.shape[2]
+    rate = (1.0 + index) * (1.0 + monthly_rate) - 1.0
+    correction.fill(0.0)
+
+    if system == 'SAC':
+        amortization = loan_amount / months
+        balance[:] = loan_amount - amortization * np.arange(1, months + 1)
+        balance[:, -1] = 0.0
+        interest[:, 0] = loan_amount
+        interest[:, 1:] = balance[:, :-1]
+        interest *= rate
+        principal.fill(amortization)
+        np.add(interest, amortization, out=payment)
+        return
+
+    # Fator de anuidade pelo prazo restante (incluindo o mês corrente)
+    remaining = np.arange(months, 0, -1, dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        annuity = rate / -np.expm1(-remaining * np.log1p(rate))
+    annuity = np.where(rate == 0, 1.0 / remaining, annuity)
+
+    # Saldo inicial de cada mês: P * f_1 * ... * f_(k-1), f = 1 + j - a
+    opening = interest  # Reaproveitado como buffer antes de virar juros
+    opening[:, 0] = loan_amount
+    np.cumprod(1.0 + rate[:, :-1] - annuity[:, :-1], axis=1, out=opening[:, 1:])
+    opening[:, 1:] *= loan_amount
+
+    np.multiply(opening, annuity, out=payment)
+    balance[:, :-1] = opening[:, 1:]
+    balance[:, -1] = 0.0
+    np.subtract(opening, balance, out=principal)
+    np.multiply(opening, rate, out=interest)
@@ -0,0 +1,168 @@
+"""Valores reais (em reais de hoje) a partir de uma trajetória do IPCA.
+
+O índice de preços acumulado é um único ``cumprod`` sobre a variação
+mensal da inflação:
+
+    I_0 = 1,   I_k = (1 + ipca_1)...(1 + ipca_k)
+
+e um valor nominal do mês ``k`` vale ``valor / I_k`` em reais de hoje. A
+inflação pode ser uma taxa anual constante (convertida em mensal
+equivalente) ou a série mensal do IPCA, em decimal como em
+``indexed_schedule``; uma matriz ``(cenários, meses)`` gera um índice por
+cenário.
+
+Como o índice não depende da simulação, qualquer resultado já calculado
+(cronogramas, ``InvestmentResult``, ``LoanResult``, DataFrames) é
+deflacionado com uma divisão por coluna, sem recalcular nada.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Iterable, Optional, Sequence, Union
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+# Nomes da coluna (ou do índice) com o número do mês nos cronogramas
+MONTH_KEYS = ('month', 'installment', 'mes')
+
+
+def monthly_inflation(
+    months: int,
+    annual_inflation: Optional[float] = None,
+    monthly_rates: Optional[ArrayLike] = None
+) -> np.ndarray:
+    """Variação mensal da inflação (decimal) nos ``months`` primeiros meses.
+
+    Args:
+        months: Número de meses
+        annual_inflation: Inflação anual constante (%)
+        monthly_rates: Série mensal do IPCA (decimal), ``(meses,)`` ou
+            ``(cenários, meses)``; pode ser mais longa que ``months``
+
+    Returns:
+        Array ``(meses,)`` ou ``(cenários, meses)``
+    """
+    if months < 0:
+        raise ValueError("Prazo deve ser não negativo")
+    if (annual_inflation is None) == (monthly_rates is None):
+        raise ValueError("Informe a inflação anual ou a série mensal do IPCA (apenas uma)")
+    if annual_inflation is not None:
+        if annual_inflation <= -100:
+            raise ValueError("Inflação deve ser maior que -100%")
+        rate = np.expm1(np.log1p(annual_inflation / 100) / 12)
+        return np.full(months, rate)
+
+    rates = np.asarray(monthly_rates, dtype=np.float64)
+    if rates.ndim not in (1, 2):
+        raise ValueError("Série do IPCA deve ter uma ou duas dimensões")
+    if rates.shape[-1] < months:
+        raise ValueError("Série do IPCA menor que o prazo")
+    rates = rates[..., :months]
+    if (rates <= -1).any():
+        raise ValueError("Variação do IPCA deve ser maior que -100%")
+    return rates
+
+
+def price_index(
+    months: int,
+    annual_inflation: Optional[float] = None,
+    monthly_rates: Optional[ArrayLike] = None
+) -> np.ndarray:
+    """Índice de preços acumulado ``I_0..I_months``, com ``I_0 = 1``.
+
+    Returns:
+        Array ``(meses + 1,)`` ou ``(cenários, meses + 1)``
+    """
+    rates = monthly_inflation(months, annual_inflation, monthly_rates)
+    index = np.empty(rates.shape[:-1] + (months + 1,))
+    index[..., 0] = 1.0
+    np.cumprod(1.0 + rates, axis=-1, out=index[..., 1:])
+    return index
+
+
+def deflator(
+    months: int,
+    annual_inflation: Optional[float] = None,
+    monthly_rates: Optional[ArrayLike] = None
+) -> np.ndarray:
+    """Fator que converte valores de cada mês em reais de hoje (``1 / I_k``)."""
+    return 1.0 / price_index(months, annual_inflation, monthly_rates)
+
+
+def to_real(
+    values: ArrayLike,
+    months: ArrayLike,
+    annual_inflation: Optional[float] = None,
+    monthly_rates: Optional[ArrayLike] = None
+) -> np.ndarray:
+    """Converte valores nominais em reais de hoje.
+
+    Args:
+        values: Valores nominais; a última dimensão acompanha ``months``
+        months: Mês de cada valor (0 = hoje)
+        annual_inflation: Inflação anual constante (%)
+        monthly_rates: Série mensal do IPCA (decimal)
+
+    Returns:
+        Valores reais, com a forma de ``values`` combinada à dos cenários
+    """
+    months = np.asarray(months, dtype=np.int64)
+    if (months < 0).any():
+        raise ValueError("Meses devem ser não negativos")
+    horizon = int(months.max()) if months.size else 0
+    index = price_index(horizon, annual_inflation, monthly_rates)
+    return np.asarray(values, dtype=np.float64) / index[..., months]
+
+
+def real_values(
+    result,
+    annual_inflation: Optional[float] = None,
+    monthly_rates: Optional[ArrayLike] = None,
+    columns: Optional[Iterable[str]] = None,
+    month_column: Optional[str] = None
+) -> pd.DataFrame:
+    """Deflaciona as colunas de um resultado já calculado.
+
+    Args:
+        result: DataFrame, ``ScheduleTable``, ``ScheduleRows``, resultado
+            com ``to_dataframe()`` (``InvestmentResult``, ``LoanResult``) ou
+            lista de dicionários (``evolucao_mensal``)
+        annual_inflation: Inflação anual constante (%)
+        monthly_rates: Série mensal do IPCA (decimal), uma trajetória
+        columns: Colunas a deflacionar; padrão são todas as numéricas
+            exceto a do mês
+        month_column: Coluna com o número do mês; padrão é a coluna ou o
+            índice de ``MONTH_KEYS``, ou a posição da linha (base 1)
+
+    Returns:
+        Cópia do DataFrame com as colunas em reais de hoje
+    """
+    if isinstance(result, pd.DataFrame):
+        frame = result.copy()
+    elif hasattr(result, 'to_dataframe'):
+        # Cronogramas compartilham o bloco com o resultado: copia antes de alterar
+        frame = result.to_dataframe().copy()
+    else:
+        frame = pd.DataFrame(list(result))
+    if month_column is None:
+        month_column = next((name for name in MONTH_KEYS if name in frame.columns), None)
+    if month_column is not None:
+        months = frame[month_column].to_numpy()
+    elif frame.index.name in MONTH_KEYS:
+        months = frame.index.to_numpy()
+    else:
+        months = np.arange(1, len(frame) + 1)
+
+    if columns is None:
+        columns = [
+            name for name in frame.columns
+            if name != month_column and pd.api.types.is_numeric_dtype(frame[name])
+        ]
+    columns = list(columns)
+    if np.ndim(monthly_rates) > 1:
+        raise ValueError("Informe uma única trajetória do IPCA")
+    factor = 1.0 / price_index(
+        int(months.max()) if len(months) else 0, annual_inflation, monthly_rates
+    )[months.astype(np.int64)]
+    frame[columns] = frame[columns].to_numpy(dtype=np.float64) * factor[:, None]
+    return frame
@@ -0,0 +1,94 @@
+"""Juros compostos em forma fechada.
+
+Reproduz a convenção de ``FinancialCalculators.compound_interest``: os
+juros incidem todo mês e o aporte é somado ao fim de cada mês, exceto no
+último. Os totais saem em tempo constante; a evolução mensal só é
+calculada quando solicitada.
+"""
+
+import math
+import numpy as np
+from typing import Tuple
+
+from .amortization import _periods
+from .results import ScheduleTable
+
+COMPOUND_COLUMNS = ('contribution', 'interest', 'balance')
+
+
+def compound_totals(
+    principal: float,
+    monthly_rate: float,
+    months: int,
+    contribution: float = 0
+) -> Tuple[float, float]:
+    """Calcula montante final e total investido sem percorrer os meses.
+
+    Com ``g = 1 + i``, o saldo após ``m < n`` meses é
+    ``P*g^m + c*(g^m - 1)/i`` e o último mês apenas rende juros.
+
+    Args:
+        principal: Valor inicial
+        monthly_rate: Taxa de juros mensal (decimal)
+        months: Período em meses
+        contribution: Aporte mensal
+
+    Returns:
+        Tupla (montante final, total investido)
+    """
+    if months == 0:
+        return principal, principal
+
+    contributions = months - 1
+    total_invested = principal + contribution * contributions
+
+    if monthly_rate == 0:
+        return total_invested, total_invested
+
+    log_growth = math.log1p(monthly_rate)
+    growth = math.exp(months * log_growth)
+    # c * g * (g^(n-1) - 1) / i, com expm1 para taxas pequenas
+    annuity = math.expm1(contributions * log_growth) / monthly_rate
+    final_amount = principal * growth + contribution * (1 + monthly_rate) * annuity
+
+    return final_amount, total_invested
+
+
+def compound_schedule(
+    principal: float,
+    monthly_rate: float,
+    months: int,
+    contribution: float = 0
+) -> ScheduleTable:
+    """Gera a evolução mensal como colunas ``float64``.
+
+    Args:
+        principal: Valor inicial
+        monthly_rate: Taxa de juros mensal (decimal)
+        months: Período em meses
+        contribution: Aporte mensal
+
+    Returns:
+        ScheduleTable com as colunas 'contribution', 'interest' e 'balance'
+    """
+    elapsed = _periods(months)[:-1]
+
+    # Saldo no início de cada mês
+    if monthly_rate == 0:
+        opening = principal + contribution * elapsed
+    else:
+        growth_minus_one = np.expm1(elapsed * math.log1p(monthly_rate))
+        opening = principal + principal * growth_minus_one
+        opening += growth_minus_one * (contribution / monthly_rate)
+
+    table = ScheduleTable.empty(COMPOUND_COLUMNS, months)
+    data = table.data
+    contributions, interest, balance = data[0], data[1], data[2]
+    contributions.fill(contribution)
+    if months:
+        contributions[-1] = 0.0  # Não adiciona aporte no último mês
+
+    np.multiply(opening, monthly_rate, out=interest)
+    np.add(opening, interest, out=balance)
+    balance += contributions
+    return table
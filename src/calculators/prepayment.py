@@ -0,0 +1,285 @@
+"""Amortizações extraordinárias (pré-pagamentos) com recálculo incremental.
+
+O cronograma é dividido em segmentos entre eventos. Dentro de um segmento
+o financiamento segue uma regra fixa (parcela fixa no PRICE, amortização
+fixa no SAC) e as colunas saem em forma fechada. Cada segmento guarda o
+estado do contrato ao seu fim (saldo, parcela ou amortização e mês de
+quitação), de modo que editar um evento recalcula apenas a partir do
+segmento que contém o mês alterado; o prefixo é reaproveitado.
+
+Após um pagamento extra, o contrato pode:
+    ``'reduce_term'``: manter a parcela (PRICE) ou a amortização (SAC) e
+        quitar antes
+    ``'reduce_payment'``: manter o mês de quitação e reduzir a parcela
+
+Example:
+    >>> sim = PrepaymentSimulator(250000, 9.5, 360, 'PRICE')
+    >>> sim.add_event(12, 20000, 'reduce_term')
+    >>> sim.result().months  # doctest: +SKIP
+    297
+"""
+
+import bisect
+import math
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .amortization import _periods, price_payment
+from .results import ScheduleTable
+
+
+PREPAYMENT_MODES = ('reduce_term', 'reduce_payment')
+PREPAYMENT_COLUMNS = ('payment', 'principal', 'interest', 'prepayment', 'balance')
+
+# Tolerância para arredondar o número de parcelas restantes para cima
+_TERM_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class PrepaymentEvent:
+    """Pagamento extra feito junto com a parcela do mês informado."""
+    month: int
+    amount: float
+    mode: str = 'reduce_term'
+
+    def __post_init__(self):
+        if self.month < 1 or self.amount <= 0:
+            raise ValueError("Evento deve ter mês a partir de 1 e valor positivo")
+        if self.mode not in PREPAYMENT_MODES:
+            raise ValueError("Modo deve ser 'reduce_term' ou 'reduce_payment'")
+
+
+@dataclass
+class PrepaymentResult:
+    """Resultado do financiamento com amortizações extraordinárias."""
+    schedule: ScheduleTable
+    months: int
+    total_paid: float
+    total_interest: float
+    total_prepaid: float
+    interest_saved: float
+
+
+class _State(NamedTuple):
+    """Contrato após o mês ``month``: saldo, parcela/amortização e quitação."""
+    month: int
+    balance: float
+    level: float
+    end: int
+
+
+class _Segment(NamedTuple):
+    stop: int
+    block: np.ndarray
+    after: _State
+
+
+class PrepaymentSimulator:
+    """Simulador interativo de amortizações extraordinárias.
+
+    Mantém os segmentos já calculados entre edições; cada alteração nos
+    eventos recalcula somente o sufixo do cronograma.
+    """
+
+    def __init__(
+        self,
+        loan_amount: float,
+        annual_rate: float,
+        months: int,
+        system: str = 'PRICE',
+        events: Iterable[Union[PrepaymentEvent, Tuple]] = ()
+    ):
+        """Inicializa o simulador.
+
+        Args:
+            loan_amount: Valor financiado
+            annual_rate: Taxa de juros anual (%)
+            months: Prazo original em meses
+            system: Sistema de amortização ('PRICE' ou 'SAC')
+            events: Eventos iniciais, ``PrepaymentEvent`` ou tuplas
+                ``(mês, valor[, modo])``
+        """
+        if loan_amount <= 0 or annual_rate < 0 or months <= 0:
+            raise ValueError("Parâmetros inválidos")
+        system = system.upper()
+        if system not in ('PRICE', 'SAC'):
+            raise ValueError("Sistema deve ser 'PRICE' ou 'SAC'")
+
+        self.loan_amount = loan_amount
+        self.annual_rate = annual_rate
+        self.months = months
+        self.system = system
+        self.monthly_rate = annual_rate / 100 / 12
+
+        if system == 'PRICE':
+            level = price_payment(loan_amount, self.monthly_rate, months)
+            baseline_paid = level * months
+        else:
+            level = loan_amount / months
+            baseline_paid = loan_amount + loan_amount * self.monthly_rate * (months + 1) / 2
+        self._initial = _State(0, loan_amount, level, months)
+        self._baseline_interest = baseline_paid - loan_amount
+
+        self._events: Dict[int, PrepaymentEvent] = {}
+        self._months: List[int] = []
+        self._segments: List[_Segment] = []
+        self._result: Optional[PrepaymentResult] = None
+        self.set_events(events)
+        self._rebuild(1)
+
+    @property
+    def events(self) -> List[PrepaymentEvent]:
+        """Eventos em ordem de mês."""
+        return [self._events[month] for month in self._months]
+
+    def add_event(self, month: int, amount: float, mode: str = 'reduce_term') -> None:
+        """Inclui (ou substitui) o pagamento extra de um mês."""
+        self._apply({month: PrepaymentEvent(month, amount, mode)}, ())
+
+    def remove_event(self, month: int) -> None:
+        """Remove o pagamento extra de um mês."""
+        if month not in self._events:
+            raise KeyError(f"Nenhum evento no mês {month}")
+        self._apply({}, (month,))
+
+    def set_events(self, events: Iterable[Union[PrepaymentEvent, Tuple]]) -> None:
+        """Substitui todos os eventos, recalculando a partir da primeira diferença."""
+        new = {}
+        for event in events:
+            if not isinstance(event, PrepaymentEvent):
+                event = PrepaymentEvent(*event)
+            new[event.month] = event
+        changed = {m: e for m, e in new.items() if self._events.get(m) != e}
+        removed = [m for m in self._events if m not in new]
+        self._apply(changed, removed)
+
+    def clear(self) -> None:
+        """Remove todos os eventos."""
+        self._apply({}, list(self._events))
+
+    def schedule(self) -> ScheduleTable:
+        """Cronograma com as colunas de ``PREPAYMENT_COLUMNS``."""
+        return self.result().schedule
+
+    def result(self) -> PrepaymentResult:
+        """Cronograma e totais, montados a partir dos segmentos em cache."""
+        if self._result is None:
+            # Cópia: edições posteriores não alteram resultados já entregues
+            data = np.concatenate([segment.block for segment in self._segments], axis=1)
+            payment, _, interest, prepayment, _ = data.sum(axis=1).tolist()
+            self._result = PrepaymentResult(
+                schedule=ScheduleTable(data, PREPAYMENT_COLUMNS),
+                months=data.shape[1],
+                total_paid=payment + prepayment,
+                total_interest=interest,
+                total_prepaid=prepayment,
+                interest_saved=self._baseline_interest - interest,
+            )
+        return self._result
+
+    def _apply(self, changed: Dict[int, PrepaymentEvent], removed: Iterable[int]) -> None:
+        months = list(changed) + list(removed)
+        if not months:
+            return
+        for month in removed:
+            del self._events[month]
+        self._events.update(changed)
+        self._months = sorted(self._events)
+        if self._segments:
+            self._rebuild(min(months))
+
+    def _rebuild(self, month: int) -> None:
+        """Recalcula os segmentos a partir do que contém ``month``."""
+        segments = self._segments
+        keep = 0
+        while keep < len(segments) and segments[keep].stop < month:
+            keep += 1
+        del segments[keep:]
+        self._result = None
+
+        state = segments[-1].after if segments else self._initial
+        while state.month < state.end:
+            index = bisect.bisect_right(self._months, state.month)
+            event = None
+            stop = state.end
+            if index < len(self._months) and self._months[index] < state.end:
+                event = self._events[self._months[index]]
+                stop = event.month
+            block, state = self._segment(state, stop, event)
+            segments.append(_Segment(stop, block, state))
+
+    def _segment(
+        self,
+        state: _State,
+        stop: int,
+        event: Optional[PrepaymentEvent]
+    ) -> Tuple[np.ndarray, _State]:
+        """Colunas dos meses ``state.month + 1 .. stop`` e o estado ao fim."""
+        rate = self.monthly_rate
+        count = stop - state.month
+        block = np.empty((len(PREPAYMENT_COLUMNS), count), dtype=np.float64)
+        payments, principal, interest, prepayment, balance = block
+        elapsed = _periods(count)[1:]
+
+        if self.system == 'PRICE' and rate > 0:
+            # Saldo com parcela fixa: B*g^k - PMT*(g^k - 1)/i
+            np.multiply(elapsed, math.log1p(rate), out=balance)
+            np.expm1(balance, out=balance)
+            balance *= state.balance - state.level / rate
+            balance += state.balance
+        else:
+            # Amortização constante: PRICE sem juros e SAC
+            np.multiply(elapsed, -state.level, out=balance)
+            balance += state.balance
+        np.maximum(balance, 0.0, out=balance)
+
+        interest[0] = state.balance * rate
+        np.multiply(balance[:-1], rate, out=interest[1:])
+        if self.system == 'PRICE':
+            payments.fill(state.level)
+            np.subtract(payments, interest, out=principal)
+        else:
+            principal.fill(state.level)
+            np.add(principal, interest, out=payments)
+        prepayment.fill(0.0)
+
+        closing = float(balance[-2]) if count > 1 else state.balance
+        if stop == state.end:
+            # A última parcela quita exatamente o saldo restante
+            principal[-1] = closing
+            payments[-1] = closing + interest[-1]
+            balance[-1] = 0.0
+            return block, _State(stop, 0.0, state.level, stop)
+
+        remaining = float(balance[-1])
+        extra = min(event.amount, remaining)
+        prepayment[-1] = extra
+        remaining -= extra
+        balance[-1] = remaining
+        if remaining <= 0:
+            return block, _State(stop, 0.0, state.level, stop)
+        level, end = self._reschedule(remaining, state, stop, event.mode)
+        return block, _State(stop, remaining, level, end)
+
+    def _reschedule(
+        self,
+        balance: float,
+        state: _State,
+        month: int,
+        mode: str
+    ) -> Tuple[float, int]:
+        """Nova parcela/amortização e mês de quitação após um pagamento extra."""
+        rate = self.monthly_rate
+        if mode == 'reduce_payment':
+            remaining = state.end - month
+            if self.system == 'PRICE':
+                return price_payment(balance, rate, remaining), state.end
+            return balance / remaining, state.end
+
+        # reduce_term: mantém o nível e calcula as parcelas restantes
+        if self.system == 'PRICE' and rate > 0:
+            remaining = -math.log1p(-balance * rate / state.level) / math.log1p(rate)
+        else:
+            remaining = balance / state.level
+        return state.level, month + max(math.ceil(remaining - _TERM_TOLERANCE), 1)
@@ -0,0 +1,175 @@
+"""Tabelas pré-calculadas de fatores por (taxa, prazo) do catálogo.
+
+Quase todas as simulações usam poucas taxas de produtos e prazos padrão.
+Para essas combinações, os fatores ficam prontos em uma tabela e os totais
+de ``loan_calculator`` e ``compound_interest`` saem de uma consulta a
+dicionário e uma multiplicação. Para uma taxa mensal ``i`` e prazo ``n``:
+
+    crescimento  g = (1 + i)^n
+    parcela      PMT / PV = i*g / (g - 1)      (1/n para taxa zero)
+    anuidade     FV / aporte = (g - 1) / i     (n para taxa zero)
+
+A tabela é montada na importação com as taxas do ``ProductCatalog`` e os
+passos de taxa dos formulários do app (``INPUT_RATES``), ou lida de um
+arquivo ``.npz`` indicado em ``CALCULATOR_RATE_TABLE`` (gerado com
+``RateFactorTable.save``). Combinações fora da tabela seguem o cálculo
+normal.
+"""
+
+import os
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from ..knowledge_base.product_catalog import ProductCatalog
+
+STANDARD_TERMS = (12, 24, 36, 48, 60, 120, 360)
+
+# Taxas anuais (%) que os campos do app geram: passo de 0,5 até 36% a.a.
+INPUT_RATES = tuple(step / 2 for step in range(1, 73))
+
+
+@dataclass(frozen=True)
+class RateFactors:
+    """Fatores de uma combinação (taxa, prazo)."""
+    growth: float
+    payment: float
+    annuity: float
+
+
+def build_factors(
+    monthly_rates: np.ndarray,
+    terms: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calcula crescimento, parcela e anuidade para uma grade taxa × prazo.
+
+    Args:
+        monthly_rates: Taxas mensais (decimal), forma ``(taxas,)``
+        terms: Prazos em meses, forma ``(prazos,)``
+
+    Returns:
+        Tupla de arrays ``(taxas, prazos)``: (crescimento, parcela, anuidade)
+    """
+    rate = np.asarray(monthly_rates, dtype=np.float64)[:, None]
+    months = np.asarray(terms, dtype=np.float64)[None, :]
+    growth_minus_one = np.expm1(months * np.log1p(rate))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        annuity = np.where(rate == 0, months, growth_minus_one / rate)
+    return growth_minus_one + 1.0, 1.0 / annuity + rate, annuity
+
+
+class RateFactorTable:
+    """Fatores pré-calculados para taxas registradas e prazos padrão.
+
+    As consultas usam a taxa mensal calculada como ``taxa_anual / 100 / 12``,
+    a mesma expressão das calculadoras, de modo que a chave coincide
+    exatamente com o valor que elas calculam.
+    """
+
+    def __init__(
+        self,
+        annual_rates: Iterable[float] = (),
+        terms: Iterable[int] = STANDARD_TERMS
+    ):
+        self._rates = np.empty(0)
+        self._terms = np.asarray(sorted(set(int(term) for term in terms)), dtype=np.int64)
+        if (self._terms <= 0).any():
+            raise ValueError("Prazos devem ser positivos")
+        self._index: Dict[Tuple[float, int], RateFactors] = {}
+        self.register(annual_rates)
+
+    @property
+    def rates(self) -> np.ndarray:
+        """Taxas anuais registradas (%), em ordem crescente."""
+        return self._rates
+
+    @property
+    def terms(self) -> np.ndarray:
+        """Prazos da tabela, em meses."""
+        return self._terms
+
+    def register(self, annual_rates: Iterable[float]) -> None:
+        """Registra taxas anuais (%) e calcula seus fatores para todos os prazos."""
+        rates = np.asarray(list(annual_rates), dtype=np.float64)
+        if (rates < 0).any():
+            raise ValueError("Taxas devem ser positivas")
+        rates = np.setdiff1d(rates, self._rates)
+        if rates.size == 0:
+            return
+        self._rates = np.union1d(self._rates, rates)
+        monthly = rates / 100 / 12
+        growth, payment, annuity = build_factors(monthly, self._terms)
+        terms = self._terms.tolist()
+        for r, rate in enumerate(monthly.tolist()):
+            for t, months in enumerate(terms):
+                self._index[(rate, months)] = RateFactors(
+                    float(growth[r, t]), float(payment[r, t]), float(annuity[r, t])
+                )
+
+    def get(self, monthly_rate: float, months: int) -> Optional[RateFactors]:
+        """Fatores da combinação, ou ``None`` se ela não estiver na tabela."""
+        return self._index.get((monthly_rate, months))
+
+    def factors(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Arrays ``(taxas, prazos)`` de crescimento, parcela e anuidade."""
+        return build_factors(self._rates / 100 / 12, self._terms)
+
+    def save(self, path: str) -> str:
+        """Grava a tabela em ``.npz`` (taxas, prazos e fatores)."""
+        growth, payment, annuity = self.factors()
+        with open(path, 'wb') as handle:
+            np.savez(handle, rates=self._rates, terms=self._terms,
+                     growth=growth, payment=payment, annuity=annuity)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> 'RateFactorTable':
+        """Lê uma tabela gravada por ``save`` sem recalcular os fatores."""
+        with np.load(path) as data:
+            table = cls(terms=data['terms'].tolist())
+            table._rates = data['rates']
+            monthly = (table._rates / 100 / 12).tolist()
+            terms = table._terms.tolist()
+            growth, payment, annuity = (data[name].tolist()
+                                        for name in ('growth', 'payment', 'annuity'))
+        for r, rate in enumerate(monthly):
+            for t, months in enumerate(terms):
+                table._index[(rate, months)] = RateFactors(
+                    growth[r][t], payment[r][t], annuity[r][t]
+                )
+        return table
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f"RateFactorTable({self._rates.size} taxas x {self._terms.size} prazos)"
+
+
+def catalog_table(
+    catalog: Optional[ProductCatalog] = None,
+    terms: Iterable[int] = STANDARD_TERMS
+) -> RateFactorTable:
+    """Monta a tabela com as taxas do catálogo e os passos do app.
+
+    Args:
+        catalog: Catálogo de produtos; padrão é o catálogo do banco
+        terms: Prazos da tabela, em meses
+
+    Returns:
+        RateFactorTable com as taxas dos produtos e ``INPUT_RATES``
+    """
+    catalog = catalog or ProductCatalog()
+    return RateFactorTable(catalog.get_annual_rates() + list(INPUT_RATES), terms)
+
+
+def _table_from_env() -> RateFactorTable:
+    """Lê a tabela de ``CALCULATOR_RATE_TABLE`` ou monta a do catálogo."""
+    path: Optional[str] = os.getenv('CALCULATOR_RATE_TABLE')
+    if path and os.path.exists(path):
+        return RateFactorTable.load(path)
+    return catalog_table()
+
+
+# Instância compartilhada, montada na importação
+rate_factors = _table_from_env()
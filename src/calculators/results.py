@@ -0,0 +1,233 @@
+"""Estruturas compactas para resultados das calculadoras.
+
+Os cronogramas ficam em um único bloco ``float64`` contíguo (uma linha
+por coluna), exposto sem cópia como array NumPy ou DataFrame. A visão em
+linhas de dicionários é mantida para consumidores legados.
+"""
+
+import numpy as np
+import pandas as pd
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+
+class ScheduleTable(Mapping):
+    """Cronograma em colunas armazenado em um bloco contíguo.
+
+    O bloco é ``float64``, ou ``int64`` nos cronogramas em centavos.
+
+    Comporta-se como um dicionário ``nome -> coluna``; cada coluna é uma
+    visão de uma linha do bloco ``data`` de forma ``(colunas, meses)``.
+    """
+
+    __slots__ = ('data', 'names', '_positions')
+
+    def __init__(self, data: np.ndarray, names: Tuple[str, ...]):
+        """Inicializa a tabela.
+
+        Args:
+            data: Bloco de forma ``(len(names), meses)``
+            names: Nomes das colunas, na ordem das linhas de ``data``
+        """
+        if data.ndim != 2 or data.shape[0] != len(names):
+            raise ValueError("Bloco incompatível com as colunas informadas")
+        self.data = data
+        self.names = tuple(names)
+        self._positions = _column_positions(self.names)
+
+    @classmethod
+    def empty(cls, names: Tuple[str, ...], length: int, dtype=np.float64) -> 'ScheduleTable':
+        """Aloca uma tabela não inicializada para os kernels preencherem."""
+        table = cls.__new__(cls)
+        table.data = np.empty((len(names), length), dtype=dtype)
+        table.names = names
+        table._positions = _column_positions(names)
+        return table
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray]) -> 'ScheduleTable':
+        """Cria a tabela copiando colunas avulsas para um bloco contíguo."""
+        if isinstance(columns, cls):
+            return columns
+        names = tuple(columns)
+        if not names:
+            return cls.empty((), 0)
+        data = np.stack([np.asarray(columns[name], dtype=np.float64) for name in names])
+        return cls(data, names)
+
+    def renamed(self, names: Tuple[str, ...]) -> 'ScheduleTable':
+        """Mesma tabela com outros nomes de colunas, sem copiar o bloco."""
+        return type(self)(self.data, names)
+
+    @property
+    def length(self) -> int:
+        """Número de meses do cronograma."""
+        return self.data.shape[1]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.data[self._positions[name]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"ScheduleTable({', '.join(self.names)}; {self.length} meses)"
+
+    def to_numpy(self) -> np.ndarray:
+        """Visão ``(meses, colunas)`` do bloco, sem cópia."""
+        return self.data.T
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """DataFrame com uma coluna por campo, compartilhando o bloco."""
+        return pd.DataFrame(self.data.T, columns=list(self.names), copy=False)
+
+
+@lru_cache(maxsize=64)
+def _column_positions(names: Tuple[str, ...]) -> Dict[str, int]:
+    """Mapeia nome da coluna para linha do bloco, compartilhado entre tabelas."""
+    return {name: index for index, name in enumerate(names)}
+
+
+class ScheduleRows(Sequence):
+    """Visão em linhas (dicionários) de um cronograma em colunas.
+
+    Mantém compatibilidade com consumidores que esperam uma lista de
+    dicionários por parcela, criando cada linha apenas quando acessada.
+    As colunas também podem ser adiadas até o primeiro acesso.
+
+    A visão é somente leitura: as colunas são expostas como arrays não
+    graváveis, pois o mesmo resultado pode estar em cache e ser
+    compartilhado entre sessões.
+    """
+
+    __slots__ = ('_source', '_index_key', '_length', '_width')
+
+    def __init__(
+        self,
+        columns: Union[Dict[str, np.ndarray], Callable[[], Dict[str, np.ndarray]]],
+        index_key: str = 'installment',
+        length: Optional[int] = None,
+        width: int = 0
+    ):
+        """Inicializa a visão.
+
+        Args:
+            columns: ``ScheduleTable``, colunas avulsas de mesmo tamanho ou
+                função sem argumentos que as gera sob demanda
+            index_key: Nome da chave com o número da parcela (base 1)
+            length: Número de linhas; obrigatório para colunas adiadas
+            width: Número de colunas que as colunas adiadas terão, usado
+                para estimar a memória antes de gerá-las
+        """
+        if isinstance(columns, ScheduleTable):
+            columns = _read_only(columns)
+            length = columns.length
+        elif not callable(columns):
+            columns = _read_only(ScheduleTable.from_columns(columns))
+            length = columns.length
+        elif length is None:
+            raise ValueError("Informe o tamanho para colunas adiadas")
+        self._source = columns
+        self._index_key = index_key
+        self._length = length
+        self._width = width
+
+    @property
+    def table(self) -> ScheduleTable:
+        """Tabela do cronograma, gerada no primeiro acesso se adiada."""
+        if callable(self._source):
+            self._source = _read_only(ScheduleTable.from_columns(self._source()))
+        return self._source
+
+    @property
+    def columns(self) -> ScheduleTable:
+        """Alias de ``table``, no formato ``nome -> coluna``."""
+        return self.table
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados pelas colunas.
+
+        Enquanto adiadas, estima o bloco ``float64`` completo a partir de
+        ``width``, para que o cache não subestime o resultado.
+        """
+        if callable(self._source):
+            return self._width * self._length * np.dtype(np.float64).itemsize
+        return self._source.data.nbytes
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._length))]
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Parcela fora do cronograma")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Dict[str, float]]:
+        return iter(self.to_list())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __reduce__(self):
+        # Resolve colunas adiadas para que a visão possa ser serializada
+        return (type(self), (self.table, self._index_key))
+
+    def __repr__(self) -> str:
+        return f"ScheduleRows({self._length} linhas)"
+
+    def _row(self, index: int) -> Dict[str, float]:
+        table = self.table
+        row = {self._index_key: index + 1}
+        row.update(zip(table.names, table.data[:, index].tolist()))
+        return row
+
+    def to_list(self) -> List[Dict[str, float]]:
+        """Materializa todas as linhas como lista de dicionários."""
+        table = self.table
+        build = _row_builder((self._index_key,) + table.names)
+        return build(zip(range(1, self._length + 1), *table.data.tolist()))
+
+    def to_numpy(self) -> np.ndarray:
+        """Visão ``(meses, colunas)`` do cronograma, sem cópia."""
+        return self.table.to_numpy()
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """DataFrame do cronograma com a numeração das linhas como índice."""
+        df = self.table.to_dataframe()
+        df.index = pd.RangeIndex(1, self._length + 1, name=self._index_key)
+        return df
+
+
+def _read_only(table: ScheduleTable) -> ScheduleTable:
+    """Mesma tabela sobre uma visão não gravável do bloco, sem cópia."""
+    data = table.data.view()
+    data.flags.writeable = False
+    return type(table)(data, table.names)
+
+
+@lru_cache(maxsize=64)
+def _row_builder(keys: Tuple[str, ...]) -> Callable:
+    """Função que monta as linhas de dicionários para as chaves informadas.
+
+    Os formatos usuais (numeração mais três ou quatro colunas) usam
+    dicionários literais, cerca de duas vezes mais rápidos que ``dict(zip())``.
+    """
+    if len(keys) == 4:
+        k0, k1, k2, k3 = keys
+        return lambda rows: [{k0: a, k1: b, k2: c, k3: d} for a, b, c, d in rows]
+    if len(keys) == 5:
+        k0, k1, k2, k3, k4 = keys
+        return lambda rows: [{k0: a, k1: b, k2: c, k3: d, k4: e} for a, b, c, d, e in rows]
+    return lambda rows: [dict(zip(keys, row)) for row in rows]
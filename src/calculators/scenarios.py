@@ -0,0 +1,188 @@
+"""Grade de cenários para comparação de investimentos.
+
+Avalia N produtos × M prazos × K aportes mensais de uma vez, por
+broadcasting da forma fechada de ``compound_totals``, e seleciona os
+melhores produtos com ``argpartition`` (O(N) por cenário) em vez de
+ordenar a lista inteira.
+"""
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+
+@dataclass
+class ScenarioCube:
+    """Resultados de uma grade produtos × prazos × aportes.
+
+    Os arrays de resultado têm forma ``(produtos, prazos, aportes)``; o
+    total investido não depende do produto e tem forma ``(prazos, aportes)``.
+    """
+    names: Tuple[str, ...]
+    rates: np.ndarray
+    horizons: np.ndarray
+    contributions: np.ndarray
+    principal: float
+    final_amount: np.ndarray
+    total_invested: np.ndarray
+    total_interest: np.ndarray
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """Forma do cubo ``(produtos, prazos, aportes)``."""
+        return self.final_amount.shape
+
+    def top_k(self, k: int) -> np.ndarray:
+        """Índices dos ``k`` produtos de maior montante em cada cenário.
+
+        Args:
+            k: Número de produtos
+
+        Returns:
+            Array ``(k, prazos, aportes)`` ordenado do maior para o menor
+        """
+        return top_k_indices(self.final_amount, k)
+
+    def ranking(
+        self,
+        horizon: int,
+        contribution: float = 0,
+        k: Optional[int] = None
+    ) -> pd.DataFrame:
+        """Ranking dos produtos em um cenário da grade.
+
+        Args:
+            horizon: Prazo em meses (deve estar na grade)
+            contribution: Aporte mensal (deve estar na grade)
+            k: Número de produtos; todos se omitido
+
+        Returns:
+            DataFrame com nome, taxa, montante, rendimento e retorno (%)
+        """
+        m = _grid_position(self.horizons, horizon, "Prazo")
+        c = _grid_position(self.contributions, contribution, "Aporte")
+        final = self.final_amount[:, m, c]
+        order = top_k_indices(final, len(final) if k is None else k)
+        invested = self.total_invested[m, c]
+        interest = self.total_interest[order, m, c]
+
+        return pd.DataFrame({
+            'name': [self.names[i] for i in order],
+            'rate': self.rates[order],
+            'final_amount': final[order],
+            'total_return': interest,
+            'return_percentage': interest / invested * 100 if invested else np.nan,
+        })
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Cubo em formato longo, indexado por produto, prazo e aporte."""
+        index = pd.MultiIndex.from_product(
+            [list(self.names), self.horizons, self.contributions],
+            names=['name', 'months', 'contribution']
+        )
+        invested = np.broadcast_to(self.total_invested, self.shape)
+        return pd.DataFrame({
+            'final_amount': self.final_amount.ravel(),
+            'total_invested': invested.ravel(),
+            'total_interest': self.total_interest.ravel(),
+        }, index=index)
+
+
+def scenario_grid(
+    principal: float,
+    annual_rates: Sequence[float],
+    horizons: Sequence[int],
+    contributions: Sequence[float] = (0,),
+    names: Optional[Sequence[str]] = None
+) -> ScenarioCube:
+    """Calcula juros compostos para todas as combinações de taxa, prazo e aporte.
+
+    Segue a convenção de ``FinancialCalculators.compound_interest``: taxa
+    nominal anual dividida por 12 e sem aporte no último mês.
+
+    Args:
+        principal: Valor inicial
+        annual_rates: Taxas de juros (% ao ano), uma por produto
+        horizons: Prazos em meses
+        contributions: Aportes mensais
+        names: Nomes dos produtos; padrão é a posição na lista
+
+    Returns:
+        ScenarioCube com montantes de forma ``(produtos, prazos, aportes)``
+    """
+    rates = np.asarray(annual_rates, dtype=np.float64).ravel()
+    months = np.asarray(horizons, dtype=np.int64).ravel()
+    contribs = np.asarray(contributions, dtype=np.float64).ravel()
+    if names is None:
+        names = [str(i) for i in range(rates.size)]
+    if len(names) != rates.size:
+        raise ValueError("Número de nomes difere do número de taxas")
+    if principal < 0 or (rates < 0).any() or (months < 0).any() or (contribs < 0).any():
+        raise ValueError("Valores devem ser positivos")
+
+    monthly_rate = (rates / 100 / 12)[:, None, None]
+    n = months[None, :, None].astype(np.float64)
+    c = contribs[None, None, :]
+    payments = np.maximum(n - 1, 0)  # Sem aporte no último mês
+
+    log_growth = np.log1p(monthly_rate)
+    growth = np.exp(n * log_growth)
+    # Montante dos aportes: c * g * (g^(n-1) - 1) / i, ou c * (n-1) sem juros
+    with np.errstate(divide='ignore', invalid='ignore'):
+        annuity = np.where(
+            monthly_rate > 0,
+            np.expm1(payments * log_growth) / monthly_rate * (1 + monthly_rate),
+            payments
+        )
+    final_amount = principal * growth + c * annuity
+
+    total_invested = principal + contribs[None, :] * np.maximum(months - 1, 0)[:, None]
+    return ScenarioCube(
+        names=tuple(names),
+        rates=rates,
+        horizons=months,
+        contributions=contribs,
+        principal=principal,
+        final_amount=final_amount,
+        total_invested=total_invested,
+        total_interest=final_amount - total_invested,
+    )
+
+
+def top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Índices dos ``k`` maiores valores ao longo do primeiro eixo.
+
+    ``argpartition`` separa os ``k`` maiores em O(N) e apenas eles são
+    ordenados; empates entre os selecionados mantêm a ordem original.
+
+    Args:
+        values: Array com os produtos no primeiro eixo
+        k: Número de índices
+
+    Returns:
+        Array ``(k, ...)`` de índices, do maior para o menor valor
+    """
+    count = values.shape[0]
+    if not 0 < k <= count:
+        raise ValueError("k deve estar entre 1 e o número de produtos")
+
+    if k < count:
+        candidates = np.argpartition(-values, k - 1, axis=0)[:k]
+        # Ordena os candidatos pela posição original para desempatar de forma estável
+        candidates.sort(axis=0)
+    else:
+        candidates = np.broadcast_to(
+            np.arange(count).reshape((count,) + (1,) * (values.ndim - 1)), values.shape
+        )
+    selected = np.take_along_axis(values, candidates, axis=0)
+    order = np.argsort(-selected, axis=0, kind='stable')
+    return np.take_along_axis(candidates, order, axis=0)
+
+
+def _grid_position(grid: np.ndarray, value: float, label: str) -> int:
+    """Posição de ``value`` na grade."""
+    matches = np.flatnonzero(np.isclose(grid, value))
+    if not matches.size:
+        raise ValueError(f"{label} {value} não está na grade")
+    return int(matches[0])
@@ -0,0 +1,223 @@
+"""Rendimento líquido de impostos e taxas para comparação de investimentos.
+
+Regras de renda fixa aplicadas sobre o rendimento de cada resgate:
+    IOF regressivo para resgates com menos de 30 dias (96% a 0%)
+    IR regressivo sobre o rendimento já descontado o IOF:
+        até 180 dias 22,5%; até 360 dias 20%; até 720 dias 17,5%; acima 15%
+    Taxas de administração e custódia (% a.a. sobre o saldo), descontadas
+    mês a mês antes dos impostos
+
+As alíquotas ficam em tabelas indexadas por dias corridos, consultadas por
+indexação NumPy. Na grade de cenários, cada aporte mensal é um lote com o
+seu próprio prazo; como a alíquota do IR é constante em faixas de meses,
+o imposto de todos os lotes sai de somas geométricas fechadas por faixa,
+sem laço por lote nem por produto: o custo cresce com a grade como o
+cálculo bruto de ``scenario_grid``.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple, Union
+
+from .scenarios import ScenarioCube, scenario_grid
+
+
+# Faixas do IR regressivo: (até dias, alíquota %); a última não tem limite
+IR_BRACKETS = ((180, 22.5), (360, 20.0), (720, 17.5), (None, 15.0))
+
+# IOF regressivo (% do rendimento) para resgates de 1 a 29 dias
+IOF_RATES = (
+    96, 93, 90, 86, 83, 80, 76, 73, 70, 66, 63, 60, 56, 53, 50,
+    46, 43, 40, 36, 33, 30, 26, 23, 20, 16, 13, 10, 6, 3,
+)
+
+DAYS_PER_MONTH = 365 / 12
+
+
+def _build_ir_table() -> np.ndarray:
+    """Alíquota do IR para 0..721 dias; acima disso vale a última posição."""
+    limit = IR_BRACKETS[-2][0] + 1
+    table = np.empty(limit + 1, dtype=np.float64)
+    start = 0
+    for days, rate in IR_BRACKETS[:-1]:
+        table[start:days + 1] = rate
+        start = days + 1
+    table[start:] = IR_BRACKETS[-1][1]
+    table.flags.writeable = False
+    return table
+
+
+def _build_iof_table() -> np.ndarray:
+    """Alíquota do IOF para 0..30 dias (zero a partir de 30)."""
+    table = np.zeros(len(IOF_RATES) + 2, dtype=np.float64)
+    table[0] = 100.0  # Resgate no mesmo dia: todo o rendimento
+    table[1:len(IOF_RATES) + 1] = IOF_RATES
+    table.flags.writeable = False
+    return table
+
+
+IR_TABLE = _build_ir_table()
+IOF_TABLE = _build_iof_table()
+
+
+def _build_month_runs() -> Tuple[Tuple[int, int, float], ...]:
+    """Faixas de meses ``(primeiro, último, alíquota)`` com IR constante.
+
+    Um lote que rende ``k`` meses fica ``round(k * 365/12)`` dias aplicado;
+    a última faixa vai até o infinito (``último = -1``).
+    """
+    months = np.arange(1, int(np.ceil(len(IR_TABLE) / DAYS_PER_MONTH)) + 2)
+    rates = income_tax_rate(days_held(months))
+    runs = []
+    start = 0
+    for stop in np.flatnonzero(np.diff(rates)) + 1:
+        runs.append((int(months[start]), int(months[stop - 1]), float(rates[start])))
+        start = stop
+    runs.append((int(months[start]), -1, float(rates[start])))
+    return tuple(runs)
+
+
+def days_held(months: Union[int, np.ndarray]) -> np.ndarray:
+    """Dias corridos equivalentes a um prazo em meses."""
+    return np.rint(np.asarray(months) * DAYS_PER_MONTH).astype(np.int64)
+
+
+def income_tax_rate(days: Union[int, np.ndarray]) -> np.ndarray:
+    """Alíquota do IR regressivo (%) por dias corridos de aplicação."""
+    days = np.asarray(days)
+    return IR_TABLE[np.clip(days, 0, len(IR_TABLE) - 1)]
+
+
+def iof_rate(days: Union[int, np.ndarray]) -> np.ndarray:
+    """Alíquota do IOF (%) sobre o rendimento por dias corridos de aplicação."""
+    days = np.asarray(days)
+    return IOF_TABLE[np.clip(days, 0, len(IOF_TABLE) - 1)]
+
+
+MONTH_RUNS = _build_month_runs()
+_RUN_FIRST = np.array([run[0] for run in MONTH_RUNS])
+_RUN_LAST = np.array([run[1] if run[1] > 0 else np.iinfo(np.int64).max for run in MONTH_RUNS])
+_RUN_RATE = np.array([run[2] for run in MONTH_RUNS])
+
+
+def tax_on_gain(
+    gain: Union[float, np.ndarray],
+    days: Union[int, np.ndarray],
+    tax_exempt: Union[bool, np.ndarray] = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calcula IOF e IR sobre o rendimento de resgates.
+
+    Args:
+        gain: Rendimento bruto de cada resgate
+        days: Dias corridos de aplicação
+        tax_exempt: Produto isento (poupança, LCI, LCA)
+
+    Returns:
+        Tupla (IOF, IR); zero para rendimentos negativos ou isentos
+    """
+    gain = np.maximum(np.asarray(gain, dtype=np.float64), 0.0)
+    taxable = np.where(tax_exempt, 0.0, gain)
+    iof = taxable * iof_rate(days) / 100
+    income_tax = (taxable - iof) * income_tax_rate(days) / 100
+    return iof, income_tax
+
+
+@dataclass
+class NetScenarioCube(ScenarioCube):
+    """Grade de cenários com valores líquidos de taxas e impostos.
+
+    ``final_amount`` e ``total_interest`` são líquidos, de modo que
+    ``ranking`` e ``top_k`` comparam os produtos pelo valor líquido.
+    Os demais arrays têm forma ``(produtos, prazos, aportes)``.
+    """
+    gross_amount: np.ndarray
+    fees: np.ndarray
+    iof: np.ndarray
+    income_tax: np.ndarray
+
+
+def net_scenario_grid(
+    principal: float,
+    annual_rates: Sequence[float],
+    horizons: Sequence[int],
+    contributions: Sequence[float] = (0,),
+    names: Optional[Sequence[str]] = None,
+    admin_fees: Union[float, Sequence[float]] = 0.0,
+    custody_fees: Union[float, Sequence[float]] = 0.0,
+    tax_exempt: Union[bool, Sequence[bool]] = False
+) -> NetScenarioCube:
+    """Calcula a grade de ``scenario_grid`` líquida de taxas e impostos.
+
+    Cada aporte é tributado pelo seu próprio prazo (o aporte do mês ``m``
+    rende ``n - m`` meses), como nos resgates de renda fixa.
+
+    Args:
+        principal: Valor inicial
+        annual_rates: Taxas de juros (% ao ano), uma por produto
+        horizons: Prazos em meses
+        contributions: Aportes mensais
+        names: Nomes dos produtos
+        admin_fees: Taxa de administração (% a.a. sobre o saldo)
+        custody_fees: Taxa de custódia (% a.a. sobre o saldo)
+        tax_exempt: Produtos isentos de IR e IOF
+
+    Returns:
+        NetScenarioCube com valores líquidos e a decomposição de custos
+    """
+    gross = scenario_grid(principal, annual_rates, horizons, contributions, names)
+    count = gross.rates.size
+    admin = np.broadcast_to(np.asarray(admin_fees, dtype=np.float64), (count,))
+    custody = np.broadcast_to(np.asarray(custody_fees, dtype=np.float64), (count,))
+    exempt = np.broadcast_to(np.asarray(tax_exempt, dtype=bool), (count,))
+    if (admin < 0).any() or (admin >= 100).any() or (custody < 0).any() or (custody >= 100).any():
+        raise ValueError("Taxas devem estar entre 0 e 100% ao ano")
+
+    # Crescimento mensal líquido de taxas: (1+i) * ((1-adm)(1-cust))^(1/12)
+    log_growth = (
+        np.log1p(gross.rates / 100 / 12)
+        + (np.log1p(-admin / 100) + np.log1p(-custody / 100)) / 12
+    )[:, None, None]
+    n = gross.horizons[None, :, None]
+    c = gross.contributions[None, None, :]
+    lots = np.maximum(n - 1, 0)  # Aportes: rendem de 1 a n-1 meses
+
+    principal_growth = np.exp(n * log_growth)
+    pre_tax = principal * principal_growth + c * _geometric_sum(log_growth, lots)
+
+    # Lote inicial: rendimento P*(g^n - 1), tributado pelo prazo total
+    days = days_held(n)
+    principal_gain = principal * (principal_growth - 1)
+    iof, income_tax = tax_on_gain(principal_gain, days, exempt[:, None, None])
+
+    # Aportes: soma de c*(g^k - 1)*IR(k) com as faixas de meses empilhadas
+    # no primeiro eixo, avaliadas de uma vez
+    first = _RUN_FIRST[:, None, None, None] - 1
+    last = np.maximum(np.minimum(lots, _RUN_LAST[:, None, None, None]), first)
+    gains = _geometric_sum(log_growth, last) - _geometric_sum(log_growth, first)
+    gains -= last - first
+    contribution_tax = np.tensordot(_RUN_RATE / 100, gains, axes=1)
+    taxed = ~exempt[:, None, None] & (log_growth > 0)
+    income_tax = income_tax + np.where(taxed, c * contribution_tax, 0.0)
+
+    final_amount = pre_tax - iof - income_tax
+    return NetScenarioCube(
+        names=gross.names,
+        rates=gross.rates,
+        horizons=gross.horizons,
+        contributions=gross.contributions,
+        principal=principal,
+        final_amount=final_amount,
+        total_invested=gross.total_invested,
+        total_interest=final_amount - gross.total_invested,
+        gross_amount=gross.final_amount,
+        fees=gross.final_amount - pre_tax,
+        iof=iof,
+        income_tax=income_tax,
+    )
+
+
+def _geometric_sum(log_growth: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """Soma ``g + g^2 + ... + g^m`` com ``g = e^L`` (zero para ``m = 0``)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.expm1(months * log_growth) / np.expm1(log_growth)
+    return np.where(log_growth == 0, months, ratio * np.exp(log_growth))
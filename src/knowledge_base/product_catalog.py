@@ -37,6 +37,7 @@ class ProductCatalog:
                     "Rendimento mensal",
                     "Garantia do FGC até R$ 250.000"
                 ],
+                "annual_rates": [6.17],
                 "target_audience": "Conservador"
             },
             {
@@ -50,6 +51,7 @@ class ProductCatalog:
                     "Garantia do FGC",
                     "Opções de liquidez"
                 ],
+                "annual_rates": [13.65, 15.02, 16.38],
                 "target_audience": "Moderado"
             },
             {
@@ -63,6 +65,7 @@ class ProductCatalog:
                     "Aprovação rápida",
                     "Crédito de até R$ 50.000"
                 ],
+                "annual_rates": [17.88, 23.88, 35.88],
                 "target_audience": "Geral"
             },
             {
@@ -125,6 +128,14 @@ class ProductCatalog:
         
         return results
     
+    def get_annual_rates(self) -> List[float]:
+        """Retorna as taxas anuais (%) dos produtos.
+        
+        Returns:
+            Lista ordenada de taxas únicas
+        """
+        return sorted(set(rate for p in self.products for rate in p.get('annual_rates', [])))
+    
     def get_all_categories(self) -> List[str]:
         """Retorna todas as categorias de produtos.
         
@@ -0,0 +1,258 @@
+"""Testes para o motor vetorizado de amortização."""
+
+import json
+import pickle
+import unittest
+import numpy as np
+from src.calculators import FinancialCalculators
+from src.calculators.amortization import (
+    amortization_schedule,
+    batch_schedule,
+    price_payment,
+    price_schedule,
+    sac_schedule,
+)
+from src.calculators.financial_calculators import FinancingCalculator
+from src.calculators.results import ScheduleRows
+
+
+def reference_schedule(loan_amount, monthly_rate, months, system):
+    """Cronograma pelo laço mês a mês original."""
+    if system == 'PRICE':
+        payment = price_payment(loan_amount, monthly_rate, months)
+    amortization = loan_amount / months
+    balance = loan_amount
+    rows = []
+    for _ in range(months):
+        interest = balance * monthly_rate
+        if system == 'PRICE':
+            amortization = payment - interest
+        balance -= amortization
+        rows.append({
+            'payment': amortization + interest,
+            'principal': amortization,
+            'interest': interest,
+            'balance': max(0, balance)
+        })
+    return rows
+
+
+class TestAmortizationKernels(unittest.TestCase):
+    """Testes para os kernels PRICE e SAC."""
+
+    CASES = [
+        (10000, 12, 12),
+        (250000, 9.5, 360),
+        (1000000, 11.0, 420),
+        (5000, 0, 24),
+        (800, 35, 1),
+    ]
+
+    def assert_matches_reference(self, kernel, system):
+        for loan_amount, annual_rate, months in self.CASES:
+            monthly_rate = annual_rate / 100 / 12
+            columns = kernel(loan_amount, monthly_rate, months)
+            expected = reference_schedule(loan_amount, monthly_rate, months, system)
+
+            for name, values in columns.items():
+                self.assertEqual(len(values), months)
+                for got, row in zip(values, expected):
+                    self.assertAlmostEqual(got, row[name], places=4)
+
+    def test_price_matches_loop(self):
+        """PRICE vetorizado deve coincidir com o laço original."""
+        self.assert_matches_reference(price_schedule, 'PRICE')
+
+    def test_sac_matches_loop(self):
+        """SAC vetorizado deve coincidir com o laço original."""
+        self.assert_matches_reference(sac_schedule, 'SAC')
+
+    def test_final_balance_is_zero(self):
+        """Saldo final deve ser zero e nunca negativo."""
+        for kernel in (price_schedule, sac_schedule):
+            columns = kernel(250000, 0.0079, 360)
+            self.assertEqual(columns['balance'][-1], 0.0)
+            self.assertTrue((columns['balance'] >= 0).all())
+
+
+class TestCalculatorAdapters(unittest.TestCase):
+    """As calculadoras devem reproduzir o laço original a partir do kernel."""
+
+    CASES = TestAmortizationKernels.CASES
+
+    def test_dispatch(self):
+        """amortization_schedule deve escolher o kernel pelo sistema."""
+        np.testing.assert_array_equal(
+            amortization_schedule(1000, 0.01, 12, 'sac').data,
+            sac_schedule(1000, 0.01, 12).data
+        )
+        with self.assertRaises(ValueError):
+            amortization_schedule(1000, 0.01, 12, 'SACRE')
+
+    def test_financial_calculators_lists(self):
+        """calcular_financiamento_* deve manter listas e totais do laço."""
+        methods = {
+            'PRICE': FinancialCalculators.calcular_financiamento_price,
+            'SAC': FinancialCalculators.calcular_financiamento_sac,
+        }
+        for system, method in methods.items():
+            for loan_amount, annual_rate, months in self.CASES:
+                resultado = method(loan_amount + 500, 500, months, annual_rate)
+                expected = reference_schedule(
+                    loan_amount, annual_rate / 100 / 12, months, system
+                )
+                self.assertIsInstance(resultado.parcelas, list)
+                self.assertEqual(resultado.valor_financiado, loan_amount)
+                fields = {
+                    'payment': resultado.parcelas,
+                    'principal': resultado.amortizacoes,
+                    'interest': resultado.juros_parcela,
+                    'balance': resultado.saldo_devedor,
+                }
+                for name, values in fields.items():
+                    np.testing.assert_allclose(
+                        values, [row[name] for row in expected], rtol=1e-9, atol=1e-6
+                    )
+                self.assertAlmostEqual(
+                    resultado.total_pago, sum(row['payment'] for row in expected), places=4
+                )
+                self.assertAlmostEqual(
+                    resultado.total_juros, sum(row['interest'] for row in expected), places=4
+                )
+
+    def test_financing_calculator_rows(self):
+        """FinancingCalculator deve manter as chaves e a ordem das linhas."""
+        for loan_amount, annual_rate, months in self.CASES:
+            if annual_rate == 0:
+                continue  # O laço original divide por zero no PRICE
+            monthly_rate = annual_rate / 100 / 12
+            for system, method in (('PRICE', FinancingCalculator.calculate_price),
+                                   ('SAC', FinancingCalculator.calculate_sac)):
+                result = method(loan_amount, annual_rate, months)
+                expected = reference_schedule(loan_amount, monthly_rate, months, system)
+                rows = result['installments']
+                self.assertEqual(len(rows), months)
+                self.assertEqual(
+                    list(rows[0]),
+                    ['month', 'installment', 'amortization', 'interest', 'balance']
+                )
+                for row, reference in zip(rows, expected):
+                    self.assertAlmostEqual(row['installment'], reference['payment'], places=6)
+                    self.assertAlmostEqual(row['amortization'], reference['principal'], places=6)
+                    self.assertAlmostEqual(row['interest'], reference['interest'], places=6)
+                    self.assertAlmostEqual(row['balance'], reference['balance'], places=4)
+                self.assertEqual(rows[-1]['month'], months)
+
+        sac = FinancingCalculator.calculate_sac(12000, 12, 12)
+        self.assertAlmostEqual(sac['first_installment'], 1120.0)
+        self.assertAlmostEqual(sac['last_installment'], 1010.0)
+        self.assertAlmostEqual(sac['total_interest'], 780.0)
+        price = FinancingCalculator.calculate_price(10000, 12, 12)
+        self.assertAlmostEqual(price['total_paid'], price['fixed_installment'] * 12)
+
+    def test_financing_calculator_json(self):
+        """Resultados em dicionário devem ser serializáveis em JSON."""
+        for method in (FinancingCalculator.calculate_price, FinancingCalculator.calculate_sac):
+            result = method(10000, 12, 12)
+            self.assertIsInstance(result['installments'], list)
+            self.assertEqual(json.loads(json.dumps(result)), result)
+
+
+class TestBatchSchedule(unittest.TestCase):
+    """Testes para a simulação de financiamentos em lote."""
+
+    def test_grid_matches_single_schedules(self):
+        """Cada célula da grade deve coincidir com o cálculo individual."""
+        rates = np.array([0, 9.5, 24])
+        terms = np.array([1, 12, 360])
+        for system, kernel in (('PRICE', price_schedule), ('SAC', sac_schedule)):
+            result = batch_schedule(50000, rates[:, None], terms[None, :], system)
+            self.assertEqual(len(result), 9)
+
+            for index in range(len(result)):
+                expected = kernel(
+                    50000, result.interest_rate[index] / 100 / 12,
+                    int(result.months[index])
+                )
+                for name, values in result.schedule(index).items():
+                    np.testing.assert_allclose(values, expected[name], atol=1e-6)
+                self.assertAlmostEqual(
+                    result.total_amount[index], expected['payment'].sum(), places=4
+                )
+
+    def test_ragged_terms_are_masked(self):
+        """Meses além do prazo devem ficar zerados e fora da máscara."""
+        result = batch_schedule([1000, 2000], 12, [6, 12], ['price', 'sac'])
+        self.assertEqual(result.payment.shape, (2, 12))
+        self.assertFalse(result.mask[0, 6:].any())
+        self.assertTrue(result.mask[1].all())
+        self.assertTrue((result.payment[0, 6:] == 0).all())
+        self.assertEqual(list(result.summary()['system']), ['PRICE', 'SAC'])
+
+    def test_invalid_inputs(self):
+        """Parâmetros inválidos devem gerar ValueError."""
+        with self.assertRaises(ValueError):
+            batch_schedule([1000, 0], 12, 12)
+        with self.assertRaises(ValueError):
+            batch_schedule(1000, 12, 12, 'SACRE')
+
+
+class TestScheduleRows(unittest.TestCase):
+    """Testes para a visão em linhas do cronograma."""
+
+    def setUp(self):
+        self.columns = price_schedule(10000, 0.01, 12)
+        self.rows = ScheduleRows(self.columns)
+
+    def test_row_access(self):
+        """Linhas devem ter o formato legado de dicionário."""
+        self.assertEqual(len(self.rows), 12)
+        first = self.rows[0]
+        self.assertEqual(first['installment'], 1)
+        self.assertAlmostEqual(first['interest'], 100.0)
+        self.assertEqual(self.rows[-1]['installment'], 12)
+        with self.assertRaises(IndexError):
+            self.rows[12]
+
+    def test_slice_and_iteration(self):
+        """Fatias e iteração devem produzir as mesmas linhas."""
+        self.assertEqual(self.rows[:3], list(self.rows)[:3])
+        self.assertEqual(self.rows, self.rows.to_list())
+
+    def test_rows_for_any_column_count(self):
+        """Linhas devem ser montadas para qualquer número de colunas."""
+        rows = ScheduleRows({'a': [1.0, 2.0], 'b': [3.0, 4.0]}, index_key='mes')
+        self.assertEqual(rows.to_list(), [{'mes': 1, 'a': 1.0, 'b': 3.0},
+                                          {'mes': 2, 'a': 2.0, 'b': 4.0}])
+        self.assertEqual(list(self.rows)[5], self.rows[5])
+
+    def test_zero_copy_views(self):
+        """to_numpy e to_dataframe devem compartilhar o bloco de colunas."""
+        array = self.rows.to_numpy()
+        self.assertEqual(array.shape, (12, 4))
+        self.assertTrue(np.shares_memory(array, self.columns.data))
+
+        df = self.rows.to_dataframe()
+        self.assertEqual(df.index.name, 'installment')
+        self.assertTrue(np.shares_memory(df['interest'].to_numpy(), self.columns.data))
+
+    def test_deferred_columns(self):
+        """Colunas adiadas só devem ser geradas no primeiro acesso."""
+        calls = []
+
+        def build():
+            calls.append(1)
+            return self.columns
+
+        rows = ScheduleRows(build, length=12, width=4)
+        self.assertEqual(len(rows), 12)
+        self.assertEqual(rows.nbytes, self.columns.data.nbytes)
+        self.assertEqual(calls, [])
+        self.assertEqual(rows[0], self.rows[0])
+        rows.to_list()
+        self.assertEqual(calls, [1])
+        self.assertEqual(pickle.loads(pickle.dumps(rows)), self.rows)
+
+
+if __name__ == '__main__':
+    unittest.main()
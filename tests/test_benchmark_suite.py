@@ -0,0 +1,89 @@
+"""Testes para a suíte de benchmarks e a comparação de baselines."""
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from benchmarks.suite import (
+    build_cases,
+    compare_results,
+    load_report,
+    measure,
+    save_report,
+)
+
+
+def _report(**p50):
+    return {'meta': {}, 'results': {name: {'p50_us': value, 'p99_us': value}
+                                    for name, value in p50.items()}}
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Testes para benchmarks.suite."""
+
+    def test_cases_cover_every_horizon(self):
+        """Casos por prazo existem para cada horizonte pedido, sem nomes repetidos."""
+        cases = build_cases((12, 600))
+        names = [case.name for case in cases]
+        self.assertEqual(len(names), len(set(names)))
+        for months in (12, 600):
+            self.assertIn(f'en.loan_calculator.PRICE[{months}]', names)
+            self.assertIn(f'pt.calcular_financiamento_sac[{months}]', names)
+            self.assertIn(f'en.loan_calculator.PRICE.rows[{months}]', names)
+            self.assertIn(f'en.loan_cet.1000[{months}]', names)
+        for name in ('rate_factors.get', 'en.debt_payoff_planner.60',
+                     'en.consorcio_simulator.100000', 'pt.simular_cartao_credito',
+                     'en.affordability_matrix'):
+            self.assertIn(name, names)
+
+    def test_every_case_runs(self):
+        """Todos os casos devem executar sem erro."""
+        for case in build_cases((12,)):
+            with self.subTest(case=case.name):
+                case.func()
+
+    def test_measure(self):
+        """Medição retorna métricas consistentes."""
+        stats = measure(lambda: sum(range(100)), samples=5, sample_time=0.0005)
+        self.assertGreater(stats['ops_per_sec'], 0)
+        self.assertLessEqual(stats['p50_us'], stats['p99_us'])
+        self.assertGreaterEqual(stats['peak_kib'], 0)
+
+    def test_measure_per_call_tail(self):
+        """p99 deve refletir chamadas lentas isoladas, não a média da amostra."""
+        calls = []
+
+        def spiky():
+            calls.append(1)
+            if len(calls) % 20 == 0:
+                time.sleep(0.002)
+
+        stats = measure(spiky, samples=5, sample_time=0.0005)
+        self.assertGreater(stats['p99_us'], 1000)
+        self.assertLess(stats['p50_us'], 200)
+
+    def test_compare_flags_regressions(self):
+        """Piora acima do limite é regressão; casos novos e ausentes são listados."""
+        baseline = _report(a=10.0, b=10.0, c=10.0, gone=1.0)
+        current = _report(a=12.0, b=10.5, c=5.0, added=1.0)
+        report = compare_results(baseline, current, threshold=10)
+        self.assertEqual([entry[0] for entry in report['regressions']], ['a'])
+        self.assertEqual([entry[0] for entry in report['improvements']], ['c'])
+        self.assertEqual([entry[0] for entry in report['unchanged']], ['b'])
+        self.assertEqual(report['missing'], ['gone'])
+        self.assertEqual(report['new'], ['added'])
+        self.assertFalse(compare_results(baseline, current, threshold=25)['regressions'])
+        with self.assertRaises(ValueError):
+            compare_results(baseline, current, threshold=-1)
+
+    def test_report_round_trip(self):
+        """Relatório gravado em JSON é lido de volta igual."""
+        report = _report(a=1.5)
+        with tempfile.TemporaryDirectory() as directory:
+            path = save_report(report, Path(directory) / 'nested' / 'base.json')
+            self.assertEqual(load_report(path), report)
+
+
+if __name__ == '__main__':
+    unittest.main()
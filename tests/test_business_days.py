@@ -0,0 +1,116 @@
+"""Testes para o calendário de dias úteis."""
+
+import unittest
+from datetime import date
+
+import numpy as np
+
+from src.calculators import FinancialCalculators
+from src.calculators.business_days import (
+    HOLIDAYS,
+    accrual_curve,
+    accrual_factor,
+    brazilian_holidays,
+    business_days,
+    business_days_between,
+    easter_sunday,
+    is_business_day,
+    post_fixed_yield,
+)
+
+
+class TestHolidays(unittest.TestCase):
+    """Testes para a geração de feriados."""
+
+    def test_easter(self):
+        """Páscoa deve coincidir com datas conhecidas."""
+        self.assertEqual(easter_sunday(2000), date(2000, 4, 23))
+        self.assertEqual(easter_sunday(2024), date(2024, 3, 31))
+        self.assertEqual(easter_sunday(2025), date(2025, 4, 20))
+
+    def test_movable_and_new_holidays(self):
+        """Carnaval, Sexta-feira Santa, Corpus Christi e 20 de novembro."""
+        holidays = set(brazilian_holidays(2024, 2024).tolist())
+        for day in (date(2024, 2, 12), date(2024, 2, 13), date(2024, 3, 29),
+                    date(2024, 5, 30), date(2024, 11, 20)):
+            self.assertIn(day, holidays)
+        self.assertNotIn(date(2023, 11, 20), set(brazilian_holidays(2023, 2023).tolist()))
+
+    def test_stored_holidays_are_sorted_weekdays(self):
+        """O array guardado só tem feriados em dias de semana, ordenados."""
+        self.assertTrue((np.diff(HOLIDAYS.astype(np.int64)) > 0).all())
+        self.assertTrue(np.is_busday(HOLIDAYS).all())
+        self.assertFalse(HOLIDAYS.flags.writeable)
+
+
+class TestBusinessDays(unittest.TestCase):
+    """Testes para contagem de dias úteis e fatores de rendimento."""
+
+    def test_count_matches_numpy(self):
+        """Contagem por busca binária coincide com numpy.busday_count."""
+        rng = np.random.default_rng(17)
+        start = rng.integers(10957, 43000, 5000).astype('datetime64[D]')
+        end = start + rng.integers(0, 4000, 5000)
+        np.testing.assert_array_equal(
+            business_days_between(start, end),
+            np.busday_count(start, end, holidays=HOLIDAYS)
+        )
+        np.testing.assert_array_equal(
+            is_business_day(start), np.is_busday(start, holidays=HOLIDAYS)
+        )
+
+    def test_known_years(self):
+        """Dias úteis de anos completos."""
+        self.assertEqual(business_days_between('2023-01-01', '2024-01-01'), 249)
+        self.assertEqual(business_days_between(date(2024, 1, 1), date(2025, 1, 1)), 253)
+        self.assertEqual(business_days_between('2024-03-01', '2024-02-01'), -19)
+
+    def test_listed_days(self):
+        """Lista de dias úteis tem o tamanho da contagem."""
+        days = business_days('2024-02-01', '2024-04-01')
+        self.assertEqual(days.size, business_days_between('2024-02-01', '2024-04-01'))
+        self.assertNotIn(np.datetime64('2024-02-12'), days)
+
+    def test_accrual(self):
+        """Fator base 252 e percentual do CDI."""
+        count = business_days_between('2024-01-02', '2025-01-02')
+        np.testing.assert_allclose(
+            accrual_factor(10.65, '2024-01-02', '2025-01-02'), 1.1065 ** (count / 252)
+        )
+        daily = 1.1065 ** (1 / 252) - 1
+        np.testing.assert_allclose(
+            accrual_factor([10.65], '2024-01-02', '2025-01-02', 110),
+            [(1 + 1.1 * daily) ** count]
+        )
+
+    def test_accrual_curve(self):
+        """Curva com taxa constante termina no fator fechado; aceita série."""
+        days, factors = accrual_curve(10.65, '2024-01-02', '2024-07-01')
+        self.assertEqual(factors.shape, days.shape)
+        np.testing.assert_allclose(factors[-1], accrual_factor(10.65, '2024-01-02', '2024-07-01'))
+        rates = np.full((3, days.size), 10.65)
+        _, factors = accrual_curve(rates, '2024-01-02', '2024-07-01')
+        self.assertEqual(factors.shape, (3, days.size))
+        with self.assertRaises(ValueError):
+            accrual_curve(np.ones(5), '2024-01-02', '2024-07-01')
+
+    def test_post_fixed_yield(self):
+        """IOF e IR seguem os dias corridos; LCI é isenta."""
+        short = post_fixed_yield(10000, 10.65, '2024-01-02', '2024-01-20')
+        self.assertEqual(short['calendar_days'], 18)
+        self.assertGreater(short['iof'], 0)
+        exempt = FinancialCalculators.calcular_rendimento_cdi(
+            10000, 10.65, '2024-01-02', '2025-01-02', 95, isento=True
+        )
+        self.assertEqual(exempt['net_amount'], exempt['gross_amount'])
+
+    def test_invalid_inputs(self):
+        """Datas fora do calendário e resgate antes da aplicação."""
+        with self.assertRaises(ValueError):
+            business_days_between('1999-12-31', '2000-02-01')
+        with self.assertRaises(ValueError):
+            post_fixed_yield(1000, 10, '2024-02-01', '2024-01-01')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""Testes para o cache de memoização das calculadoras."""
+
+import threading
+import unittest
+import numpy as np
+from src.calculators.amortization import SCHEDULE_COLUMNS, price_schedule
+from src.calculators import FinancialCalculators
+from src.calculators.cache import (
+    CalculatorCache, calculator_cache, estimate_nbytes, normalize_key
+)
+from src.calculators.results import ScheduleRows
+
+
+class TestCalculatorCache(unittest.TestCase):
+    """Testes para o cache LRU das calculadoras."""
+
+    def setUp(self):
+        self.cache = CalculatorCache(max_bytes=10_000)
+        self.calls = []
+
+        @self.cache.memoize
+        def schedule(amount, months=12):
+            self.calls.append((amount, months))
+            return np.full(months, amount / months)
+
+        self.schedule = schedule
+
+    def test_normalized_keys_hit(self):
+        """Floats equivalentes devem reutilizar o mesmo resultado."""
+        first = self.schedule(1000, months=12)
+        second = self.schedule(1000.0000000001, months=12.0)
+        self.assertIs(first, second)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    def test_lru_eviction_by_bytes(self):
+        """Entradas menos usadas devem ser descartadas ao exceder o orçamento."""
+        self.schedule(1, months=500)  # 4000 bytes
+        self.schedule(2, months=500)
+        self.schedule(1, months=500)  # Torna a primeira a mais recente
+        self.schedule(3, months=500)
+
+        stats = self.cache.stats()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertLessEqual(stats['bytes'], 10_000)
+        self.schedule(1, months=500)
+        self.assertEqual(len(self.calls), 3)
+
+    def test_thread_safety(self):
+        """Acessos concorrentes devem manter contadores consistentes."""
+        def worker():
+            for amount in range(50):
+                self.schedule(amount % 5)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = self.cache.stats()
+        self.assertEqual(stats['hits'] + stats['misses'], 400)
+        self.assertEqual(stats['entries'], 5)
+
+    def test_dict_results_are_copied(self):
+        """Dicionários devolvidos não devem alterar a entrada em cache."""
+        @self.cache.memoize
+        def summary(value):
+            return {'value': value}
+
+        summary(1)['value'] = 99
+        self.assertEqual(summary(1), {'value': 1.0})
+
+    def test_deferred_rows_count_full_size(self):
+        """Cronogramas adiados devem contar o tamanho do bloco completo."""
+        @self.cache.memoize
+        def loan(amount):
+            return ScheduleRows(
+                lambda: price_schedule(amount, 0.01, 120),
+                length=120,
+                width=len(SCHEDULE_COLUMNS)
+            )
+
+        table_bytes = 120 * len(SCHEDULE_COLUMNS) * 8  # 3840 bytes
+        for amount in range(1, 6):
+            loan(amount)[:12]  # Gera as linhas, como o app
+        stats = self.cache.stats()
+        self.assertGreater(stats['evictions'], 0)
+        self.assertLessEqual(stats['bytes'], 10_000)
+        self.assertLessEqual(stats['entries'] * table_bytes, 10_000)
+
+        rows = loan(5)
+        before = estimate_nbytes(rows)
+        rows.to_list()
+        self.assertEqual(estimate_nbytes(rows), before)
+
+    def test_normalize_key(self):
+        """Coleções e arrays devem virar chaves hashable."""
+        key = normalize_key({'b': [1, 2.0], 'a': np.arange(3.0)})
+        self.assertEqual(key, normalize_key({'a': np.arange(3.0), 'b': (1.0, 2)}))
+        hash(key)
+
+
+class TestFinancialCalculatorsCache(unittest.TestCase):
+    """Testes para a memoização dos métodos em português."""
+
+    def setUp(self):
+        calculator_cache.clear()
+
+    def test_financiamento_is_memoized(self):
+        """Segunda chamada deve vir do cache sem compartilhar as listas."""
+        primeiro = FinancialCalculators.calcular_financiamento_price(100000, 20000, 120, 12)
+        parcela = primeiro.parcelas[0]
+        primeiro.parcelas[0] = 0
+        primeiro.total_pago = 0
+
+        segundo = FinancialCalculators.calcular_financiamento_price(100000, 20000, 120, 12.0)
+        self.assertEqual(calculator_cache.stats()['hits'], 1)
+        self.assertEqual(segundo.parcelas[0], parcela)
+        self.assertGreater(segundo.total_pago, 0)
+
+    def test_investimento_is_memoized(self):
+        """Evolução mensal devolvida não deve alterar a entrada em cache."""
+        primeiro = FinancialCalculators.calcular_investimento(1000, 100, 12, 12)
+        primeiro.evolucao_mensal[-1]['montante'] = 0
+
+        segundo = FinancialCalculators.calcular_investimento(1000, 100, 12, 12)
+        self.assertEqual(calculator_cache.stats()['hits'], 1)
+        self.assertEqual(segundo.evolucao_mensal[-1]['montante'], segundo.montante_final)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Testes para VPL, TIR e XTIR vetorizados."""
+
+import math
+import unittest
+from datetime import date
+
+import numpy as np
+
+from src.calculators import FinancialCalculators
+from src.calculators.cashflow import irr, npv, xirr, xnpv
+
+
+class TestNpv(unittest.TestCase):
+    """Testes para o valor presente líquido."""
+
+    def test_matches_definition(self):
+        """VPL deve descontar o primeiro fluxo na data zero."""
+        flows = [-1000, 300, 400, 500]
+        expected = sum(value / 1.1 ** t for t, value in enumerate(flows))
+        self.assertAlmostEqual(npv(0.1, flows), expected, places=9)
+
+    def test_batch_with_ragged_series(self):
+        """Séries de tamanhos diferentes são completadas com zeros."""
+        values = npv([0.1, 0.2], [[-100, 60, 60], [-100, 130]])
+        self.assertAlmostEqual(values[0], npv(0.1, [-100, 60, 60]), places=9)
+        self.assertAlmostEqual(values[1], -100 + 130 / 1.2, places=9)
+
+    def test_invalid_rate(self):
+        """Taxas de -100% ou menos devem ser rejeitadas."""
+        with self.assertRaises(ValueError):
+            npv(-1.0, [-100, 110])
+
+
+class TestIrr(unittest.TestCase):
+    """Testes para a taxa interna de retorno."""
+
+    def test_simple_series(self):
+        """TIR deve zerar o VPL."""
+        rate = irr([-100, 60, 60])
+        discount = (math.sqrt(1 + 4 * 100 / 60) - 1) / 2  # 60v² + 60v = 100
+        self.assertAlmostEqual(rate, 1 / discount - 1, places=10)
+        self.assertAlmostEqual(npv(rate, [-100, 60, 60]), 0.0, places=9)
+
+    def test_batch_matches_single_series(self):
+        """Lote deve gerar as mesmas taxas que séries avulsas."""
+        rng = np.random.default_rng(0)
+        flows = rng.normal(100, 50, (200, 36))
+        flows[:, 0] = -2500
+        rates = irr(flows)
+        for row in (0, 57, 199):
+            self.assertAlmostEqual(rates[row], irr(flows[row]), places=10)
+        residual = npv(rates, flows)
+        self.assertLess(np.abs(residual).max(), 1e-6)
+
+    def test_multiple_roots_prefers_closest_to_guess(self):
+        """Com duas raízes, a mais próxima da estimativa é escolhida."""
+        flows = [-100, 230, -132]  # raízes em 10% e 20%
+        self.assertAlmostEqual(irr(flows, guess=0.05), 0.10, places=10)
+        self.assertAlmostEqual(irr(flows, guess=0.25), 0.20, places=10)
+
+    def test_no_sign_change_returns_nan(self):
+        """Fluxos sem troca de sinal não têm TIR."""
+        rates = irr([[100, 50], [-100, 110]])
+        self.assertTrue(np.isnan(rates[0]))
+        self.assertAlmostEqual(rates[1], 0.10, places=10)
+
+    def test_unconverged_series_returns_nan(self):
+        """Séries que esgotam as iterações não devolvem a última estimativa."""
+        flows = [[-100] + [3] * 359 + [100], [-100, 110]]
+        rates = irr(flows, guess=0.5, max_iterations=2)
+        self.assertTrue(np.isnan(rates[0]))
+        converged = irr(flows, guess=0.5)
+        self.assertTrue(np.isfinite(converged).all())
+
+    def test_zero_and_empty_series(self):
+        """Séries só de zeros não têm TIR; séries vazias são inválidas."""
+        self.assertTrue(np.isnan(irr([0, 0])))
+        rates = irr([[0, 0, 0], [-100, 110, 0]])
+        self.assertTrue(np.isnan(rates[0]))
+        self.assertAlmostEqual(rates[1], 0.10, places=10)
+        for flows in ([], np.array([]), [[]]):
+            with self.assertRaisesRegex(ValueError, "Fluxos de caixa"):
+                irr(flows)
+
+
+class TestXirr(unittest.TestCase):
+    """Testes para a TIR em datas irregulares."""
+
+    def test_annual_dates_match_irr(self):
+        """Datas com 365 dias de intervalo equivalem à TIR periódica."""
+        flows = [-1000, 300, 400, 500]
+        dates = ['2021-01-01', '2022-01-01', '2023-01-01', '2024-01-01']
+        self.assertAlmostEqual(xirr(flows, dates), irr(flows), places=3)
+
+    def test_zeroes_xnpv(self):
+        """XTIR deve zerar o VPL em datas irregulares."""
+        flows = [-1000, 250, 450, 600]
+        dates = [date(2024, 1, 10), date(2024, 4, 2), date(2024, 9, 30), date(2025, 3, 1)]
+        rate = xirr(flows, dates)
+        self.assertAlmostEqual(xnpv(rate, flows, dates), 0.0, places=8)
+
+    def test_batch_with_shared_dates(self):
+        """Lote com datas comuns deve resolver cada série."""
+        dates = np.array(['2024-01-01', '2024-03-15', '2024-09-01'], dtype='datetime64[D]')
+        flows = np.array([[-1000, 500, 600], [-500, 100, 450]])
+        rates = xirr(flows, dates)
+        self.assertLess(np.abs(xnpv(rates, flows, dates)).max(), 1e-8)
+
+
+class TestFinancialCalculatorsCashFlow(unittest.TestCase):
+    """Testes para calcular_tir e calcular_vpl."""
+
+    def test_calcular_tir(self):
+        """TIR deve ser retornada em percentual."""
+        rate = FinancialCalculators.calcular_tir([-1000, 300, 400, 500])
+        self.assertAlmostEqual(rate, 8.896339, places=5)
+
+    def test_calcular_vpl(self):
+        """Taxa do VPL é informada em percentual."""
+        value = FinancialCalculators.calcular_vpl([-1000, 300, 400, 500], 10)
+        self.assertAlmostEqual(value, npv(0.1, [-1000, 300, 400, 500]), places=10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Testes para os cronogramas em centavos inteiros."""
+
+import unittest
+from fractions import Fraction
+
+import numpy as np
+
+from src.calculators.amortization import price_schedule, sac_schedule
+from src.calculators.cents import (
+    price_schedule_cents,
+    round_cents,
+    sac_schedule_cents,
+)
+
+
+class TestRoundCents(unittest.TestCase):
+    """Testes para os modos de arredondamento."""
+
+    def test_half_even(self):
+        """Meio centavo vai para o par (bancário/ABNT)."""
+        self.assertEqual(round_cents(0.125), 12)
+        self.assertEqual(round_cents(0.135), 14)
+        self.assertEqual(round_cents(1.005), 100)  # 100.49999... em float
+        np.testing.assert_array_equal(round_cents(np.array([0.125, 2.675])), [12, 268])
+
+    def test_half_up(self):
+        """Meio centavo vai para cima, simétrico para negativos."""
+        self.assertEqual(round_cents(0.125, 'half_up'), 13)
+        np.testing.assert_array_equal(
+            round_cents(np.array([0.125, -0.125]), 'half_up'), [13, -13]
+        )
+
+    def test_invalid_mode(self):
+        """Modo desconhecido deve gerar erro."""
+        with self.assertRaises(ValueError):
+            round_cents(1.0, 'truncate')
+
+
+class TestCentsSchedules(unittest.TestCase):
+    """Testes para price_schedule_cents e sac_schedule_cents."""
+
+    def assert_exact(self, table, loan_amount):
+        """Verifica as identidades exatas do cronograma."""
+        payment, principal, interest, balance = table.data
+        self.assertEqual(table.data.dtype, np.int64)
+        np.testing.assert_array_equal(payment, principal + interest)
+        np.testing.assert_array_equal(
+            np.diff(np.r_[round_cents(loan_amount), balance]), -principal
+        )
+        self.assertEqual(int(principal.sum()), round_cents(loan_amount))
+        self.assertEqual(int(balance[-1]), 0)
+        self.assertTrue((principal >= 0).all() and (interest >= 0).all())
+
+    def test_identities_hold_for_random_loans(self):
+        """Parcela, amortização, juros e saldo devem fechar ao centavo."""
+        rng = np.random.default_rng(5)
+        for _ in range(300):
+            amount = float(np.round(rng.uniform(100, 2e6), 2))
+            rate = float(rng.choice([0.0, rng.uniform(0, 0.05)]))
+            months = int(rng.integers(1, 600))
+            for rounding in ('half_even', 'half_up'):
+                self.assert_exact(price_schedule_cents(amount, rate, months, rounding), amount)
+                self.assert_exact(sac_schedule_cents(amount, rate, months, rounding), amount)
+
+    def test_price_matches_float_engine(self):
+        """Parcela fixa e saldos devem coincidir com o motor float ao centavo."""
+        table = price_schedule_cents(250000, 0.095 / 12, 360)
+        reference = price_schedule(250000, 0.095 / 12, 360)
+        self.assertEqual(int(table['payment'][0]), round_cents(reference['payment'][0]))
+        self.assertTrue((table['payment'][:-1] == table['payment'][0]).all())
+        # Saldos diferem apenas pela capitalização da diferença de arredondamento
+        # da parcela: |Δpmt| * ((1+i)^k - 1) / i
+        rate = 0.095 / 12
+        drift = abs(table['payment'][0] / 100 - reference['payment'][0])
+        bound = drift * np.expm1(np.arange(1, 361) * np.log1p(rate)) / rate + 0.01
+        self.assertTrue((np.abs(table['balance'] / 100 - reference['balance']) <= bound).all())
+        # Juros a até um centavo do saldo anterior vezes a taxa, arredondado
+        opening = np.r_[25_000_000, table['balance'][:-1]]
+        self.assertLessEqual(np.abs(table['interest'] - np.rint(opening * rate)).max(), 1)
+
+    def test_price_interest_bound(self):
+        """Juros do PRICE ficam a até 1 + i/2 centavos do saldo anterior vezes a taxa."""
+        rng = np.random.default_rng(11)
+        for _ in range(300):
+            amount = float(np.round(rng.uniform(100, 2e6), 2))
+            rate = float(rng.uniform(0.0005, 0.12))
+            months = int(rng.integers(1, 421))
+            table = price_schedule_cents(amount, rate, months)
+            opening = np.r_[round_cents(amount), table['balance'][:-1]] * rate
+            live = table['payment'] > 0
+            error = np.abs(table['interest'] - opening)[live]
+            self.assertLessEqual(error.max(), 1 + rate / 2 + 1e-9)
+            self.assertLessEqual(
+                np.abs(table['interest'] - np.rint(opening))[live].max(), 1
+            )
+
+    def test_sac_matches_float_engine(self):
+        """SAC em centavos deve ser o cronograma float arredondado."""
+        table = sac_schedule_cents(100000, 0.01, 3)
+        np.testing.assert_array_equal(table['principal'], [3333333, 3333334, 3333333])
+        np.testing.assert_array_equal(table['interest'], [100000, 66667, 33333])
+        reference = sac_schedule(100000, 0.01, 3)
+        self.assertLessEqual(np.abs(table['balance'] / 100 - reference['balance']).max(), 0.005)
+
+    def test_sac_balance_ties(self):
+        """Saldos exatamente no meio centavo seguem o modo de arredondamento."""
+        def expected(cents, months, k, rounding):
+            exact = Fraction(cents) * (months - k) / months
+            if rounding == 'half_even':
+                return round(exact)
+            return int(exact + Fraction(1, 2))
+
+        for cents, rounding in ((15, 'half_even'), (25, 'half_even'), (49, 'half_up'),
+                                (15, 'half_up'), (25, 'half_up'), (49, 'half_even')):
+            with self.subTest(cents=cents, rounding=rounding):
+                table = sac_schedule_cents(cents / 100, 0.0, 22, rounding)
+                balance = [expected(cents, 22, k, rounding) for k in range(1, 23)]
+                np.testing.assert_array_equal(table['balance'], balance)
+                self.assertEqual(Fraction(cents) * 11 / 22 % 1, Fraction(1, 2))
+
+        self.assertEqual(int(sac_schedule_cents(0.15, 0.0, 22)['balance'][10]), 8)
+        self.assertEqual(int(sac_schedule_cents(0.25, 0.0, 22)['balance'][10]), 12)
+        self.assertEqual(int(sac_schedule_cents(0.49, 0.0, 22, 'half_up')['balance'][10]), 25)
+
+    def test_last_installment_absorbs_residual(self):
+        """A última parcela quita o resíduo do arredondamento da parcela fixa."""
+        table = price_schedule_cents(1000, 0.01, 12)
+        self.assertEqual(int(table['payment'][0]), 8885)
+        self.assertEqual(int(table['payment'][-1]), 8884)
+
+    def test_early_payoff_zeroes_remaining_installments(self):
+        """Parcela arredondada para cima que quita antes deixa o restante zerado."""
+        table = price_schedule_cents(0.02, 0.0, 3)
+        np.testing.assert_array_equal(table['payment'], [1, 1, 0])
+        self.assert_exact(table, 0.02)
+
+
+if __name__ == '__main__':
+    unittest.main()
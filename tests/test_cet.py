@@ -0,0 +1,81 @@
+"""Testes para o cálculo do Custo Efetivo Total (CET)."""
+
+import unittest
+
+import numpy as np
+
+from src.calculators import FinancialCalculators
+from src.calculators.amortization import price_payment
+from src.calculators.cashflow import irr
+from src.calculators.cet import IOF_DAILY_RATE, IOF_FIXED_RATE, cet_batch
+
+
+class TestCET(unittest.TestCase):
+    """Testes para cet_batch."""
+
+    def test_matches_irr_of_cash_flows(self):
+        """CET mensal é a TIR do valor liberado contra as prestações."""
+        rng = np.random.default_rng(20)
+        amounts = rng.uniform(5000, 50000, 40)
+        rates = rng.uniform(0, 80, 40)
+        terms = rng.choice([6, 12, 24, 48, 60], 40)
+        systems = np.where(rng.random(40) < 0.5, 'PRICE', 'SAC')
+        result = cet_batch(amounts, rates, terms, systems, fees=400,
+                           monthly_insurance=12, insurance_rate=0.03)
+        for k in range(40):
+            flows = np.r_[-result.released_amount[k], result.installments[k][result.mask[k]]]
+            self.assertAlmostEqual(result.monthly_cet[k], irr(flows) * 100, places=9)
+        np.testing.assert_allclose(
+            result.annual_cet, ((1 + result.monthly_cet / 100) ** 12 - 1) * 100
+        )
+
+    def test_no_costs_is_nominal_rate(self):
+        """Sem tarifas, IOF e seguro, o CET é a taxa nominal."""
+        result = cet_batch(10000, [0.0, 12.0, 24.0], 24, iof=False)
+        np.testing.assert_allclose(result.monthly_cet, [0.0, 1.0, 2.0], atol=1e-12)
+        self.assertEqual(result.iterations, 1)
+
+    def test_iof_is_financed(self):
+        """IOF financiado incide também sobre ele mesmo (gross-up)."""
+        result = cet_batch(10000, 24.0, 12)
+        rate = 0.02
+        balance = 1.0
+        days_weighted = 0.0
+        payment = price_payment(1.0, rate, 12)
+        for month in range(1, 13):
+            principal = payment - balance * rate
+            balance -= principal
+            days_weighted += principal * 30 * month
+        iof_unit = IOF_FIXED_RATE + IOF_DAILY_RATE * days_weighted
+        self.assertAlmostEqual(result.financed_amount[0], 10000 / (1 - iof_unit), places=6)
+        self.assertAlmostEqual(result.iof[0], result.financed_amount[0] - 10000, places=6)
+
+    def test_costs_raise_cet(self):
+        """Cada custo adicional aumenta o CET."""
+        base = cet_batch(20000, 30.0, 36, iof=False).monthly_cet[0]
+        with_iof = cet_batch(20000, 30.0, 36).monthly_cet[0]
+        with_fees = cet_batch(20000, 30.0, 36, fees=500).monthly_cet[0]
+        upfront = cet_batch(20000, 30.0, 36, fees=500, finance_costs=False)
+        self.assertLess(base, with_iof)
+        self.assertLess(with_iof, with_fees)
+        self.assertAlmostEqual(upfront.financed_amount[0], 20000)
+        self.assertLess(upfront.released_amount[0], 20000 - 500)
+
+    def test_invalid_inputs(self):
+        """Custos negativos ou maiores que o valor devem gerar erro."""
+        with self.assertRaises(ValueError):
+            cet_batch(10000, 24.0, 12, fees=-1)
+        with self.assertRaises(ValueError):
+            cet_batch(1000, 24.0, 12, fees=2000, finance_costs=False)
+        with self.assertRaises(ValueError):
+            cet_batch(0, 24.0, 12)
+
+    def test_financial_calculators_entry_point(self):
+        """calcular_cet retorna o CET anual acima da taxa nominal."""
+        result = FinancialCalculators.calcular_cet(15000, 29.9, 24, tarifas=350)
+        self.assertGreater(result['cet_anual'], 29.9)
+        self.assertGreater(result['iof'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
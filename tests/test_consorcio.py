@@ -0,0 +1,126 @@
+"""Testes para o simulador de consórcio."""
+
+import unittest
+
+import numpy as np
+
+from src.calculators import FinancialCalculators
+from src.calculators.cashflow import npv
+from src.calculators.consorcio import simulate_consorcio
+
+
+def simulate_group(months, group_size, draws, bids, lance, bid_until, participation,
+                   low, high, paths, seed):
+    """Assembleias sorteadas uma a uma, com os lances de cada concorrente."""
+    rng = np.random.default_rng(seed)
+    month = np.full(paths, months)
+    by_bid = np.zeros(paths, dtype=bool)
+    waiting = np.ones(paths, dtype=bool)
+    for t in range(months - 1):
+        active = group_size - t * (draws + bids)
+        if active <= draws:
+            break
+        drawn = waiting & (rng.random(paths) < draws / active)
+        competitors = active - draws - 1
+        offers = np.where(
+            rng.random((paths, competitors)) < participation,
+            rng.uniform(low, high, (paths, competitors)), 0.0
+        )
+        accepted = lance > 0 and t < bid_until
+        won = waiting & ~drawn & accepted & ((offers > lance).sum(axis=1) < bids)
+        month[drawn | won] = t + 1
+        by_bid |= won
+        waiting &= ~(drawn | won)
+    return month, by_bid
+
+
+class TestConsorcio(unittest.TestCase):
+    """Testes para simulate_consorcio."""
+
+    def test_installment_and_total_cost(self):
+        """Parcela inclui taxa de administração e fundo de reserva."""
+        result = simulate_consorcio(60000, 60, admin_fee=16, reserve_fund=2,
+                                    n_paths=1000, seed=1)
+        self.assertAlmostEqual(result.monthly_installment, 60000 * 1.18 / 60)
+        np.testing.assert_allclose(result.cost_ratio, 18.0)
+        np.testing.assert_allclose(result.total_paid, 60000 * 1.18)
+        self.assertAlmostEqual(result.probability.sum(), 1.0)
+
+    def test_lottery_only_is_uniform(self):
+        """Sem lances, um sorteio por mês num grupo cheio é uniforme nos meses."""
+        result = simulate_consorcio(50000, 50, bids_per_month=0, n_paths=1000, seed=2)
+        np.testing.assert_allclose(result.probability, 1 / 50)
+        self.assertAlmostEqual(result.expected_month, 25.5)
+        self.assertFalse(result.by_bid.any())
+
+    def test_probabilities_match_group_simulation(self):
+        """Chances em forma fechada coincidem com assembleias simuladas."""
+        # Lance de R$ 10.000 só cabe no saldo até o mês 23 (7 parcelas de R$ 1.560)
+        params = dict(months=30, group_size=60, draws=1, bids=1, lance=25.0, bid_until=23,
+                      participation=0.3, low=10.0, high=40.0)
+        result = simulate_consorcio(
+            40000, 30, bid=15, embedded_bid=10, group_size=60,
+            bid_participation=0.3, competitor_bids=(10, 40), n_paths=40000, seed=3
+        )
+        month, by_bid = simulate_group(paths=40000, seed=4, **params)
+        observed = np.bincount(month, minlength=31)[1:] / 40000
+        np.testing.assert_allclose(np.cumsum(observed), np.cumsum(result.probability), atol=0.015)
+        self.assertAlmostEqual(by_bid.mean(), result.bid_probability.sum(), delta=0.015)
+        self.assertAlmostEqual(result.by_bid.mean(), result.bid_probability.sum(), delta=0.015)
+        sampled = np.bincount(result.contemplation_month, minlength=31)[1:] / 40000
+        np.testing.assert_allclose(np.cumsum(sampled), np.cumsum(result.probability), atol=0.015)
+        # Cenários simulados assembleia a assembleia: lance só vence enquanto aceito
+        self.assertLessEqual(result.contemplation_month[result.by_bid].max(), 23)
+
+    def test_bid_brings_contemplation_forward(self):
+        """Lance maior antecipa a contemplação."""
+        plain = simulate_consorcio(80000, 100, n_paths=1000, seed=5)
+        bid = simulate_consorcio(80000, 100, bid=30, n_paths=1000, seed=5)
+        self.assertLess(bid.expected_month, plain.expected_month)
+        self.assertGreater(bid.bid_probability.sum(), 0.3)
+
+    def test_effective_cost(self):
+        """Custo efetivo iguala o crédito líquido às parcelas restantes."""
+        result = simulate_consorcio(100000, 80, bid=20, embedded_bid=5, n_paths=500, seed=6)
+        installment = result.monthly_installment
+        for mode, month in ((0, 10), (1, 24)):
+            rate = result.monthly_cost_table[mode, month - 1] / 100
+            after = installment if mode == 0 else result.installment_after_bid[month - 1]
+            credit = 100000 if mode == 0 else 100000 * 0.95 - 20000
+            flows = [credit - installment * month] + [-after] * (80 - month)
+            self.assertAlmostEqual(npv(rate, flows), 0.0, places=4)
+        # Contemplação tardia: parcelas pagas superam o crédito
+        self.assertTrue(np.isnan(result.monthly_cost_table[0, -1]))
+        self.assertTrue(np.isnan(result.monthly_cost[result.contemplation_month == 80]).all())
+
+    def test_seed_is_reproducible(self):
+        """Mesma semente gera os mesmos cenários."""
+        first = simulate_consorcio(50000, 60, bid=20, n_paths=2000, seed=7)
+        second = simulate_consorcio(50000, 60, bid=20, n_paths=2000, seed=7)
+        np.testing.assert_array_equal(first.contemplation_month, second.contemplation_month)
+        np.testing.assert_array_equal(first.by_bid, second.by_bid)
+
+    def test_invalid_parameters(self):
+        """Parâmetros inválidos devem gerar erro."""
+        with self.assertRaises(ValueError):
+            simulate_consorcio(0, 60)
+        with self.assertRaises(ValueError):
+            simulate_consorcio(50000, 60, bid=-1)
+        with self.assertRaises(ValueError):
+            simulate_consorcio(50000, 60, bid=80, embedded_bid=40)
+        with self.assertRaises(ValueError):
+            simulate_consorcio(50000, 60, competitor_bids=(40, 10))
+
+    def test_financial_calculators_entry_point(self):
+        """simular_consorcio retorna parcela e probabilidade do primeiro ano."""
+        sem_lance = FinancialCalculators.simular_consorcio(60000, 60, n_cenarios=2000, semente=8)
+        com_lance = FinancialCalculators.simular_consorcio(
+            60000, 60, lance=40, n_cenarios=2000, semente=8
+        )
+        self.assertAlmostEqual(sem_lance['parcela_mensal'], 60000 * 1.17 / 60)
+        self.assertGreater(com_lance['probabilidade_primeiro_ano'],
+                           sem_lance['probabilidade_primeiro_ano'])
+
+
+if __name__ == '__main__':
+    unittest.main()
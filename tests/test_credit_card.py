@@ -0,0 +1,112 @@
+"""Testes para o simulador de dívida de cartão de crédito."""
+
+import unittest
+
+import numpy as np
+
+from src.calculators import FinancialCalculators
+from src.calculators.credit_card import (
+    MONTHLY_IOF_RATE,
+    installment_plan,
+    simulate_card_debt,
+)
+
+
+def reference_debt(balance, monthly_rate, percent, minimum, spending, cap, months=360):
+    """Laço mês a mês para uma única política de pagamento."""
+    paid_total = charged = 0.0
+    payoff = np.nan
+    for month in range(1, months + 1):
+        invoice = balance + spending
+        paid = min(invoice, max(invoice * percent / 100, minimum))
+        rolled = invoice - paid
+        if rolled <= 1e-6:
+            rolled = 0.0
+        charge = min(rolled * monthly_rate / 100, cap - charged)
+        charged += charge
+        balance = rolled + charge + rolled * MONTHLY_IOF_RATE
+        paid_total += paid
+        if np.isnan(payoff) and rolled == 0:
+            payoff = month
+        if spending == 0 and balance == 0:
+            break
+    return payoff, paid_total, charged
+
+
+class TestCreditCardDebt(unittest.TestCase):
+    """Testes para simulate_card_debt."""
+
+    def test_matches_monthly_loop(self):
+        """Lote vetorizado coincide com o laço de cada política."""
+        percents = [5, 10, 15, 25, 40, 100]
+        for cap in (True, False):
+            result = simulate_card_debt(
+                8000, 12.5, percents, minimum_payment=80, interest_cap=cap
+            )
+            for k, percent in enumerate(percents):
+                payoff, paid, charged = reference_debt(
+                    8000, 12.5, percent, 80, 0.0, 8000 if cap else np.inf
+                )
+                np.testing.assert_equal(result.payoff_month[k], payoff)
+                np.testing.assert_allclose(result.total_paid[k], paid, rtol=1e-12)
+                np.testing.assert_allclose(result.total_interest[k], charged, rtol=1e-12)
+
+    def test_balance_identity(self):
+        """Saldo inicial + juros + IOF = total pago + saldo final."""
+        result = simulate_card_debt([3000, 12000], [9.0, 15.0], [[10], [20]],
+                                    monthly_spending=400, max_months=48)
+        self.assertEqual(result.balance.shape, (4, 49))
+        np.testing.assert_allclose(
+            result.initial_balance + 400 * 48 + result.total_interest + result.total_iof,
+            result.total_paid + result.balance[:, -1]
+        )
+
+    def test_interest_cap(self):
+        """Com o teto, juros não passam de 100% da dívida original."""
+        capped = simulate_card_debt(5000, 14, 15)
+        uncapped = simulate_card_debt(5000, 14, 15, interest_cap=False)
+        self.assertAlmostEqual(capped.total_interest[0], 5000.0)
+        self.assertGreater(uncapped.total_interest[0], 5000.0)
+        self.assertLess(capped.payoff_month[0], uncapped.payoff_month[0])
+
+    def test_minimum_spiral(self):
+        """Pagando só 5% com juros altos o saldo cresce e não quita."""
+        result = simulate_card_debt(2000, 14, 5, interest_cap=False, max_months=120)
+        self.assertTrue(np.isnan(result.payoff_month[0]))
+        self.assertGreater(result.balance[0, -1], 2000)
+
+    def test_full_payment(self):
+        """Fatura integral não gera juros."""
+        result = simulate_card_debt(1500, 14, 100)
+        self.assertEqual(result.payoff_month[0], 1)
+        self.assertEqual(result.total_interest[0], 0.0)
+        self.assertEqual(result.months, 1)
+
+    def test_invalid_parameters(self):
+        """Parâmetros inválidos devem gerar erro."""
+        with self.assertRaises(ValueError):
+            simulate_card_debt(0, 14)
+        with self.assertRaises(ValueError):
+            simulate_card_debt(1000, 14, 0)
+        with self.assertRaises(ValueError):
+            simulate_card_debt(1000, 14, 120)
+
+    def test_installment_plan(self):
+        """Parcelamento segue a tabela PRICE sobre a fatura com IOF."""
+        plan = installment_plan(5000, 8, (6, 12), iof=False)
+        rate = 0.08
+        expected = 5000 * rate / (1 - (1 + rate) ** -12)
+        self.assertAlmostEqual(plan['payment'].iloc[1], expected, places=6)
+        self.assertAlmostEqual(plan['monthly_cet'].iloc[1], 8.0, places=6)
+        with_iof = installment_plan(5000, 8, (6, 12))
+        self.assertTrue((with_iof['annual_cet'] > plan['annual_cet']).all())
+
+    def test_financial_calculators_entry_point(self):
+        """simular_cartao_credito compara o mínimo com a fatura integral."""
+        resultado = FinancialCalculators.simular_cartao_credito(5000, 14)
+        self.assertEqual(resultado['primeiro_pagamento'], 750.0)
+        self.assertGreater(resultado['economia_fatura_integral'], 5000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Testes para o planejador de quitação de dívidas."""
+
+import unittest
+
+import numpy as np
+
+from src.calculators import FinancialCalculators
+from src.calculators.debt_payoff import (
+    Debt,
+    _priority,
+    compare_strategies,
+    plan_debt_payoff,
+)
+
+
+def reference_plan(debts, monthly_budget, priority, max_months=600):
+    """Laço mês a mês: mês de quitação, total pago e saldos por dívida."""
+    balance = [debt.balance for debt in debts]
+    rate = [debt.annual_rate / 100 / 12 for debt in debts]
+    paid = [0.0] * len(debts)
+    payoff = [0] * len(debts)
+    history = [list(balance)]
+    month = 0
+    while any(balance) and month < max_months:
+        month += 1
+        available = monthly_budget
+        for k, debt in enumerate(debts):
+            if balance[k] > 0:
+                balance[k] *= 1 + rate[k]
+                pay = min(debt.minimum_payment, balance[k])
+                balance[k] -= pay
+                paid[k] += pay
+                available -= pay
+                if balance[k] <= 1e-9:
+                    balance[k], payoff[k] = 0.0, month
+        for k in priority:
+            if available <= 1e-12:
+                break
+            if balance[k] > 0:
+                pay = min(available, balance[k])
+                balance[k] -= pay
+                paid[k] += pay
+                available -= pay
+                if balance[k] <= 1e-9:
+                    balance[k], payoff[k] = 0.0, month
+        history.append(list(balance))
+    return payoff, np.array(paid), np.array(history).T
+
+
+DEBTS = [
+    Debt('Cartão', 4500, 90, 400),
+    Debt('Pessoal', 12000, 48, 600),
+    Debt('Veículo', 38000, 19.5, 1100),
+    Debt('Cheque especial', 1500, 84, 150),
+]
+
+
+class TestDebtPayoff(unittest.TestCase):
+    """Testes para plan_debt_payoff."""
+
+    def test_matches_monthly_loop(self):
+        """Eventos por heap coincidem com a simulação mês a mês."""
+        rng = np.random.default_rng(21)
+        for _ in range(40):
+            debts = []
+            for k in range(int(rng.integers(1, 15))):
+                balance = float(rng.uniform(500, 50000))
+                rate = float(rng.choice([0.0, rng.uniform(0, 120)]))
+                minimum = max(balance * (rate / 1200 + 1 / rng.integers(12, 240)), 20.0)
+                debts.append(Debt(f'd{k}', balance, rate, minimum))
+            budget = sum(debt.minimum_payment for debt in debts) * rng.uniform(1, 2)
+            for strategy in ('avalanche', 'snowball'):
+                plan = plan_debt_payoff(debts, budget, strategy)
+                payoff, paid, history = reference_plan(
+                    debts, budget, _priority(debts, strategy, None)
+                )
+                self.assertEqual(plan.payoff_month.tolist(), payoff)
+                np.testing.assert_allclose(plan.total_paid_by_debt, paid, rtol=1e-9)
+                np.testing.assert_allclose(plan.balances(), history, atol=1e-6)
+
+    def test_strategies(self):
+        """Avalanche paga menos juros; bola de neve quita a primeira antes."""
+        avalanche = plan_debt_payoff(DEBTS, 2800, 'avalanche')
+        snowball = plan_debt_payoff(DEBTS, 2800, 'snowball')
+        self.assertEqual(avalanche.order[0], 'Cartão')
+        self.assertEqual(snowball.order[0], 'Cheque especial')
+        self.assertLessEqual(avalanche.total_interest, snowball.total_interest)
+        self.assertLessEqual(snowball.events[0][0], avalanche.events[0][0])
+        table = compare_strategies(DEBTS, 2800)
+        self.assertEqual(list(table['strategy']), ['avalanche', 'snowball'])
+
+    def test_custom_order(self):
+        """Ordem própria define quem recebe o excedente."""
+        order = ['Cheque especial', 'Cartão', 'Veículo', 'Pessoal']
+        plan = plan_debt_payoff(DEBTS, 2800, 'custom', order)
+        self.assertEqual(plan.order, order)
+        payoff, paid, _ = reference_plan(DEBTS, 2800, [3, 0, 2, 1])
+        self.assertEqual(plan.payoff_month.tolist(), payoff)
+        np.testing.assert_allclose(plan.total_paid_by_debt, paid, rtol=1e-9)
+        with self.assertRaises(ValueError):
+            plan_debt_payoff(DEBTS, 2800, 'custom', order[:2])
+
+    def test_many_debts_over_thirty_years(self):
+        """Carteira grande com dívidas de até 30 anos."""
+        debts = []
+        for k in range(60):
+            balance, rate = 20000.0 + 500 * k, 8.0 + k % 10
+            minimum = balance * (rate / 1200) / (1 - (1 + rate / 1200) ** -360)
+            debts.append(Debt(f'd{k}', balance, rate, minimum))
+        budget = sum(debt.minimum_payment for debt in debts)
+        plan = plan_debt_payoff(debts, budget, 'avalanche', max_months=360)
+        self.assertLessEqual(plan.months, 360)
+        self.assertEqual(len(plan.events), 60)
+        self.assertEqual(plan.balances().shape, (60, plan.months + 1))
+
+    def test_invalid_inputs(self):
+        """Orçamento insuficiente e dívidas inválidas devem gerar erro."""
+        with self.assertRaises(ValueError):
+            plan_debt_payoff(DEBTS, 1000)
+        with self.assertRaises(ValueError):
+            plan_debt_payoff([('Cartão', 10000, 200, 100)], 100)
+        with self.assertRaises(ValueError):
+            plan_debt_payoff([('A', 1000, 10, 50), ('A', 500, 5, 50)], 200)
+        with self.assertRaises(ValueError):
+            plan_debt_payoff(DEBTS, 2800, 'aleatória')
+        with self.assertRaises(ValueError):
+            Debt('X', -1, 10, 10)
+
+    def test_financial_calculators_entry_point(self):
+        """planejar_quitacao_dividas aceita tuplas."""
+        plan = FinancialCalculators.planejar_quitacao_dividas(
+            [('Cartão', 3000, 150, 200), ('Carro', 30000, 18, 900)], 1500
+        )
+        self.assertEqual(plan.summary()['name'].iloc[0], 'Cartão')
+        self.assertAlmostEqual(plan.total_paid, plan.total_interest + 33000, places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
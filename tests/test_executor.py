@@ -0,0 +1,111 @@
+"""Testes para o executor de lotes em processos paralelos."""
+
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from src.calculators.executor import BatchCancelledError, BatchExecutor
+from src.calculators.monte_carlo import simulate_retirement
+
+
+def fill_squares(out, start, stop, offset=0.0):
+    """Grava o quadrado de cada índice da faixa."""
+    out[start:stop] = np.arange(start, stop, dtype=np.float64) ** 2 + offset
+
+
+def slow_fill(out, start, stop):
+    """Faixa lenta, usada para testar cancelamento."""
+    time.sleep(0.05)
+    out[start:stop] = 1.0
+
+
+def failing_chunk(out, start, stop):
+    """Faixa que falha."""
+    raise ValueError("Falha na faixa")
+
+
+class TestBatchExecutor(unittest.TestCase):
+    """Testes para BatchExecutor."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = BatchExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def test_results_written_to_shared_memory(self):
+        """Cada faixa deve preencher sua parte do array compartilhado."""
+        calls = []
+        lock = threading.Lock()
+
+        def progress(done, total):
+            with lock:
+                calls.append((done, total))
+
+        job = self.executor.submit(
+            fill_squares, (1000,), 1000, chunk_size=128,
+            progress=progress, params={'offset': 1.0}
+        )
+        values = job.result(timeout=30)
+
+        np.testing.assert_array_equal(values, np.arange(1000.0) ** 2 + 1)
+        self.assertEqual(len(calls), 8)
+        self.assertEqual(max(calls), (1000, 1000))
+        self.assertTrue(job.done())
+        self.assertIs(job.result(), values)
+
+    def test_cancel_pending_chunks(self):
+        """Cancelamento deve interromper faixas pendentes."""
+        executor = BatchExecutor(max_workers=1)
+        try:
+            job = executor.submit(slow_fill, (200,), 200, chunk_size=1)
+            job.cancel()
+            with self.assertRaises(BatchCancelledError):
+                job.result(timeout=30)
+            self.assertLess(job.completed, 200)
+        finally:
+            executor.shutdown(cancel_pending=True)
+
+    def test_shutdown_cancels_pending_chunks(self):
+        """Encerrar com cancel_pending não deve esperar as faixas pendentes."""
+        executor = BatchExecutor(max_workers=1)
+        job = executor.submit(slow_fill, (200,), 200, chunk_size=1)
+        executor.shutdown(cancel_pending=True)
+        self.assertTrue(job.done())
+        self.assertLess(job.completed, 200)
+        job.cancel()
+        with self.assertRaises(BatchCancelledError):
+            job.result(timeout=30)
+
+    def test_worker_exception_propagates(self):
+        """Exceções dos processos devem chegar ao chamador."""
+        job = self.executor.submit(failing_chunk, (10,), 10)
+        with self.assertRaises(ValueError):
+            job.result(timeout=30)
+        with self.assertRaises(ValueError):
+            job.result(timeout=30)
+
+    def test_invalid_arguments(self):
+        """Parâmetros inválidos devem gerar erro."""
+        with self.assertRaises(ValueError):
+            BatchExecutor(max_workers=0)
+        with self.assertRaises(ValueError):
+            self.executor.submit(fill_squares, (0,), 0)
+
+    def test_monte_carlo_matches_serial(self):
+        """Simulação distribuída deve reproduzir a execução serial."""
+        params = dict(n_paths=3000, seed=11, chunk_size=700)
+        serial = simulate_retirement(10000, 500, 120, 2500, 120, **params)
+        parallel = simulate_retirement(
+            10000, 500, 120, 2500, 120, executor=self.executor, **params
+        )
+        self.assertEqual(serial.final_balance, parallel.final_balance)
+        self.assertEqual(serial.depletion_probability, parallel.depletion_probability)
+
+
+if __name__ == '__main__':
+    unittest.main()
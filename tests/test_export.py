@@ -0,0 +1,125 @@
+"""Testes para a exportação de cronogramas em fluxo."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.calculators.amortization import price_schedule, sac_schedule
+from src.calculators.export import EXPORT_DIR, export_schedules, iter_schedule_chunks
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+CONTRACTS = [
+    (250000, 9.5, 360, 'PRICE'),
+    (80000, 12, 48, 'SAC'),
+    (5000, 0, 6, 'price'),
+    (12000, 24, 12, 'SAC'),
+    (1000, 18, 1, 'PRICE'),
+]
+
+
+class TestScheduleChunks(unittest.TestCase):
+    """Testes para iter_schedule_chunks."""
+
+    def test_chunks_match_single_schedules(self):
+        """Cada contrato deve coincidir com o cronograma individual."""
+        frame = pd.concat(iter_schedule_chunks(CONTRACTS, chunk_size=2), ignore_index=True)
+        self.assertEqual(len(frame), sum(contract[2] for contract in CONTRACTS))
+        self.assertEqual(list(frame.columns), [
+            'contract', 'installment', 'payment', 'principal', 'interest', 'balance'
+        ])
+
+        for position, (amount, rate, months, system) in enumerate(CONTRACTS):
+            rows = frame[frame['contract'] == position]
+            kernel = price_schedule if system.upper() == 'PRICE' else sac_schedule
+            expected = kernel(amount, rate / 100 / 12, months)
+            np.testing.assert_array_equal(rows['installment'], np.arange(1, months + 1))
+            for name in expected:
+                np.testing.assert_allclose(rows[name], expected[name], atol=1e-6)
+
+    def test_generator_input_is_consumed_lazily(self):
+        """Contratos de um gerador devem ser lidos apenas um lote por vez."""
+        consumed = []
+
+        def contracts():
+            for contract in CONTRACTS:
+                consumed.append(contract)
+                yield contract
+
+        chunks = iter_schedule_chunks(contracts(), chunk_size=2)
+        first = next(chunks)
+        self.assertEqual(len(consumed), 2)
+        self.assertEqual(set(first['contract']), {0, 1})
+        self.assertEqual([set(chunk['contract']) for chunk in chunks], [{2, 3}, {4}])
+
+    def test_dataframe_input(self):
+        """Um DataFrame de contratos deve gerar o mesmo resultado."""
+        contracts = pd.DataFrame(CONTRACTS, columns=['valor', 'taxa', 'prazo', 'sistema'])
+        from_frame = pd.concat(iter_schedule_chunks(contracts, chunk_size=3))
+        from_list = pd.concat(iter_schedule_chunks(CONTRACTS, chunk_size=3))
+        pd.testing.assert_frame_equal(from_frame, from_list)
+
+    def test_invalid_chunk_size(self):
+        """Lote não positivo deve gerar erro."""
+        with self.assertRaises(ValueError):
+            next(iter_schedule_chunks(CONTRACTS, chunk_size=0))
+
+
+class TestExportSchedules(unittest.TestCase):
+    """Testes para export_schedules."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_csv_round_trip(self):
+        """O CSV deve conter todas as parcelas com um único cabeçalho."""
+        path = export_schedules(CONTRACTS, chunk_size=2, directory=self.directory.name)
+        self.assertEqual(path.parent, Path(self.directory.name))
+        self.assertEqual(path.suffix, '.csv')
+
+        exported = pd.read_csv(path)
+        expected = pd.concat(iter_schedule_chunks(CONTRACTS), ignore_index=True)
+        pd.testing.assert_frame_equal(exported, expected, check_exact=False, rtol=1e-12)
+
+    def test_empty_contracts_write_header(self):
+        """Sem contratos, o arquivo deve ter apenas o cabeçalho."""
+        path = export_schedules([], Path(self.directory.name) / 'vazio.csv')
+        self.assertEqual(path.read_text().strip(),
+                         'contract,installment,payment,principal,interest,balance')
+
+    def test_invalid_format(self):
+        """Formato desconhecido deve gerar erro."""
+        with self.assertRaises(ValueError):
+            export_schedules(CONTRACTS, file_format='xlsx', directory=self.directory.name)
+
+    def test_default_directory_is_project_relative(self):
+        """O diretório padrão não deve depender do diretório atual."""
+        root = Path(__file__).resolve().parents[1]
+        self.assertTrue(EXPORT_DIR.is_absolute())
+        self.assertEqual(EXPORT_DIR, root / 'data' / 'exports')
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow não instalado")
+    def test_parquet_round_trip(self):
+        """O Parquet deve conter um row group por lote."""
+        import pyarrow.parquet as pq
+
+        path = export_schedules(
+            CONTRACTS, file_format='parquet', chunk_size=2, directory=self.directory.name
+        )
+        self.assertEqual(pq.ParquetFile(path).num_row_groups, 3)
+        exported = pd.read_parquet(path)
+        expected = pd.concat(iter_schedule_chunks(CONTRACTS), ignore_index=True)
+        pd.testing.assert_frame_equal(exported, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
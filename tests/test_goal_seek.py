@@ -0,0 +1,136 @@
+"""Testes para as calculadoras inversas."""
+
+import unittest
+
+from src.calculators import FinancialCalculators
+from src.calculators.amortization import price_payment
+from src.calculators.goal_seek import (
+    affordability_matrix,
+    implied_investment_rate,
+    implied_loan_rate,
+    max_loan_amount,
+    required_contribution,
+    required_months,
+)
+from src.calculators.investment import compound_totals
+
+
+def final_amount(principal, annual_rate, months, contribution):
+    """Montante pela convenção de compound_interest."""
+    return compound_totals(principal, annual_rate / 100 / 12, months, contribution)[0]
+
+
+class TestInvestmentGoals(unittest.TestCase):
+    """Testes para metas de investimento."""
+
+    def test_required_contribution_reaches_target(self):
+        """Aporte calculado deve levar exatamente à meta."""
+        contribution = required_contribution(1_000_000, 10, 360, principal=10000)
+        self.assertAlmostEqual(final_amount(10000, 10, 360, contribution), 1_000_000, places=4)
+
+    def test_required_contribution_zero_when_already_reached(self):
+        """Valor inicial suficiente dispensa aportes."""
+        self.assertEqual(required_contribution(1000, 10, 120, principal=1000), 0.0)
+
+    def test_required_months_is_minimal(self):
+        """Prazo deve atingir a meta, e um mês a menos não."""
+        months = required_months(500_000, 8, 1500, principal=20000)
+        self.assertGreaterEqual(final_amount(20000, 8, months, 1500), 500_000)
+        self.assertLess(final_amount(20000, 8, months - 1, 1500), 500_000)
+
+    def test_required_months_without_interest(self):
+        """Sem juros o prazo é linear no aporte."""
+        self.assertEqual(required_months(1000, 0, 100), 11)
+        self.assertEqual(required_months(1000, 0, 100, contribute_last_month=True), 10)
+
+    def test_implied_rate_roundtrip(self):
+        """Taxa implícita deve reproduzir a taxa usada no cálculo."""
+        target = final_amount(5000, 9.5, 240, 800)
+        rate = implied_investment_rate(target, 240, contribution=800, principal=5000)
+        self.assertAlmostEqual(rate, 9.5, places=8)
+
+    def test_unreachable_goal(self):
+        """Meta sem aportes, sem valor inicial ou sem juros deve gerar erro."""
+        with self.assertRaises(ValueError):
+            required_months(1000, 10, 0)
+        with self.assertRaises(ValueError):
+            implied_investment_rate(1000, 12)
+
+
+class TestLoanGoals(unittest.TestCase):
+    """Testes para metas de financiamento."""
+
+    def test_implied_loan_rate_price(self):
+        """Taxa implícita deve reproduzir a parcela PRICE."""
+        rate = implied_loan_rate(200000, 2000, 360)
+        self.assertAlmostEqual(price_payment(200000, rate / 100 / 12, 360), 2000, places=6)
+
+    def test_implied_loan_rate_sac(self):
+        """No SAC a taxa sai da primeira parcela."""
+        rate = implied_loan_rate(120000, 1500, 120, system='SAC')
+        self.assertAlmostEqual(120000 / 120 + 120000 * rate / 100 / 12, 1500, places=8)
+
+    def test_insufficient_payment(self):
+        """Parcela que não quita o principal deve gerar erro."""
+        with self.assertRaises(ValueError):
+            implied_loan_rate(100000, 100, 12)
+
+    def test_max_loan_amount(self):
+        """Valor máximo deve resultar exatamente na parcela limite."""
+        amount = max_loan_amount(2000, 12, 360)
+        self.assertAlmostEqual(price_payment(amount, 0.01, 360), 2000, places=8)
+        amount = max_loan_amount(2000, 12, 360, system='SAC')
+        self.assertAlmostEqual(amount / 360 + amount * 0.01, 2000, places=8)
+        self.assertEqual(max_loan_amount(1000, 0, 12), 12000)
+
+    def test_affordability_matrix(self):
+        """Cada célula coincide com max_loan_amount da parcela permitida."""
+        terms, rates = [60, 120, 240, 360], [0, 7.5, 10, 12.25]
+        for system in ('PRICE', 'SAC'):
+            matrix = affordability_matrix(12000, terms, rates, system, 30, 600)
+            self.assertEqual(matrix.shape, (4, 4))
+            for months in terms:
+                for rate in rates:
+                    self.assertAlmostEqual(
+                        matrix.loc[months, rate],
+                        max_loan_amount(3000, rate, months, system),
+                        places=6
+                    )
+
+    def test_affordability_sac_below_price(self):
+        """A primeira parcela do SAC é maior, então o valor máximo é menor."""
+        price = affordability_matrix(10000, [120, 360], [9, 12])
+        sac = affordability_matrix(10000, [120, 360], [9, 12], 'SAC')
+        self.assertTrue((sac.values < price.values).all())
+
+    def test_affordability_invalid(self):
+        """Outras dívidas acima do limite de renda devem gerar erro."""
+        with self.assertRaises(ValueError):
+            affordability_matrix(5000, [360], [10], other_obligations=1500)
+        with self.assertRaises(ValueError):
+            affordability_matrix(5000, [0], [10])
+        with self.assertRaises(ValueError):
+            affordability_matrix(5000, [360], [10], max_commitment=0)
+
+
+class TestFinancialCalculatorsGoals(unittest.TestCase):
+    """Testes para os atalhos em português."""
+
+    def test_calcular_aporte_necessario(self):
+        """Aporte deve seguir a convenção de calcular_investimento."""
+        aporte = FinancialCalculators.calcular_aporte_necessario(100000, 12, 120, 5000)
+        resultado = FinancialCalculators.calcular_investimento(5000, aporte, 12, 120)
+        self.assertAlmostEqual(resultado.montante_final, 100000, places=4)
+        self.assertEqual(
+            FinancialCalculators.calcular_prazo_necessario(100000, 12, aporte, 5000), 120
+        )
+
+    def test_calcular_valor_maximo_financiamento(self):
+        """Primeira parcela do SAC deve coincidir com o limite."""
+        valor = FinancialCalculators.calcular_valor_maximo_financiamento(2000, 12, 360, 'SAC')
+        resultado = FinancialCalculators.calcular_financiamento_sac(valor, 0, 360, 12)
+        self.assertAlmostEqual(resultado.parcelas[0], 2000, places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
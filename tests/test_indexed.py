@@ -0,0 +1,132 @@
+"""Testes para o motor de financiamentos indexados."""
+
+import unittest
+
+import numpy as np
+
+from src.calculators import FinancialCalculators
+from src.calculators.amortization import price_payment, price_schedule, sac_schedule
+from src.calculators.indexed import (
+    annual_to_monthly,
+    indexed_schedule,
+    simulate_index_paths,
+)
+
+
+def reference_schedule(loan_amount, annual_rate, months, index, system, indexation):
+    """Cronograma indexado pelo laço mês a mês."""
+    rate = annual_rate / 100 / 12
+    balance = loan_amount
+    rows = []
+    for month in range(months):
+        remaining = months - month
+        if indexation == 'balance':
+            correction = balance * index[month]
+            balance += correction
+            month_rate = rate
+        else:
+            correction = 0.0
+            month_rate = (1 + index[month]) * (1 + rate) - 1
+        interest = balance * month_rate
+        if system == 'PRICE':
+            payment = price_payment(balance, month_rate, remaining)
+            principal = payment - interest
+        else:
+            principal = balance / remaining
+            payment = principal + interest
+        balance -= principal
+        rows.append((payment, principal, interest, correction, balance))
+    return np.array(rows).T
+
+
+class TestIndexedSchedule(unittest.TestCase):
+    """Testes para indexed_schedule."""
+
+    def test_matches_loop_for_every_mode(self):
+        """Cada cenário deve coincidir com o laço mês a mês."""
+        rng = np.random.default_rng(15)
+        paths = rng.normal(0.004, 0.01, size=(4, 240))
+        paths[0] = 0.0
+        for system in ('PRICE', 'SAC'):
+            for indexation in ('balance', 'rate'):
+                result = indexed_schedule(250000, 9.5, 240, paths, system, indexation)
+                self.assertEqual(result.payment.shape, (4, 240))
+                for path in range(4):
+                    expected = reference_schedule(
+                        250000, 9.5, 240, paths[path], system, indexation
+                    )
+                    np.testing.assert_allclose(
+                        result.schedule(path).data, expected, rtol=1e-9, atol=1e-6
+                    )
+
+    def test_zero_index_is_fixed_rate(self):
+        """Índice nulo reproduz o cronograma pré-fixado."""
+        for system, kernel in (('PRICE', price_schedule), ('SAC', sac_schedule)):
+            for indexation in ('balance', 'rate'):
+                result = indexed_schedule(100000, 12, 120, 0.0, system, indexation)
+                expected = kernel(100000, 0.01, 120)
+                np.testing.assert_allclose(result.payment[0], expected['payment'])
+                np.testing.assert_allclose(result.balance[0], expected['balance'], atol=1e-6)
+                self.assertTrue((result.correction == 0).all())
+
+    def test_balance_identity(self):
+        """Saldo anterior + correção - amortização = saldo atual."""
+        paths = simulate_index_paths(4.5, 2.0, 360, n_paths=50, seed=3)
+        result = indexed_schedule(300000, 8, 360, paths, 'SAC')
+        opening = np.hstack([np.full((50, 1), 300000.0), result.balance[:, :-1]])
+        np.testing.assert_allclose(
+            opening + result.correction - result.principal, result.balance, atol=1e-6
+        )
+        np.testing.assert_allclose(result.balance[:, -1], 0, atol=1e-6)
+        np.testing.assert_allclose(
+            result.total_paid,
+            300000 + result.total_interest + result.total_correction,
+            rtol=1e-9
+        )
+
+    def test_constant_index_scales_price_payment(self):
+        """No PRICE com correção do saldo, a parcela cresce com o índice."""
+        result = indexed_schedule(100000, 9.5, 12, 0.01, 'PRICE')
+        base = price_payment(100000, 9.5 / 100 / 12, 12)
+        np.testing.assert_allclose(result.payment[0], base * 1.01 ** np.arange(1, 13))
+
+    def test_stress_percentiles(self):
+        """Percentis devem ser ordenados e ter um valor por mês."""
+        paths = simulate_index_paths(2.0, 1.5, 360, n_paths=1000, seed=1, floor=0.0)
+        self.assertEqual(paths.shape, (1000, 360))
+        self.assertTrue((paths >= 0).all())
+        result = indexed_schedule(250000, 9.5, 360, paths, 'PRICE')
+        bands = result.percentiles('payment')
+        self.assertEqual(result.n_paths, 1000)
+        self.assertEqual(bands[5].shape, (360,))
+        self.assertTrue((bands[5] <= bands[50]).all() and (bands[50] <= bands[95]).all())
+        with self.assertRaises(ValueError):
+            result.percentiles('saldo')
+
+    def test_annual_to_monthly(self):
+        """Conversão anual -> mensal deve ser equivalente no composto."""
+        monthly = annual_to_monthly(np.array([4.5, 10.65]))
+        np.testing.assert_allclose((1 + monthly) ** 12 - 1, [0.045, 0.1065])
+
+    def test_invalid_inputs(self):
+        """Parâmetros inválidos devem gerar erro."""
+        with self.assertRaises(ValueError):
+            indexed_schedule(0, 9.5, 12, 0.0)
+        with self.assertRaises(ValueError):
+            indexed_schedule(1000, 9.5, 12, 0.0, indexation='tr')
+        with self.assertRaises(ValueError):
+            indexed_schedule(1000, 9.5, 12, -1.0)
+        with self.assertRaises(ValueError):
+            indexed_schedule(1000, 9.5, 12, np.zeros((2, 2, 12)))
+
+    def test_financial_calculators_entry_point(self):
+        """calcular_financiamento_indexado deve descontar a entrada."""
+        result = FinancialCalculators.calcular_financiamento_indexado(
+            300000, 50000, 360, 9.5, np.full((10, 360), 0.001), 'SAC'
+        )
+        self.assertEqual(result.loan_amount, 250000)
+        self.assertEqual(result.n_paths, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Testes para a conversão de valores nominais em reais de hoje."""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.calculators import FinancialCalculators
+from src.calculators.amortization import amortization_schedule
+from src.calculators.indexed import indexed_schedule
+from src.calculators.inflation import deflator, price_index, real_values, to_real
+from src.calculators.investment import compound_schedule
+from src.calculators.results import ScheduleRows
+
+
+class TestPriceIndex(unittest.TestCase):
+    """Testes para price_index e deflator."""
+
+    def test_constant_rate_compounds_to_annual(self):
+        """Taxa anual constante acumula exatamente a inflação do ano."""
+        index = price_index(24, annual_inflation=4.5)
+        self.assertEqual(index.shape, (25,))
+        self.assertEqual(index[0], 1.0)
+        self.assertAlmostEqual(index[12], 1.045, places=12)
+        self.assertAlmostEqual(index[24], 1.045 ** 2, places=12)
+        np.testing.assert_allclose(deflator(24, 4.5) * index, 1.0)
+
+    def test_monthly_series_and_scenarios(self):
+        """Série mensal do IPCA vira produto acumulado, um por cenário."""
+        series = [0.0042, 0.0083, 0.0016, -0.0002]
+        expected = np.r_[1.0, np.cumprod(1 + np.array(series))]
+        np.testing.assert_allclose(price_index(4, monthly_rates=series), expected)
+        # Série mais longa é cortada no prazo
+        np.testing.assert_allclose(price_index(2, monthly_rates=series), expected[:3])
+        scenarios = price_index(4, monthly_rates=[series, [0.01] * 4])
+        self.assertEqual(scenarios.shape, (2, 5))
+        self.assertAlmostEqual(scenarios[1, -1], 1.01 ** 4)
+
+    def test_invalid_inputs(self):
+        """Inflação ausente, duplicada ou série curta devem gerar erro."""
+        with self.assertRaises(ValueError):
+            price_index(12)
+        with self.assertRaises(ValueError):
+            price_index(12, 4.0, [0.01] * 12)
+        with self.assertRaises(ValueError):
+            price_index(12, monthly_rates=[0.01] * 6)
+
+
+class TestRealValues(unittest.TestCase):
+    """Testes para to_real e real_values."""
+
+    def test_to_real_matches_loop(self):
+        """Deflacionar divide cada mês pelo índice acumulado até ele."""
+        values = np.array([1000.0, 1000.0, 1000.0])
+        real = to_real(values, [1, 2, 3], 12.0)
+        monthly = 1.12 ** (1 / 12)
+        np.testing.assert_allclose(real, values / monthly ** np.arange(1, 4))
+
+    def test_indexed_loan_scenarios(self):
+        """Parcelas corrigidas pelo próprio IPCA voltam ao valor pré-fixado."""
+        rng = np.random.default_rng(25)
+        ipca = rng.normal(0.004, 0.002, (50, 120))
+        loan = indexed_schedule(200000, 6, 120, ipca, system='SAC')
+        real = to_real(loan.payment, np.arange(1, 121), monthly_rates=ipca)
+        fixed = amortization_schedule(200000, 0.005, 120, 'SAC')['payment']
+        np.testing.assert_allclose(real, np.broadcast_to(fixed, real.shape), rtol=1e-9)
+
+    def test_schedule_rows_without_rerun(self):
+        """Evolução mensal é deflacionada pelo mês de cada linha."""
+        result = ScheduleRows(compound_schedule(10000, 0.01, 36, 500), index_key='month')
+        nominal = result.to_dataframe()
+        real = real_values(result, annual_inflation=5.0)
+        self.assertEqual(list(real.columns), list(nominal.columns))
+        factor = 1.05 ** (-nominal.index.to_numpy() / 12)
+        for column in nominal.columns:
+            np.testing.assert_allclose(real[column], nominal[column] * factor)
+        # O cronograma original não é alterado
+        pd.testing.assert_frame_equal(result.to_dataframe(), nominal)
+
+    def test_month_column_and_selected_columns(self):
+        """Coluna 'mes' define o mês; colunas não listadas ficam nominais."""
+        resultado = FinancialCalculators.calcular_investimento(1000, 100, 12, 24)
+        real = FinancialCalculators.calcular_valores_reais(
+            resultado, inflacao_anual=6.0, colunas=['montante']
+        )
+        self.assertEqual(real['montante'].iloc[0], 1000)
+        self.assertAlmostEqual(
+            real['montante'].iloc[-1], resultado.montante_final / 1.06 ** 2, places=8
+        )
+        self.assertEqual(real['aporte'].iloc[-1], 100)
+
+    def test_financing_result(self):
+        """Parcelas do ResultadoFinanciamento em reais de hoje."""
+        resultado = FinancialCalculators.calcular_financiamento_price(300000, 60000, 360, 10)
+        real = FinancialCalculators.calcular_valores_reais(resultado, ipca_mensal=[0.004] * 360)
+        self.assertEqual(len(real), 360)
+        self.assertAlmostEqual(real['parcela'].iloc[-1], resultado.parcelas[-1] / 1.004 ** 360)
+
+
+if __name__ == '__main__':
+    unittest.main()
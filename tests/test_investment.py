@@ -0,0 +1,62 @@
+"""Testes para juros compostos em forma fechada."""
+
+import unittest
+from src.calculators.investment import compound_schedule, compound_totals
+
+
+def reference_breakdown(principal, monthly_rate, months, contribution):
+    """Evolução mensal pelo laço original de compound_interest."""
+    rows = []
+    current_amount = principal
+    total_invested = principal
+    for month in range(1, months + 1):
+        interest = current_amount * monthly_rate
+        current_amount += interest
+        if month < months:
+            current_amount += contribution
+            total_invested += contribution
+        rows.append({
+            'contribution': contribution if month < months else 0,
+            'interest': interest,
+            'balance': current_amount
+        })
+    return current_amount, total_invested, rows
+
+
+class TestCompoundInterestClosedForm(unittest.TestCase):
+    """Testes para totais e evolução mensal de juros compostos."""
+
+    CASES = [
+        (1000, 0.01, 12, 100),
+        (0, 0.005, 420, 500),
+        (10000, 0, 24, 250),
+        (5000, 0.0001, 1, 1000),
+        (2500, 0.02, 0, 100),
+    ]
+
+    def test_totals_match_loop(self):
+        """Totais devem coincidir com o laço, sem aporte no último mês."""
+        for principal, rate, months, contribution in self.CASES:
+            final_amount, total_invested, _ = reference_breakdown(
+                principal, rate, months, contribution
+            )
+            got_final, got_invested = compound_totals(
+                principal, rate, months, contribution
+            )
+            self.assertAlmostEqual(got_final, final_amount, places=6)
+            self.assertAlmostEqual(got_invested, total_invested, places=6)
+
+    def test_schedule_matches_loop(self):
+        """Evolução mensal deve coincidir com o laço original."""
+        for principal, rate, months, contribution in self.CASES:
+            _, _, rows = reference_breakdown(principal, rate, months, contribution)
+            columns = compound_schedule(principal, rate, months, contribution)
+
+            for name, values in columns.items():
+                self.assertEqual(len(values), months)
+                for got, row in zip(values, rows):
+                    self.assertAlmostEqual(got, row[name], places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,270 @@
+"""Testes para a API legada em inglês de ``src/calculators.py``.
+
+O pacote ``src/calculators/`` encobre o módulo de mesmo nome, então ele é
+carregado pelo caminho do arquivo, como em ``benchmarks/bench_adapters.py``.
+"""
+
+import importlib.util
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.calculators.cache import calculator_cache
+
+
+def _load_legacy_module():
+    """Carrega ``src/calculators.py``, encoberto pelo pacote de mesmo nome."""
+    path = Path(__file__).resolve().parents[1] / 'src' / 'calculators.py'
+    spec = importlib.util.spec_from_file_location('legacy_calculators', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+legacy = _load_legacy_module()
+Calculators = legacy.FinancialCalculators
+
+
+def reference_loan(loan_amount, annual_rate, months, system):
+    """Cronograma pelo laço mês a mês original da API legada."""
+    monthly_rate = annual_rate / 100 / 12
+    if system == 'PRICE':
+        if monthly_rate == 0:
+            payment = loan_amount / months
+        else:
+            factor = (1 + monthly_rate) ** months
+            payment = loan_amount * (monthly_rate * factor) / (factor - 1)
+    amortization = loan_amount / months
+    balance = loan_amount
+    rows = []
+    for month in range(1, months + 1):
+        interest = balance * monthly_rate
+        if system == 'PRICE':
+            amortization = payment - interest
+        balance -= amortization
+        rows.append({
+            'installment': month,
+            'payment': amortization + interest,
+            'principal': amortization,
+            'interest': interest,
+            'balance': max(0, balance)
+        })
+    return rows
+
+
+def reference_compound(principal, rate, time, contribution):
+    """Evolução mensal pelo laço original de ``compound_interest``."""
+    monthly_rate = rate / 100 / 12
+    current, invested = principal, principal
+    rows = []
+    for month in range(1, time + 1):
+        interest = current * monthly_rate
+        current += interest
+        if month < time:
+            current += contribution
+            invested += contribution
+        rows.append({
+            'month': month,
+            'contribution': contribution if month < time else 0,
+            'interest': interest,
+            'balance': current
+        })
+    return current, invested, rows
+
+
+class TestLegacyLoanCalculator(unittest.TestCase):
+    """Testes para loan_calculator e compound_interest da API legada."""
+
+    CASES = [
+        (200000, 9.5, 360, 'PRICE'),
+        (200000, 9.5, 360, 'SAC'),
+        (10000, 12, 12, 'PRICE'),
+        (12000, 12, 12, 'SAC'),
+        (5000, 0, 10, 'PRICE'),
+        (1000, 18, 1, 'SAC'),
+    ]
+
+    def setUp(self):
+        calculator_cache.clear()
+
+    def test_loan_rows_match_reference(self):
+        """Parcelas devem manter chaves, tamanho e totais do laço original."""
+        for loan_amount, annual_rate, months, system in self.CASES:
+            with self.subTest(system=system, months=months, rate=annual_rate):
+                result = Calculators.loan_calculator(loan_amount, annual_rate, months, system)
+                expected = reference_loan(loan_amount, annual_rate, months, system)
+                rows = result.installments
+                self.assertEqual(len(rows), months)
+                self.assertEqual(
+                    list(rows[0]), ['installment', 'payment', 'principal', 'interest', 'balance']
+                )
+                for row, reference in zip(rows, expected):
+                    self.assertEqual(row['installment'], reference['installment'])
+                    for key in ('payment', 'principal', 'interest'):
+                        self.assertAlmostEqual(row[key], reference[key], places=6)
+                    self.assertAlmostEqual(row['balance'], reference['balance'], places=4)
+
+                total_paid = sum(row['payment'] for row in expected)
+                self.assertAlmostEqual(result.total_amount, total_paid, places=4)
+                self.assertAlmostEqual(
+                    result.total_interest, total_paid - loan_amount, places=4
+                )
+                self.assertAlmostEqual(result.interest_rate, annual_rate)
+
+    def test_loan_lowercase_system_and_errors(self):
+        """Sistema deve aceitar minúsculas e parâmetros inválidos devem falhar."""
+        lower = Calculators.loan_calculator(10000, 12, 12, 'sac')
+        upper = Calculators.loan_calculator(10000, 12, 12, 'SAC')
+        self.assertAlmostEqual(lower.total_interest, upper.total_interest)
+        with self.assertRaises(ValueError):
+            Calculators.loan_calculator(10000, 12, 12, 'SACRE')
+        with self.assertRaises(ValueError):
+            Calculators.loan_calculator(0, 12, 12)
+
+    def test_loan_to_dict_is_json(self):
+        """to_dict deve gerar um resumo serializável com as parcelas em colunas."""
+        result = Calculators.loan_calculator(10000, 12, 12)
+        data = json.loads(json.dumps(result.to_dict()))
+        self.assertEqual(len(data['installments']['payment']), 12)
+        self.assertAlmostEqual(data['total_amount'], result.total_amount)
+
+    def test_exact_cents(self):
+        """Modo em centavos deve fechar parcela, juros e saldo ao centavo."""
+        for system in ('PRICE', 'SAC'):
+            result = Calculators.loan_calculator(200000, 9.5, 360, system, exact_cents=True)
+            table = result.installments.table
+            cents = np.round(table.data * 100)
+            np.testing.assert_allclose(cents, table.data * 100, rtol=0, atol=1e-6)
+            np.testing.assert_array_equal(cents[0], cents[1] + cents[2])
+            self.assertEqual(cents[1].sum(), 20_000_000)
+            self.assertEqual(table['balance'][-1], 0)
+            self.assertAlmostEqual(
+                result.total_amount, result.loan_amount + result.total_interest, places=6
+            )
+
+    def test_compound_interest_matches_reference(self):
+        """Totais e evolução mensal devem coincidir com o laço original."""
+        for principal, rate, time, contribution in ((1000, 12, 24, 100), (0, 9, 1, 50),
+                                                    (5000, 0, 12, 200), (10000, 10.5, 360, 500)):
+            with self.subTest(rate=rate, time=time):
+                result = Calculators.compound_interest(principal, rate, time, contribution)
+                final, invested, rows = reference_compound(principal, rate, time, contribution)
+                self.assertAlmostEqual(result.final_amount, final, delta=1e-9 * max(final, 1))
+                self.assertAlmostEqual(result.total_invested, invested)
+                self.assertEqual(len(result.monthly_breakdown), time)
+                self.assertEqual(
+                    list(result.monthly_breakdown[0]), ['month', 'contribution', 'interest', 'balance']
+                )
+                last = result.monthly_breakdown[-1]
+                self.assertEqual(last['month'], time)
+                self.assertEqual(last['contribution'], 0)
+                self.assertAlmostEqual(last['balance'], rows[-1]['balance'],
+                                       delta=1e-9 * max(final, 1))
+
+    def test_cached_schedules_respect_byte_budget(self):
+        """Resultados em cache devem contar o cronograma gerado sob demanda."""
+        for amount in range(1000, 1010):
+            result = Calculators.loan_calculator(amount, 12, 360)
+            result.installments[:12]  # Gera as linhas, como o app
+            Calculators.compound_interest(amount, 12, 360).monthly_breakdown[:12]
+        self.assertGreaterEqual(calculator_cache.stats()['bytes'], 10 * 360 * (4 + 3) * 8)
+
+    def test_cached_results_are_not_shared_mutably(self):
+        """Alterar o resultado devolvido não deve afetar a chamada seguinte."""
+        first = Calculators.loan_calculator(10000, 12, 12)
+        payment = first.monthly_payment
+        with self.assertRaises(AttributeError):
+            first.monthly_payment = 0
+        with self.assertRaises(ValueError):
+            first.to_numpy()[0, 0] = 0
+        first.installments[0]['payment'] = 0
+        frame = first.to_dataframe()
+        frame['payment'] = 0
+
+        second = Calculators.loan_calculator(10000, 12, 12)
+        self.assertEqual(calculator_cache.stats()['hits'], 1)
+        self.assertEqual(second.monthly_payment, payment)
+        self.assertAlmostEqual(second.installments[0]['payment'], payment)
+        self.assertAlmostEqual(second.to_numpy()[0, 0], payment)
+
+
+class TestLegacyWrappers(unittest.TestCase):
+    """Testes para os atalhos da API legada sobre os motores do pacote."""
+
+    def test_loan_calculator_batch(self):
+        """Lote deve coincidir com cálculos individuais."""
+        batch = Calculators.loan_calculator_batch([10000, 20000], [12, 24], 12, ['PRICE', 'SAC'])
+        self.assertEqual(len(batch), 2)
+        for index, (amount, rate, system) in enumerate(((10000, 12, 'PRICE'), (20000, 24, 'SAC'))):
+            single = Calculators.loan_calculator(amount, rate, 12, system)
+            self.assertAlmostEqual(batch.total_interest[index], single.total_interest, places=6)
+
+    def test_export_loan_schedules(self):
+        """Exportação deve gravar uma linha por parcela de cada contrato."""
+        contracts = [(10000, 12, 12, 'PRICE'), (5000, 9, 6, 'SAC')]
+        with tempfile.TemporaryDirectory() as directory:
+            path = Calculators.export_loan_schedules(contracts, Path(directory) / 'out.csv')
+            frame = pd.read_csv(path)
+        self.assertEqual(len(frame), 18)
+        self.assertEqual(frame['contract'].nunique(), 2)
+
+    def test_loan_cet(self):
+        """CET deve superar a taxa contratada e crescer com a tarifa."""
+        result = Calculators.loan_cet([10000, 10000], 12, 12, fees=[0, 500])
+        monthly = result.monthly_cet
+        self.assertGreater(monthly[0], 1.0)
+        self.assertGreater(monthly[1], monthly[0])
+
+    def test_debt_payoff_planner(self):
+        """Plano deve quitar todas as dívidas dentro do prazo."""
+        plan = Calculators.debt_payoff_planner(
+            [('cartao', 3000, 120, 150), ('pessoal', 8000, 30, 300)], 1200
+        )
+        self.assertTrue(np.isfinite(plan.payoff_month).all())
+        self.assertEqual(plan.order[0], 'cartao')
+        self.assertGreater(plan.total_paid, 11000)
+
+    def test_consorcio_simulator(self):
+        """Parcela e comparação com financiamento devem ser consistentes."""
+        result = Calculators.consorcio_simulator(
+            100000, 100, financing_rate=12, n_paths=2000, seed=1
+        )
+        self.assertAlmostEqual(result['monthly_installment'], 100000 * 1.17 / 100)
+        self.assertTrue(1 <= result['contemplation_month_p50'] <= 100)
+        loan = Calculators.loan_calculator(100000, 12, 100)
+        self.assertAlmostEqual(result['financing_monthly_payment'], loan.monthly_payment)
+
+    def test_credit_card_debt(self):
+        """Pagamento integral quita no primeiro mês; o mínimo demora mais."""
+        result = Calculators.credit_card_debt(2000, 14, payment_percents=(15, 100))
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result.payoff_month[1], 1)
+        self.assertGreater(result.payoff_month[0], 1)
+        plan = Calculators.card_installment_plan(2000, 9, installments=(3, 12))
+        self.assertEqual(list(plan['installments']), [3, 12])
+
+    def test_affordability_matrix(self):
+        """Cada célula deve igualar max_loan_amount."""
+        matrix = Calculators.affordability_matrix(10000, [120, 360], [9, 12])
+        self.assertAlmostEqual(
+            matrix.loc[360, 12], Calculators.max_loan_amount(3000, 12, 360), places=6
+        )
+
+    def test_real_values(self):
+        """Sem inflação os valores reais devem igualar os nominais."""
+        result = Calculators.compound_interest(1000, 12, 24, 100)
+        nominal = result.to_dataframe()
+        real = Calculators.real_values(result, annual_inflation=0)
+        np.testing.assert_allclose(real['balance'], nominal['balance'])
+        deflated = Calculators.real_values(result, annual_inflation=5)
+        self.assertAlmostEqual(
+            deflated['balance'].iloc[-1], nominal['balance'].iloc[-1] / 1.05 ** 2
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Testes para a simulação de Monte Carlo de aposentadoria."""
+
+import unittest
+from src.calculators.monte_carlo import simulate_retirement
+
+
+class TestSimulateRetirement(unittest.TestCase):
+    """Testes para o simulador de Monte Carlo."""
+
+    def test_seed_is_reproducible(self):
+        """Mesma semente deve gerar os mesmos percentis."""
+        params = dict(n_paths=2001, seed=7, chunk_size=500)
+        first = simulate_retirement(10000, 500, 120, 2000, 60, **params)
+        second = simulate_retirement(10000, 500, 120, 2000, 60, **params)
+        self.assertEqual(first.final_balance, second.final_balance)
+        self.assertEqual(first.depletion_probability, second.depletion_probability)
+
+    def test_zero_volatility_matches_compounding(self):
+        """Sem volatilidade, todos os cenários seguem a capitalização efetiva."""
+        result = simulate_retirement(
+            10000, 500, 120, expected_return=12, volatility=0, n_paths=10, seed=1
+        )
+        growth = 1.12 ** (1 / 12)
+        expected = 10000
+        for _ in range(120):
+            expected = expected * growth + 500
+
+        for value in result.retirement_balance.values():
+            self.assertAlmostEqual(value / expected, 1.0, places=4)
+        self.assertEqual(result.depletion_probability, 0.0)
+
+    def test_percentile_bands_are_ordered(self):
+        """Bandas devem respeitar P5 <= P50 <= P95 em todos os meses."""
+        result = simulate_retirement(50000, 1000, 240, 3000, 240, n_paths=5000, seed=3)
+        self.assertEqual(result.months[0], 0)
+        self.assertEqual(result.months[-1], 480)
+        self.assertTrue((result.bands[5] <= result.bands[50]).all())
+        self.assertTrue((result.bands[50] <= result.bands[95]).all())
+
+    def test_depletion_probability(self):
+        """Retiradas impossíveis devem esgotar todos os cenários."""
+        result = simulate_retirement(1000, 0, 0, 5000, 24, n_paths=1000, seed=1)
+        self.assertEqual(result.depletion_probability, 1.0)
+        self.assertEqual(result.median_depletion_month, 1.0)
+
+    def test_invalid_inputs(self):
+        """Parâmetros inválidos devem gerar ValueError."""
+        with self.assertRaises(ValueError):
+            simulate_retirement(-1, 100, 12)
+        with self.assertRaises(ValueError):
+            simulate_retirement(1000, 100, 12, n_paths=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+"""Testes para o simulador de amortizações extraordinárias."""
+
+import math
+import unittest
+
+import numpy as np
+
+from src.calculators import FinancialCalculators
+from src.calculators.amortization import price_payment, price_schedule, sac_schedule
+from src.calculators.prepayment import PrepaymentEvent, PrepaymentSimulator
+
+
+def reference_schedule(loan_amount, annual_rate, months, system, events):
+    """Cronograma pelo laço mês a mês, aplicando os eventos em sequência."""
+    rate = annual_rate / 100 / 12
+    events = {event[0]: event for event in events}
+    balance = loan_amount
+    level = price_payment(loan_amount, rate, months) if system == 'PRICE' else loan_amount / months
+    end = months
+    rows = []
+    month = 0
+    while month < end:
+        month += 1
+        interest = balance * rate
+        if month == end:
+            principal = balance
+        else:
+            principal = level - interest if system == 'PRICE' else level
+        balance -= principal
+        extra = 0.0
+        if month in events and month < end:
+            _, amount, mode = events[month]
+            extra = min(amount, balance)
+            balance -= extra
+            if balance <= 0:
+                end = month
+            elif mode == 'reduce_payment':
+                remaining = end - month
+                if system == 'PRICE':
+                    level = price_payment(balance, rate, remaining)
+                else:
+                    level = balance / remaining
+            elif system == 'PRICE' and rate > 0:
+                remaining = -math.log1p(-balance * rate / level) / math.log1p(rate)
+                end = month + max(math.ceil(remaining - 1e-9), 1)
+            else:
+                end = month + max(math.ceil(balance / level - 1e-9), 1)
+        rows.append((principal + interest, principal, interest, extra, max(balance, 0.0)))
+    return np.array(rows).T
+
+
+class TestPrepaymentSimulator(unittest.TestCase):
+    """Testes para PrepaymentSimulator."""
+
+    def assert_matches_reference(self, loan_amount, annual_rate, months, system, events):
+        simulator = PrepaymentSimulator(loan_amount, annual_rate, months, system, events)
+        expected = reference_schedule(loan_amount, annual_rate, months, system, events)
+        got = simulator.schedule().data
+        self.assertEqual(got.shape, expected.shape)
+        np.testing.assert_allclose(got, expected, rtol=1e-9, atol=1e-6)
+        return simulator
+
+    def test_without_events_matches_kernels(self):
+        """Sem eventos, o cronograma deve ser o do kernel de amortização."""
+        for system, kernel in (('PRICE', price_schedule), ('SAC', sac_schedule)):
+            schedule = PrepaymentSimulator(250000, 9.5, 360, system).schedule()
+            expected = kernel(250000, 9.5 / 100 / 12, 360)
+            for name in expected:
+                np.testing.assert_allclose(schedule[name], expected[name], atol=1e-6)
+            self.assertTrue((schedule['prepayment'] == 0).all())
+
+    def test_reduce_term(self):
+        """Reduzir o prazo mantém a parcela e quita antes."""
+        simulator = self.assert_matches_reference(
+            250000, 9.5, 360, 'PRICE', [(12, 20000, 'reduce_term')]
+        )
+        result = simulator.result()
+        schedule = result.schedule
+        self.assertLess(result.months, 360)
+        self.assertAlmostEqual(schedule['payment'][12], schedule['payment'][0])
+        self.assertGreater(result.interest_saved, 0)
+        self.assertAlmostEqual(result.total_prepaid, 20000)
+        self.assertAlmostEqual(
+            schedule['principal'].sum() + result.total_prepaid, 250000, places=6
+        )
+
+    def test_reduce_payment(self):
+        """Reduzir a parcela mantém o prazo original."""
+        simulator = self.assert_matches_reference(
+            100000, 12, 120, 'SAC', [(24, 10000, 'reduce_payment')]
+        )
+        schedule = simulator.schedule()
+        self.assertEqual(simulator.result().months, 120)
+        self.assertLess(schedule['principal'][24], schedule['principal'][23])
+
+    def test_random_events_match_reference(self):
+        """Combinações aleatórias de eventos devem coincidir com o laço."""
+        rng = np.random.default_rng(14)
+        for _ in range(200):
+            months = int(rng.integers(1, 420))
+            loan_amount = float(rng.uniform(1000, 1e6))
+            events = {
+                int(month): (int(month), float(rng.uniform(1, loan_amount / 3)),
+                             str(rng.choice(['reduce_term', 'reduce_payment'])))
+                for month in rng.integers(1, months + 5, size=rng.integers(0, 6))
+            }
+            self.assert_matches_reference(
+                loan_amount, float(rng.choice([0, rng.uniform(1, 40)])), months,
+                str(rng.choice(['PRICE', 'SAC'])), list(events.values())
+            )
+
+    def test_prepayment_above_balance_pays_off(self):
+        """Pagamento extra maior que o saldo quita o contrato no mês."""
+        result = PrepaymentSimulator(10000, 12, 24, 'PRICE', [(6, 1e6)]).result()
+        self.assertEqual(result.months, 6)
+        self.assertEqual(result.schedule['balance'][-1], 0.0)
+        self.assertLess(result.total_prepaid, 10000)
+
+    def test_events_after_payoff_are_ignored(self):
+        """Eventos depois da quitação não alteram o cronograma."""
+        base = PrepaymentSimulator(10000, 12, 24).schedule()
+        late = PrepaymentSimulator(10000, 12, 24, events=[(24, 500), (30, 500)]).schedule()
+        np.testing.assert_array_equal(base.data, late.data)
+
+    def test_edits_reuse_prefix(self):
+        """Editar um evento recalcula só o sufixo e equivale a recalcular tudo."""
+        events = [(month, 3000, 'reduce_term') for month in range(12, 300, 24)]
+        simulator = PrepaymentSimulator(250000, 9.5, 360, 'PRICE', events)
+        prefix = [segment.block for segment in simulator._segments[:5]]
+
+        simulator.add_event(130, 8000, 'reduce_payment')
+        simulator.remove_event(180)
+        for cached, segment in zip(prefix, simulator._segments):
+            self.assertIs(segment.block, cached)
+
+        fresh = PrepaymentSimulator(250000, 9.5, 360, 'PRICE', simulator.events)
+        np.testing.assert_array_equal(simulator.schedule().data, fresh.schedule().data)
+
+        first = simulator.schedule()
+        simulator.clear()
+        self.assertEqual(simulator.events, [])
+        self.assertEqual(simulator.result().months, 360)
+        self.assertGreater(first['prepayment'].sum(), 0)  # Resultado anterior intacto
+
+    def test_invalid_inputs(self):
+        """Parâmetros e eventos inválidos devem gerar erro."""
+        with self.assertRaises(ValueError):
+            PrepaymentSimulator(0, 12, 12)
+        with self.assertRaises(ValueError):
+            PrepaymentSimulator(1000, 12, 12, 'SACRE')
+        with self.assertRaises(ValueError):
+            PrepaymentEvent(0, 100)
+        with self.assertRaises(ValueError):
+            PrepaymentEvent(3, 100, 'reduce_both')
+        with self.assertRaises(KeyError):
+            PrepaymentSimulator(1000, 12, 12).remove_event(3)
+
+    def test_financial_calculators_entry_point(self):
+        """simular_amortizacao_extraordinaria deve descontar a entrada."""
+        simulator = FinancialCalculators.simular_amortizacao_extraordinaria(
+            300000, 50000, 360, 9.5, [(12, 20000, 'reduce_term')]
+        )
+        self.assertEqual(simulator.loan_amount, 250000)
+        self.assertEqual(simulator.events, [PrepaymentEvent(12, 20000, 'reduce_term')])
+        with self.assertRaises(ValueError):
+            FinancialCalculators.simular_amortizacao_extraordinaria(1000, 1000, 12, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Testes para as tabelas pré-calculadas de fatores."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src.calculators.amortization import price_payment
+from src.calculators.investment import compound_totals
+from src.calculators.rate_tables import (
+    STANDARD_TERMS,
+    RateFactorTable,
+    _table_from_env,
+    build_factors,
+    catalog_table,
+    rate_factors,
+)
+from src.knowledge_base.product_catalog import ProductCatalog
+from tests.test_legacy_calculators import Calculators
+
+
+class TestRateFactorTable(unittest.TestCase):
+    """Testes para RateFactorTable."""
+
+    def test_factors_match_closed_forms(self):
+        """Parcela e montante pelos fatores coincidem com as fórmulas."""
+        table = RateFactorTable([0.0, 9.5, 12.0, 35.5])
+        for annual in (0.0, 9.5, 12.0, 35.5):
+            rate = annual / 100 / 12
+            for months in STANDARD_TERMS:
+                factors = table.get(rate, months)
+                self.assertAlmostEqual(
+                    250000 * factors.payment / price_payment(250000, rate, months), 1.0, places=12
+                )
+                final, _ = compound_totals(10000, rate, months, 500)
+                self.assertAlmostEqual(
+                    (10000 * factors.growth + 500 * (factors.annuity - 1)) / final, 1.0, places=12
+                )
+
+    def test_lookup_misses(self):
+        """Taxas ou prazos não registrados não estão na tabela."""
+        table = RateFactorTable([9.5])
+        self.assertIsNone(table.get(9.4 / 100 / 12, 360))
+        self.assertIsNone(table.get(9.5 / 100 / 12, 100))
+        self.assertIsNotNone(rate_factors.get(9.5 / 100 / 12, 360))
+
+    def test_catalog_rates_are_registered(self):
+        """Taxas dos produtos do catálogo entram na tabela padrão."""
+        rates = ProductCatalog().get_annual_rates()
+        self.assertIn(13.65, rates)
+        for annual in rates:
+            for months in STANDARD_TERMS:
+                self.assertIsNotNone(rate_factors.get(annual / 100 / 12, months))
+        catalog = ProductCatalog()
+        catalog.products = [{'id': 'teste', 'annual_rates': [41.3]}]
+        self.assertIsNotNone(catalog_table(catalog).get(41.3 / 100 / 12, 24))
+
+    def test_table_payment_matches_installments(self):
+        """Com a taxa na tabela, resumo e parcelas usam a mesma parcela."""
+        for annual in (13.65, 23.88, 9.5):
+            result = Calculators.loan_calculator(100000, annual, 360)
+            self.assertIsNotNone(rate_factors.get(annual / 100 / 12, 360))
+            self.assertEqual(result.installments[0]['payment'], result.monthly_payment)
+            self.assertEqual(result.installments[-1]['payment'], result.monthly_payment)
+
+    def test_register_is_incremental(self):
+        """Registrar de novo não duplica; novas taxas entram ordenadas."""
+        table = RateFactorTable([12.0, 9.5], terms=(12, 24))
+        table.register([9.5, 10.0])
+        np.testing.assert_array_equal(table.rates, [9.5, 10.0, 12.0])
+        self.assertEqual(len(table), 6)
+        with self.assertRaises(ValueError):
+            table.register([-1.0])
+        with self.assertRaises(ValueError):
+            RateFactorTable(terms=(0, 12))
+
+    def test_save_and_load(self):
+        """Tabela gravada em disco é lida com os mesmos fatores."""
+        table = RateFactorTable([6.5, 9.5, 14.0])
+        with tempfile.TemporaryDirectory() as directory:
+            path = table.save(os.path.join(directory, 'fatores.npz'))
+            loaded = RateFactorTable.load(path)
+            with mock.patch.dict(os.environ, {'CALCULATOR_RATE_TABLE': path}):
+                from_env = _table_from_env()
+        self.assertEqual(len(loaded), len(table))
+        self.assertEqual(len(from_env), len(table))
+        rate = 14.0 / 100 / 12
+        self.assertEqual(loaded.get(rate, 360), table.get(rate, 360))
+
+    def test_build_factors_shape(self):
+        """Grade vetorizada tem forma (taxas, prazos)."""
+        growth, payment, annuity = build_factors(np.array([0.0, 0.01]), np.array(STANDARD_TERMS))
+        self.assertEqual(growth.shape, (2, len(STANDARD_TERMS)))
+        np.testing.assert_allclose(annuity[0], STANDARD_TERMS)
+        np.testing.assert_allclose(payment * annuity, 1 + np.array([[0.0], [0.01]]) * annuity)
+
+
+if __name__ == '__main__':
+    unittest.main()
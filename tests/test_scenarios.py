@@ -0,0 +1,70 @@
+"""Testes para a grade de cenários de investimento."""
+
+import unittest
+
+import numpy as np
+
+from src.calculators.investment import compound_totals
+from src.calculators.scenarios import scenario_grid, top_k_indices
+
+
+class TestScenarioGrid(unittest.TestCase):
+    """Testes para scenario_grid."""
+
+    def setUp(self):
+        self.rates = [6.0, 10.0, 12.0, 0.0]
+        self.horizons = [0, 1, 12, 120]
+        self.contributions = [0.0, 250.0]
+        self.cube = scenario_grid(
+            5000, self.rates, self.horizons, self.contributions,
+            names=['Poupança', 'CDB', 'Tesouro', 'Conta']
+        )
+
+    def test_matches_compound_totals(self):
+        """Cada célula do cubo deve coincidir com compound_totals."""
+        self.assertEqual(self.cube.shape, (4, 4, 2))
+        for p, rate in enumerate(self.rates):
+            for m, months in enumerate(self.horizons):
+                for c, contribution in enumerate(self.contributions):
+                    final, invested = compound_totals(5000, rate / 1200, months, contribution)
+                    self.assertAlmostEqual(self.cube.final_amount[p, m, c], final, places=6)
+                    self.assertAlmostEqual(self.cube.total_invested[m, c], invested, places=6)
+
+    def test_top_k_matches_full_sort(self):
+        """Seleção por argpartition deve coincidir com a ordenação completa."""
+        rng = np.random.default_rng(0)
+        cube = scenario_grid(1000, rng.uniform(1, 15, 300), [12, 60, 360], [0, 100, 1000])
+        expected = np.argsort(-cube.final_amount, axis=0, kind='stable')[:7]
+        np.testing.assert_array_equal(cube.top_k(7), expected)
+
+    def test_top_k_ties_keep_original_order(self):
+        """Empates devem manter a ordem original dos produtos."""
+        np.testing.assert_array_equal(top_k_indices(np.array([1.0, 3.0, 3.0, 2.0]), 4), [1, 2, 3, 0])
+        with self.assertRaises(ValueError):
+            top_k_indices(np.array([1.0]), 2)
+
+    def test_ranking(self):
+        """Ranking de um cenário deve vir do maior para o menor montante."""
+        ranking = self.cube.ranking(120, 250, k=2)
+        self.assertEqual(list(ranking['name']), ['Tesouro', 'CDB'])
+        with self.assertRaises(ValueError):
+            self.cube.ranking(48)
+
+    def test_to_dataframe(self):
+        """Formato longo deve ter uma linha por combinação."""
+        df = self.cube.to_dataframe()
+        self.assertEqual(len(df), 4 * 4 * 2)
+        self.assertAlmostEqual(
+            df.loc[('CDB', 12, 250.0), 'final_amount'], self.cube.final_amount[1, 2, 1]
+        )
+
+    def test_invalid_inputs(self):
+        """Taxas negativas e nomes incompatíveis devem gerar erro."""
+        with self.assertRaises(ValueError):
+            scenario_grid(1000, [-1.0], [12])
+        with self.assertRaises(ValueError):
+            scenario_grid(1000, [1.0, 2.0], [12], names=['A'])
+
+
+if __name__ == '__main__':
+    unittest.main()
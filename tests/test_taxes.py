@@ -0,0 +1,120 @@
+"""Testes para o motor de rendimento líquido de impostos e taxas."""
+
+import unittest
+
+import numpy as np
+
+from src.calculators.scenarios import scenario_grid
+from src.calculators.taxes import (
+    IOF_TABLE,
+    IR_TABLE,
+    MONTH_RUNS,
+    days_held,
+    income_tax_rate,
+    iof_rate,
+    net_scenario_grid,
+    tax_on_gain,
+)
+
+
+def reference_net(principal, annual_rate, months, contribution, admin=0.0, custody=0.0,
+                  exempt=False):
+    """Valor líquido tributando cada lote pelo laço, resgate a resgate."""
+    growth = (1 + annual_rate / 100 / 12) * ((1 - admin / 100) * (1 - custody / 100)) ** (1 / 12)
+    lots = [(principal, months)] + [(contribution, months - m) for m in range(1, months)]
+    total = 0.0
+    for amount, held in lots:
+        value = amount * growth ** held
+        gain = max(value - amount, 0.0)
+        days = int(round(held * 365 / 12))
+        if exempt:
+            iof = ir = 0.0
+        else:
+            iof = gain * IOF_TABLE[min(days, len(IOF_TABLE) - 1)] / 100
+            ir = (gain - iof) * IR_TABLE[min(days, len(IR_TABLE) - 1)] / 100
+        total += value - iof - ir
+    return total
+
+
+class TestTaxTables(unittest.TestCase):
+    """Testes para as tabelas de alíquotas."""
+
+    def test_income_tax_brackets(self):
+        """IR regressivo deve seguir as faixas de dias."""
+        days = np.array([0, 180, 181, 360, 361, 720, 721, 5000])
+        np.testing.assert_array_equal(
+            income_tax_rate(days), [22.5, 22.5, 20.0, 20.0, 17.5, 17.5, 15.0, 15.0]
+        )
+
+    def test_iof_table(self):
+        """IOF decresce até zero a partir de 30 dias."""
+        np.testing.assert_array_equal(iof_rate([1, 15, 29, 30, 400]), [96, 50, 3, 0, 0])
+        self.assertFalse(IOF_TABLE.flags.writeable)
+
+    def test_month_runs(self):
+        """Faixas mensais cobrem 1 mês em diante sem lacunas."""
+        self.assertEqual(MONTH_RUNS[0][0], 1)
+        self.assertEqual(MONTH_RUNS[-1][1], -1)
+        for (_, last, _), (first, _, _) in zip(MONTH_RUNS, MONTH_RUNS[1:]):
+            self.assertEqual(first, last + 1)
+        for first, last, rate in MONTH_RUNS[:-1]:
+            np.testing.assert_array_equal(
+                income_tax_rate(days_held(np.arange(first, last + 1))), rate
+            )
+
+    def test_tax_on_gain(self):
+        """IR incide sobre o rendimento já descontado o IOF."""
+        iof, ir = tax_on_gain([1000, 1000, -50, 1000], [10, 400, 400, 10],
+                              [False, False, False, True])
+        np.testing.assert_allclose(iof, [660, 0, 0, 0])
+        np.testing.assert_allclose(ir, [340 * 0.225, 175, 0, 0])
+
+
+class TestNetScenarioGrid(unittest.TestCase):
+    """Testes para net_scenario_grid."""
+
+    def test_matches_per_lot_loop(self):
+        """Cada célula deve coincidir com a tributação lote a lote."""
+        rates = [12.0, 10.5, 13.0, 0.0]
+        admin = [0.0, 0.0, 1.0, 2.0]
+        custody = [0.2, 0.0, 0.0, 0.0]
+        exempt = [False, True, False, False]
+        horizons = [0, 1, 6, 7, 12, 25, 60, 360]
+        contributions = [0, 500]
+        cube = net_scenario_grid(10000, rates, horizons, contributions,
+                                 admin_fees=admin, custody_fees=custody, tax_exempt=exempt)
+        for r, rate in enumerate(rates):
+            for h, months in enumerate(horizons):
+                for c, contribution in enumerate(contributions):
+                    expected = reference_net(10000, rate, months, contribution,
+                                             admin[r], custody[r], exempt[r])
+                    self.assertAlmostEqual(
+                        cube.final_amount[r, h, c] / expected, 1.0, places=10
+                    )
+
+    def test_decomposition(self):
+        """Bruto = líquido + taxas + IOF + IR."""
+        cube = net_scenario_grid(5000, [11, 14], [3, 24, 120], [0, 200], admin_fees=0.5)
+        gross = scenario_grid(5000, [11, 14], [3, 24, 120], [0, 200])
+        np.testing.assert_allclose(cube.gross_amount, gross.final_amount)
+        np.testing.assert_allclose(
+            cube.gross_amount, cube.final_amount + cube.fees + cube.iof + cube.income_tax
+        )
+        self.assertTrue((cube.fees > 0).all() and (cube.income_tax > 0).all())
+
+    def test_ranking_uses_net_values(self):
+        """Produto isento pode superar outro de taxa bruta maior."""
+        cube = net_scenario_grid(10000, [12.0, 10.5], [24],
+                                 names=['CDB', 'LCI'], tax_exempt=[False, True])
+        self.assertEqual(list(cube.ranking(24)['name']), ['LCI', 'CDB'])
+
+    def test_invalid_fees(self):
+        """Taxas fora de [0, 100) devem gerar erro."""
+        with self.assertRaises(ValueError):
+            net_scenario_grid(1000, [10], [12], admin_fees=-1)
+        with self.assertRaises(ValueError):
+            net_scenario_grid(1000, [10], [12], custody_fees=100)
+
+
+if __name__ == '__main__':
+    unittest.main()